@@ -0,0 +1,60 @@
+"""
+Measures CLI startup latency by running fresh interpreters, the way a shell script would.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 20]
+
+The `--cached list-projects` case requires a built index in the cache directory (run any
+listing command once without `--cached` first); it is skipped otherwise.
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from ossfuzz_kit.cache import get_cache_dir
+
+CASES = {
+    "import": [sys.executable, "-c", "import ossfuzz_kit.cli.main"],
+    "--version": [sys.executable, "-m", "ossfuzz_kit.cli.main", "--version"],
+    "--cached list-projects": [sys.executable, "-m", "ossfuzz_kit.cli.main", "--cached", "list-projects", "--limit", "10"],
+}
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def time_command(command: list[str], runs: int) -> list[float]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ossfuzz-kit CLI startup")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per case")
+    args = parser.parse_args()
+
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+    print(f"{'case':<26} {'median ms':>10} {'p95 ms':>10}")
+    print(f"{'python -c pass':<26} {statistics.median(baseline):>10.1f} {percentile(baseline, 95):>10.1f}")
+
+    for name, command in CASES.items():
+        if name.startswith("--cached") and not (get_cache_dir() / "project-index.sqlite3").exists():
+            print(f"{name:<26} {'skipped (no index)':>21}")
+            continue
+        samples = time_command(command, args.runs)
+        print(f"{name:<26} {statistics.median(samples):>10.1f} {percentile(samples, 95):>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Offline benchmark suite for the hot paths: listing, details lookup, bulk load, sync checks and HTTP fetches.
+
+Every run generates (or reuses) a synthetic repository with the requested number of projects,
+serves the GitHub endpoints from a local stand-in, and runs each case in fresh interpreters:
+
+- cold: a new process with empty on-disk state for the case (no clone for `ensure_repo`, an empty
+  HTTP cache for `fetch_from_url`); the first operation is timed, once per `--runs` process.
+  `fetch_from_url` times every operation, since each one is a cache miss.
+- warm: one process that performs an untimed warm-up operation, then `--iterations` timed ones.
+
+Usage:
+    python benchmarks/run.py --sizes 1000,10000 --output results.json
+    python benchmarks/run.py --sizes 1000 --compare baseline.json
+    python benchmarks/run.py --compare baseline.json results.json
+
+Results are written as JSON with the environment they were measured in; `--compare` matches
+entries on (case, size, phase) and prints the relative change of each metric.
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import resource
+import statistics
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_WORKDIR = ROOT / "benchmarks" / ".work"
+SCHEMA_VERSION = 1
+
+# name -> (cold ops per process, cap on warm iterations)
+CASES = {
+    "ensure_repo": (1, None),
+    "is_up_to_date": (1, None),
+    "list_all_projects": (1, None),
+    "get_project_info": (1, None),
+    "get_project_info[git]": (1, None),
+    "fetch_from_url": (None, None),
+    "bulk_load": (1, 5),
+}
+
+# ---------------------------------------------------------------------------
+# Child process: runs a single case and prints its samples as JSON.
+# ---------------------------------------------------------------------------
+
+def _sample_names(upstream: Path, count: int, seed: int) -> list[str]:
+    names = sorted(p.name for p in (upstream / "projects").iterdir())
+    return random.Random(seed).sample(names, min(count, len(names)))
+
+def run_child(args) -> dict:
+    from stand_in import install
+    from ossfuzz_kit.utils import get_repo_manager, get_session, fetch_from_url
+    from ossfuzz_kit.config import PROJECT_YAML_URL
+    from ossfuzz_kit.cache import HTTP_CACHE_NAME, get_cache_dir
+
+    os.chdir(args.workdir)
+    install(get_session(), args.stand_in)
+
+    manager = get_repo_manager()
+    manager.repo_url = f"file://{args.upstream}"
+    manager.set_sync_policy("ttl=0s" if args.case in ("ensure_repo", "is_up_to_date") else "offline")
+
+    case = args.case
+    upstream = Path(args.upstream)
+    cold = args.phase == "cold"
+    iterations = args.iterations
+    names = _sample_names(upstream, max(iterations, 1) + 1, args.seed)
+
+    if case == "ensure_repo":
+        def op(i):
+            manager.ensure_repo()
+            return 1
+    elif case == "is_up_to_date":
+        def op(i):
+            if not manager.is_up_to_date():
+                raise RuntimeError("stand-in reported a different head")
+            return 1
+    elif case == "list_all_projects":
+        from ossfuzz_kit.project_info.list_projects import list_all_projects
+
+        def op(i):
+            list_all_projects.cache_clear()
+            return len(list_all_projects(use_fallback=False))
+    elif case.startswith("get_project_info"):
+        from ossfuzz_kit.project_info.project_details import get_project_info
+
+        if case.endswith("[git]"):
+            manager.set_backend("git")
+
+        def op(i):
+            get_project_info(names[i % len(names)], use_fallback=False)
+            return 1
+    elif case == "fetch_from_url":
+        urls = [PROJECT_YAML_URL.format(project=name) for name in names]
+
+        def op(i):
+            fetch_from_url(urls[i % len(urls)], format="text")
+            return 1
+    elif case == "bulk_load":
+        from ossfuzz_kit.project_info.bulk_details import iter_all_project_details
+
+        def op(i):
+            return sum(1 for result in iter_all_project_details() if result.error is None)
+    else:
+        raise ValueError(f"Unknown case: {case}")
+
+    if cold:
+        if case == "fetch_from_url":
+            shutil.rmtree(get_cache_dir() / HTTP_CACHE_NAME, ignore_errors=True)
+        ops = iterations if CASES[case][0] is None else CASES[case][0]
+    else:
+        # Warm-up: clones, primes the HTTP cache and the page cache, spins up the session.
+        for i in range(iterations if case == "fetch_from_url" else 1):
+            op(i)
+        ops = iterations
+
+    samples, items = [], 0
+    for i in range(ops):
+        start = time.perf_counter()
+        items += op(i)
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "samples": samples,
+        "items": items,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "peak_child_rss_kb": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    }
+
+# ---------------------------------------------------------------------------
+# Parent process: prepares fixtures, spawns children, aggregates and compares.
+# ---------------------------------------------------------------------------
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def spawn(case: str, phase: str, workdir: Path, upstream: Path, stand_in: str, iterations: int, seed: int) -> dict:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT / "benchmarks")]),
+        "OSSFUZZ_KIT_CACHE_DIR": str(Path(workdir).resolve() / "data"),
+    }
+    command = [
+        sys.executable, str(Path(__file__).resolve()), "--child", case, "--phase", phase,
+        "--workdir", str(workdir), "--upstream", str(upstream), "--stand-in", stand_in,
+        "--iterations", str(iterations), "--seed", str(seed),
+    ]
+    result = subprocess.run(command, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{case} ({phase}) failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def summarize(case: str, size: int, phase: str, runs: list[dict]) -> dict:
+    samples = [s for run in runs for s in run["samples"]]
+    items = sum(run["items"] for run in runs)
+    total = sum(samples)
+    return {
+        "case": case,
+        "size": size,
+        "phase": phase,
+        "n": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p90_ms": percentile(samples, 90) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "ops_per_s": len(samples) / total if total else None,
+        "items_per_s": items / total if total else None,
+        "peak_rss_mb": max(run["peak_rss_kb"] for run in runs) / 1024,
+        "peak_child_rss_mb": max(run["peak_child_rss_kb"] for run in runs) / 1024,
+    }
+
+def environment() -> dict:
+    try:
+        commit = subprocess.check_output(
+            ["git", "-C", str(ROOT), "describe", "--always", "--dirty"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    try:
+        from importlib.metadata import version
+        package_version = version("ossfuzz-kit")
+    except Exception:
+        package_version = "unknown"
+    return {
+        "schema": SCHEMA_VERSION,
+        "version": package_version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+def run_size(size: int, cases: list[str], args) -> list[dict]:
+    from synthetic import generate_repo, head_commit
+    from stand_in import StandInServer
+
+    workdir = Path(args.workdir)
+    print(f"Preparing synthetic tree with {size} projects...", file=sys.stderr)
+    upstream = generate_repo(workdir / f"upstream-{size}-{args.seed}", size, seed=args.seed)
+    server = StandInServer(upstream, head_commit(upstream)).start()
+
+    shared = workdir / f"run-{size}-{args.seed}"
+    shutil.rmtree(shared, ignore_errors=True)
+    shared.mkdir(parents=True)
+    spawn("ensure_repo", "cold", shared, upstream, server.base_url, 1, args.seed)
+
+    results = []
+    try:
+        for case in cases:
+            cold_runs = []
+            for run in range(args.runs):
+                case_dir = shared
+                if case == "ensure_repo":
+                    case_dir = workdir / f"scratch-{size}"
+                    shutil.rmtree(case_dir, ignore_errors=True)
+                    case_dir.mkdir(parents=True)
+                cold_runs.append(spawn(case, "cold", case_dir, upstream, server.base_url, args.iterations, args.seed + run))
+            results.append(summarize(case, size, "cold", cold_runs))
+
+            iterations = min(args.iterations, CASES[case][1] or args.iterations)
+            warm = spawn(case, "warm", shared, upstream, server.base_url, iterations, args.seed)
+            results.append(summarize(case, size, "warm", [warm]))
+            print_rows(results[-2:])
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir / f"scratch-{size}", ignore_errors=True)
+    return results
+
+HEADER = f"{'case':<24} {'size':>6} {'phase':<5} {'n':>5} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'items/s':>11} {'rss MB':>7}"
+
+def print_rows(rows: list[dict]) -> None:
+    for row in rows:
+        print(
+            f"{row['case']:<24} {row['size']:>6} {row['phase']:<5} {row['n']:>5} {row['p50_ms']:>9.2f} "
+            f"{row['p90_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['items_per_s'] or 0:>11.1f} {row['peak_rss_mb']:>7.1f}"
+        )
+
+def compare(baseline: dict, current: dict) -> None:
+    """
+    Prints the relative change of each metric for entries present in both result files.
+    Latency and memory going up, or throughput going down, are regressions.
+    """
+    old = {(r["case"], r["size"], r["phase"]): r for r in baseline["results"]}
+    print(f"\nBaseline {baseline['meta']['commit']} ({baseline['meta']['timestamp']}) -> current {current['meta']['commit']}")
+    print(f"{'case':<24} {'size':>6} {'phase':<5} {'p50':>18} {'p99':>18} {'items/s':>22} {'rss':>16}")
+
+    def delta(a, b):
+        return f"{(b - a) / a * 100:+6.1f}%" if a else "   n/a"
+
+    for row in current["results"]:
+        key = (row["case"], row["size"], row["phase"])
+        if key not in old:
+            continue
+        base = old[key]
+        print(
+            f"{row['case']:<24} {row['size']:>6} {row['phase']:<5} "
+            f"{row['p50_ms']:>9.2f} {delta(base['p50_ms'], row['p50_ms'])} "
+            f"{row['p99_ms']:>9.2f} {delta(base['p99_ms'], row['p99_ms'])} "
+            f"{row['items_per_s'] or 0:>13.1f} {delta(base['items_per_s'] or 0, row['items_per_s'] or 0)} "
+            f"{row['peak_rss_mb']:>7.1f} {delta(base['peak_rss_mb'], row['peak_rss_mb'])}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the ossfuzz-kit benchmark suite offline")
+    parser.add_argument("--sizes", default="1000", help="Comma-separated project counts, e.g. 1000,10000,50000")
+    parser.add_argument("--cases", default=",".join(CASES), help=f"Comma-separated cases: {', '.join(CASES)}")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per cold measurement")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed operations per warm measurement")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic tree and lookups")
+    parser.add_argument("--workdir", default=str(DEFAULT_WORKDIR), help="Where fixtures and clones are kept")
+    parser.add_argument("--output", "-o", help="Write results as JSON to this file")
+    parser.add_argument("--compare", nargs="+", metavar="FILE",
+                        help="Compare against a baseline file, or compare two result files without running")
+    # Internal: run one case in this process.
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--phase", help=argparse.SUPPRESS)
+    parser.add_argument("--upstream", help=argparse.SUPPRESS)
+    parser.add_argument("--stand-in", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        args.case = args.child
+        print(json.dumps(run_child(args)))
+        return
+
+    if args.compare and len(args.compare) == 2:
+        baseline, current = (json.loads(Path(path).read_text()) for path in args.compare)
+        compare(baseline, current)
+        return
+
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    print(HEADER)
+    results = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        results += run_size(size, cases, args)
+
+    current = {"meta": {**environment(), "args": {k: getattr(args, k) for k in ("sizes", "runs", "iterations", "seed")}},
+               "results": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2))
+    if args.compare:
+        compare(json.loads(Path(args.compare[0]).read_text()), current)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Local HTTP stand-in for the GitHub endpoints ossfuzz-kit talks to, serving a synthetic repository.
+
+Requests are routed to it by mounting `StandInAdapter` on the shared `requests` session, so the
+library's own fetch code (retries, conditional requests, HTTP cache) runs unchanged over loopback.
+"""
+import json
+import hashlib
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from requests.adapters import HTTPAdapter
+
+HOSTS = ("https://api.github.com/", "https://raw.githubusercontent.com/")
+RAW_PREFIX = "/google/oss-fuzz/master/projects/"
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, repo_path: Path, head: str):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.repo_path = Path(repo_path)
+        self.head = head
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._listing: bytes = b""
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def listing(self) -> bytes:
+        # Built once; at 50k projects the tree response is several megabytes, like upstream.
+        if not self._listing:
+            names = sorted(p.name for p in (self.repo_path / "projects").iterdir() if p.is_dir())
+            tree = [{"path": "projects", "type": "tree"}] + [{"path": f"projects/{name}", "type": "tree"} for name in names]
+            self._listing = json.dumps({"sha": self.head, "tree": tree, "truncated": False}).encode("utf-8")
+        return self._listing
+
+    def start(self) -> "StandInServer":
+        threading.Thread(target=self.serve_forever, name="stand-in", daemon=True).start()
+        return self
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, keep-alive connections stall on delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json", etag: str = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", "4999")
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server: StandInServer = self.server
+        with server._lock:
+            server.requests += 1
+        path = urlsplit(self.path).path
+
+        if path.startswith(RAW_PREFIX) and path.endswith("/project.yaml"):
+            yaml_path = server.repo_path / "projects" / path[len(RAW_PREFIX):]
+            if not yaml_path.is_file():
+                return self._send(404, b"404: Not Found", "text/plain")
+            body = yaml_path.read_bytes()
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, etag=etag)
+            return self._send(200, body, "text/plain; charset=utf-8", etag)
+
+        if path.startswith("/repos/") and "/branches/" in path:
+            return self._send(200, json.dumps({"name": path.rsplit("/", 1)[1], "commit": {"sha": server.head}}).encode())
+
+        if path.endswith("/git/trees/master"):
+            body = server.listing()
+            etag = f'"{server.head}"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, etag=etag)
+            return self._send(200, body, etag=etag)
+
+        self._send(404, b'{"message": "Not Found"}')
+
+class StandInAdapter(HTTPAdapter):
+    """
+    Rewrites requests for the GitHub hosts to the stand-in, keeping path and query.
+    """
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.netloc = urlsplit(base_url).netloc
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = urlunsplit(("http", self.netloc, parts.path, parts.query, ""))
+        return super().send(request, **kwargs)
+
+def install(session, base_url: str) -> None:
+    """
+    Routes `session`'s GitHub traffic to the stand-in at `base_url`.
+    """
+    adapter = StandInAdapter(base_url, pool_maxsize=32)
+    for host in HOSTS:
+        session.mount(host, adapter)
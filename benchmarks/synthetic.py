@@ -0,0 +1,84 @@
+"""
+Generates a synthetic OSS-Fuzz-like repository with a configurable number of projects.
+
+Projects are derived deterministically from a seed, so the same `count`/`seed` always yields
+the same tree (and the same commit contents), which keeps results comparable between runs.
+"""
+import random
+import subprocess
+from pathlib import Path
+
+LANGUAGES = ["c", "c++", "rust", "go", "python", "jvm", "swift", "javascript"]
+ENGINES = ["libfuzzer", "afl", "honggfuzz", "centipede"]
+SANITIZERS = ["address", "undefined", "memory"]
+ARCHITECTURES = ["x86_64", "i386", "aarch64"]
+
+def project_name(i: int) -> str:
+    return f"project-{i:05d}"
+
+def project_yaml(rng: random.Random, name: str) -> str:
+    """
+    Renders a `project.yaml` covering the shapes seen upstream: optional fields, mappings
+    inside the sanitizer list and contact lists of varying length.
+    """
+    lines = [
+        f'homepage: "https://{name}.example.org"',
+        f'language: {rng.choice(LANGUAGES)}',
+        f'primary_contact: "maintainer@{name}.example.org"',
+        f'main_repo: "https://git.example.org/{name}.git"',
+    ]
+    if rng.random() < 0.7:
+        lines.append("auto_ccs:")
+        lines += [f'  - "dev{j}@{name}.example.org"' for j in range(rng.randint(1, 4))]
+    if rng.random() < 0.5:
+        lines.append("fuzzing_engines:")
+        lines += [f"  - {engine}" for engine in rng.sample(ENGINES, rng.randint(1, len(ENGINES)))]
+    if rng.random() < 0.6:
+        lines.append("sanitizers:")
+        for sanitizer in rng.sample(SANITIZERS, rng.randint(1, len(SANITIZERS))):
+            if sanitizer == "memory" and rng.random() < 0.5:
+                lines += ["  - memory:", "     experimental: True"]
+            else:
+                lines.append(f"  - {sanitizer}")
+    if rng.random() < 0.2:
+        lines.append("architectures:")
+        lines += [f"  - {arch}" for arch in rng.sample(ARCHITECTURES, rng.randint(1, len(ARCHITECTURES)))]
+    return "\n".join(lines) + "\n"
+
+def generate_repo(path: Path, count: int, seed: int = 0) -> Path:
+    """
+    Creates (or reuses) a git repository at `path` containing `count` projects, each with a
+    `project.yaml`, `Dockerfile` and `build.sh`, plus an `infra/` directory outside the sparse checkout.
+
+    Returns:
+        Path to the repository.
+    """
+    path = Path(path)
+    marker = path / ".git" / "synthetic"
+    if marker.exists() and marker.read_text() == f"{count}:{seed}":
+        return path
+
+    rng = random.Random(seed)
+    for i in range(count):
+        name = project_name(i)
+        project_dir = path / "projects" / name
+        project_dir.mkdir(parents=True, exist_ok=True)
+        (project_dir / "project.yaml").write_text(project_yaml(rng, name))
+        (project_dir / "Dockerfile").write_text(
+            f"FROM gcr.io/oss-fuzz-base/base-builder\nRUN git clone --depth 1 https://git.example.org/{name}.git\n"
+            f"WORKDIR {name}\nCOPY build.sh $SRC/\n"
+        )
+        (project_dir / "build.sh").write_text(f"#!/bin/bash -eu\n./configure\nmake -j$(nproc)\ncp fuzz_{i} $OUT/\n")
+    (path / "infra").mkdir(exist_ok=True)
+    (path / "infra" / "README.md").write_text("Synthetic infra directory.\n")
+
+    git = ["git", "-C", str(path), "-c", "user.name=bench", "-c", "user.email=bench@example.org"]
+    subprocess.run([*git, "init", "-q", "-b", "master"], check=True)
+    subprocess.run([*git, "config", "uploadpack.allowFilter", "true"], check=True)
+    subprocess.run([*git, "add", "-A"], check=True)
+    subprocess.run([*git, "commit", "-qm", f"Synthetic tree with {count} projects", "--allow-empty"], check=True)
+    marker.write_text(f"{count}:{seed}")
+    return path
+
+def head_commit(path: Path) -> str:
+    return subprocess.check_output(["git", "-C", str(path), "rev-parse", "HEAD"], text=True).strip()
@@ -1,3 +1,12 @@
-from .client import OSSFuzzClient
+# The clients pull in requests, yaml and git helpers, so they are imported on first access
+# to keep `import ossfuzz_kit.cli.main` (and therefore CLI startup) cheap.
+__all__ = ["OSSFuzzClient", "AsyncOSSFuzzClient"]
 
-__all__ = ["OSSFuzzClient"]
\ No newline at end of file
+def __getattr__(name):
+    if name == "OSSFuzzClient":
+        from .client import OSSFuzzClient
+        return OSSFuzzClient
+    if name == "AsyncOSSFuzzClient":
+        from .async_client import AsyncOSSFuzzClient
+        return AsyncOSSFuzzClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
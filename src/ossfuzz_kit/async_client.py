@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from pathlib import Path
+from typing import AsyncIterator, Iterable, Optional
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+from ossfuzz_kit.config import PROJECT_YAML_URL
+from ossfuzz_kit.utils import FetchError, async_fetch_from_url, get_repo_manager
+from ossfuzz_kit.rate_limit import BULK, INTERACTIVE, get_scheduler
+from ossfuzz_kit.cache import set_cache_dir
+from ossfuzz_kit.project_info.list_projects import list_all_projects
+from ossfuzz_kit.project_info.project_details import load_yaml, normalize_project_info
+from ossfuzz_kit.project_info.bulk_details import ProjectResult, load_project_file
+
+logger = logging.getLogger("ossfuzz_kit")
+
+DEFAULT_MAX_IN_FLIGHT = 16
+
+def _resolve_projects_dir() -> Optional[Path]:
+    try:
+        return get_repo_manager().get_projects_dir()
+    except Exception as e:
+        logger.warning(f"Local clone unavailable, using remote fetches only: {e}")
+        return None
+
+class AsyncOSSFuzzClient:
+    """
+    Asyncio counterpart of `OSSFuzzClient` for fetching many projects concurrently.
+
+    Local clone reads and remote fallback fetches run on a bounded worker pool, and at most
+    `max_in_flight` lookups are outstanding at once, so remote latency overlaps instead of adding up.
+
+    Use as an async context manager, or call `aclose()` when done.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_retries: int = 3,
+        github_token: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        clone_dir: Optional[str] = None,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if cache_dir is not None or clone_dir is not None:
+            set_cache_dir(cache_dir, clone_dir)
+        if github_token is not None:
+            get_scheduler().set_token(github_token)
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="ossfuzz-kit")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._projects_dir: Optional[asyncio.Future] = None
+
+    async def __aenter__(self) -> "AsyncOSSFuzzClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running event loop.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        return self._semaphore
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
+    async def get_all_projects(self, use_fallback: bool = True) -> list[str]:
+        """
+        Returns a list of all OSS-Fuzz projects.
+        """
+        return await self._run(list_all_projects, use_fallback=use_fallback)
+
+    async def _fetch_remote(self, project_name: str, raw: bool, priority: str) -> dict:
+        url = PROJECT_YAML_URL.format(project=project_name)
+        try:
+            response = await async_fetch_from_url(
+                url, format="text", max_retries=self.max_retries, executor=self._executor, priority=priority
+            )
+            data = load_yaml(response)
+        except FetchError as e:
+            raise RuntimeError(f"Failed to fetch project.yaml for {project_name}: {e}")
+        except yaml.YAMLError as e:
+            raise RuntimeError(f"Error parsing YAML for {project_name}: {e}")
+        return normalize_project_info(project_name, data, raw=raw)
+
+    async def _local_projects_dir(self) -> Optional[Path]:
+        # Resolved once per client, so a missing clone costs one check rather than one per project.
+        if self._projects_dir is None:
+            self._projects_dir = asyncio.ensure_future(self._run(_resolve_projects_dir))
+        return await self._projects_dir
+
+    async def get_project_details(self, project_name: str, raw: bool = False, use_fallback: bool = True) -> dict:
+        """
+        Fetch metadata for a specific OSS-Fuzz project, falling back to the remote file without blocking the loop.
+        """
+        return await self._get_project_details(project_name, raw, use_fallback, INTERACTIVE)
+
+    async def _get_project_details(self, project_name: str, raw: bool, use_fallback: bool, priority: str) -> dict:
+        projects_dir = await self._local_projects_dir()
+        async with self.semaphore:
+            if projects_dir is not None:
+                result = await self._run(load_project_file, projects_dir / project_name / "project.yaml", raw=raw)
+                if result.error is None:
+                    return result.details
+                logger.warning(f"Failed to load project.yaml from local clone for '{project_name}': {result.error}")
+
+            if not use_fallback:
+                raise RuntimeError(f"Could not load project.yaml for {project_name} from the local clone")
+            logger.debug(f"Fetching project.yaml for '{project_name}' from remote")
+            return await self._fetch_remote(project_name, raw, priority)
+
+    async def iter_project_details(
+        self, project_names: Iterable[str], raw: bool = False, use_fallback: bool = True
+    ) -> AsyncIterator[ProjectResult]:
+        """
+        Fetches many projects concurrently, yielding each result as soon as it completes.
+        Failures are reported through `ProjectResult.error`. Remote fetches run at bulk priority,
+        so they slow down rather than fail near the rate limit and leave room for interactive lookups.
+        """
+        async def fetch(name: str) -> ProjectResult:
+            try:
+                details = await self._get_project_details(name, raw, use_fallback, BULK)
+                return ProjectResult(name, details, None)
+            except Exception as e:
+                return ProjectResult(name, None, f"{type(e).__name__}: {e}")
+
+        tasks = [asyncio.ensure_future(fetch(name)) for name in dict.fromkeys(project_names)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_many_project_details(
+        self, project_names: Iterable[str], raw: bool = False, use_fallback: bool = True
+    ) -> list[ProjectResult]:
+        """
+        Fetches many projects concurrently and returns their results in input order.
+        """
+        project_names = list(dict.fromkeys(project_names))
+        results = {r.name: r async for r in self.iter_project_details(project_names, raw=raw, use_fallback=use_fallback)}
+        return [results[name] for name in project_names]
@@ -0,0 +1,309 @@
+import os
+import sys
+import shutil
+import logging
+from contextlib import nullcontext
+from pathlib import Path
+from datetime import timedelta
+from typing import Any, Optional, Union
+
+from ossfuzz_kit import config
+
+logger = logging.getLogger("ossfuzz_kit")
+
+CLONE_NAME = "oss-fuzz"
+HTTP_CACHE_NAME = "http-cache"
+_SEED_PREFIX = ".seed-"
+
+def _resolve_cache_dir() -> tuple[Path, str]:
+    if config.CACHE_DIR:
+        return Path(config.CACHE_DIR).expanduser(), "config"
+    if os.environ.get(config.CACHE_DIR_ENV_VAR):
+        return Path(os.environ[config.CACHE_DIR_ENV_VAR]).expanduser(), config.CACHE_DIR_ENV_VAR
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    # Relative XDG paths are invalid and must be ignored.
+    if xdg_cache and os.path.isabs(xdg_cache):
+        return Path(xdg_cache) / "ossfuzz-kit", "XDG_CACHE_HOME"
+    return Path.home() / ".cache" / "ossfuzz-kit", "default"
+
+def get_cache_dir() -> Path:
+    """
+    Returns the directory holding the clone, indexes and cached responses: `config.CACHE_DIR`,
+    then `$OSSFUZZ_KIT_CACHE_DIR`, then `$XDG_CACHE_HOME/ossfuzz-kit`, then `~/.cache/ossfuzz-kit`.
+    """
+    return _resolve_cache_dir()[0]
+
+def get_clone_dir() -> Path:
+    """
+    Returns the OSS-Fuzz clone to use: `config.CLONE_DIR`, then `$OSSFUZZ_KIT_CLONE_DIR`,
+    then `<cache dir>/oss-fuzz`.
+    """
+    if config.CLONE_DIR:
+        return Path(config.CLONE_DIR).expanduser()
+    if os.environ.get(config.CLONE_DIR_ENV_VAR):
+        return Path(os.environ[config.CLONE_DIR_ENV_VAR]).expanduser()
+    return get_cache_dir() / CLONE_NAME
+
+def set_cache_dir(
+    cache_dir: Optional[Union[str, Path]] = None, clone_dir: Optional[Union[str, Path]] = None
+) -> None:
+    """
+    Points this process at another cache directory and/or clone. The shared repo manager,
+    project index, history and HTTP cache follow the change.
+    """
+    if cache_dir is not None:
+        config.CACHE_DIR = str(cache_dir)
+    if clone_dir is not None:
+        config.CLONE_DIR = str(clone_dir)
+    _reset_instances()
+
+def _reset_instances() -> None:
+    # Only modules already loaded hold instances; importing the others here would slow down the CLI.
+    utils = sys.modules.get("ossfuzz_kit.utils")
+    if utils is not None and utils._repo_instance is not None:
+        utils._repo_instance.set_clone_path(get_clone_dir())
+
+    for module_name, attr in (
+        ("ossfuzz_kit.project_info.index", "_index_instance"),
+        ("ossfuzz_kit.project_info.history", "_history_instance"),
+        ("ossfuzz_kit.project_info.build_files", "_build_index_instance"),
+        ("ossfuzz_kit.crashes.store", "_crash_store_instance"),
+    ):
+        module = sys.modules.get(module_name)
+        instance = getattr(module, attr, None)
+        if instance is not None:
+            instance.close()
+            setattr(module, attr, None)
+
+    http_cache = sys.modules.get("ossfuzz_kit.http_cache")
+    if http_cache is not None:
+        http_cache._cache_instance = None
+
+def _disk_usage(path: Path) -> int:
+    # Apparent size of everything under `path`; symlinks are counted, never followed.
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return 0
+    if not os.path.isdir(path) or os.path.islink(path):
+        return st.st_size
+
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files + [d for d in dirs if os.path.islink(os.path.join(root, d))]:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+def _is_within(path: Path, directory: Path) -> bool:
+    try:
+        Path(path).resolve().relative_to(Path(directory).resolve())
+        return True
+    except ValueError:
+        return False
+
+def _remove(path: Path) -> None:
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        Path(path).unlink(missing_ok=True)
+
+def cache_info() -> dict[str, Any]:
+    """
+    Describes the cache: where it is and why, the clone in use, and the space taken by each entry.
+
+    Returns:
+        A dict with `cache_dir`, `source` (what chose the location), `clone_dir`, `clone_shared`
+        (the clone lives outside the cache directory), `clone_read_only`, `commit` (of the current
+        checkout, or None), `entries` (name to bytes) and `total_bytes`.
+    """
+    from ossfuzz_kit.utils import get_repo_manager
+
+    cache_dir, source = _resolve_cache_dir()
+    manager = get_repo_manager()
+    entries = {}
+    if cache_dir.is_dir():
+        entries = {path.name: _disk_usage(path) for path in sorted(cache_dir.iterdir())}
+
+    shared = not _is_within(manager.clone_path, cache_dir)
+    if shared:
+        for path in (manager.clone_path, manager.trees_path):
+            if path.exists():
+                entries[str(path)] = _disk_usage(path)
+
+    commit = None
+    if manager.clone_path.exists():
+        try:
+            commit = manager.head_commit()
+        except Exception as e:
+            logger.debug(f"Could not read the commit of {manager.clone_path}: {e}")
+
+    return {
+        "cache_dir": str(cache_dir),
+        "source": source,
+        "clone_dir": str(manager.clone_path),
+        "clone_shared": shared,
+        "clone_read_only": manager.read_only,
+        "commit": commit,
+        "entries": entries,
+        "total_bytes": sum(entries.values()),
+    }
+
+def prune_cache(older_than: Optional[timedelta] = None) -> int:
+    """
+    Frees space without losing anything the next run needs: cached HTTP responses unused for
+    `older_than` (default `config.CACHE_PRUNE_AFTER` seconds), leftovers of interrupted clones and
+    seeds, snapshots other than the current one, and git objects no longer reachable.
+    A clone this process cannot write to is left alone.
+
+    Returns:
+        Number of bytes freed.
+    """
+    from ossfuzz_kit.http_cache import get_http_cache
+    from ossfuzz_kit.utils import get_repo_manager
+
+    cache_dir = get_cache_dir()
+    if not cache_dir.exists():
+        return 0
+    if older_than is None:
+        older_than = timedelta(seconds=config.CACHE_PRUNE_AFTER)
+
+    manager = get_repo_manager()
+    paths = [cache_dir] + ([] if _is_within(manager.clone_path, cache_dir) else [manager.clone_path, manager.trees_path])
+    before = sum(_disk_usage(path) for path in paths)
+
+    removed = get_http_cache().prune(older_than)
+    logger.info(f"Removed {removed} cached HTTP responses unused for {older_than}")
+
+    if manager.clone_path.exists() and not manager.read_only:
+        with manager.repo_lock:
+            # Seeds run under the lock, so any left over now belongs to an interrupted run.
+            for path in cache_dir.glob(f"{_SEED_PREFIX}*"):
+                shutil.rmtree(path, ignore_errors=True)
+            manager.compact()
+
+    return max(0, before - sum(_disk_usage(path) for path in paths))
+
+def clear_cache() -> int:
+    """
+    Removes everything in the cache directory. A clone configured outside of it is kept.
+
+    Returns:
+        Number of bytes freed.
+    """
+    from ossfuzz_kit.utils import get_repo_manager
+
+    cache_dir = get_cache_dir()
+    if not cache_dir.exists():
+        return 0
+
+    manager = get_repo_manager()
+    # Only a clone inside the cache directory is removed, so only then wait for its syncs.
+    lock = manager.repo_lock if _is_within(manager.clone_path, cache_dir) else nullcontext()
+    freed = 0
+    with lock:
+        for path in cache_dir.iterdir():
+            # Lock files stay: other processes may be waiting on them.
+            if path.suffix == ".lock":
+                continue
+            freed += _disk_usage(path)
+            _remove(path)
+    _reset_instances()
+    return freed
+
+def _extract(tar, destination: Path) -> None:
+    import tarfile
+
+    if hasattr(tarfile, "data_filter"):
+        tar.extractall(destination, filter="data")
+        return
+
+    # Python without extraction filters: reject anything that could land outside `destination`.
+    root = destination.resolve()
+    for member in tar.getmembers():
+        target = (root / member.name).resolve()
+        unsafe = (
+            target != root and root not in target.parents
+            or member.isdev()
+            or (member.issym() or member.islnk()) and os.path.isabs(member.linkname)
+            or (member.issym() or member.islnk()) and ".." in Path(member.linkname).parts
+        )
+        if unsafe:
+            raise RuntimeError(f"Refusing to extract {member.name}: it points outside the cache")
+    tar.extractall(destination)
+
+def seed_cache(tarball: Union[str, Path], force: bool = False) -> dict[str, Any]:
+    """
+    Fills the cache from a tarball, so nodes without network access can skip cloning.
+
+    The tarball may hold a copy of a cache directory (as made with
+    `tar -czf seed.tar.gz -C <cache dir> .`) or just an OSS-Fuzz clone. The clone is moved into
+    place and the snapshot current when the tarball was made is checked out again; indexes,
+    history and cached responses found next to it are installed as well.
+
+    Args:
+        tarball: Path of the tarball; any compression `tarfile` understands.
+        force: Replace an existing clone instead of failing.
+
+    Returns:
+        A dict with the checked-out `commit` and the `installed` entries.
+    """
+    import tarfile
+    from ossfuzz_kit.utils import get_repo_manager
+    from ossfuzz_kit.project_info.index import INDEX_FILENAME
+    from ossfuzz_kit.project_info.history import HISTORY_FILENAME
+
+    cache_dir = get_cache_dir()
+    manager = get_repo_manager()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    with manager.repo_lock:
+        if manager.clone_path.exists() and not force:
+            raise RuntimeError(f"{manager.clone_path} already exists; use --force to replace it")
+
+        staging = cache_dir / f"{_SEED_PREFIX}{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        try:
+            try:
+                with tarfile.open(tarball, "r:*") as tar:
+                    _extract(tar, staging)
+            except (OSError, tarfile.TarError) as e:
+                raise RuntimeError(f"Could not unpack {tarball}: {e}")
+
+            root = staging
+            entries = list(staging.iterdir())
+            if len(entries) == 1 and entries[0].is_dir() and entries[0].name != CLONE_NAME:
+                root = entries[0]
+
+            if (root / CLONE_NAME / ".git").exists():
+                clone = root / CLONE_NAME
+            elif (root / ".git").exists():
+                clone = root
+            else:
+                raise RuntimeError(f"{tarball} does not contain an OSS-Fuzz clone")
+
+            try:
+                commit = os.readlink(root / f"{CLONE_NAME}-trees" / "current")
+            except OSError:
+                commit = None
+
+            head = manager.install_clone(clone, commit=commit, replace=force)
+            installed = [CLONE_NAME]
+
+            if clone != root:
+                for name in (INDEX_FILENAME, HISTORY_FILENAME, HTTP_CACHE_NAME):
+                    if (root / name).exists():
+                        target = cache_dir / name
+                        if os.path.lexists(target):
+                            _remove(target)
+                        shutil.move(str(root / name), str(target))
+                        installed.append(name)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    _reset_instances()
+    logger.info(f"Seeded {cache_dir} from {tarball} at {head[:12]}")
+    return {"commit": head, "installed": installed}
@@ -0,0 +1,62 @@
+import json
+import logging
+
+from ossfuzz_kit.cli.commands.project_info import cli_handler, BOLD, CYAN, GREEN, RESET, YELLOW
+
+logger = logging.getLogger("ossfuzz_kit")
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+@cli_handler
+def handle_cache_info(args):
+    """Handles 'cache info' CLI commands"""
+    from ossfuzz_kit.cache import cache_info, get_cache_dir
+
+    if args.path:
+        print(get_cache_dir())
+        return
+
+    info = cache_info()
+    if args.json:
+        print(json.dumps(info, indent=2))
+        return
+
+    clone_notes = [note for note, flag in (("shared", info["clone_shared"]), ("read-only", info["clone_read_only"])) if flag]
+    print(f"{BOLD}Cache directory:{RESET} {info['cache_dir']} (from {info['source']})")
+    print(f"{BOLD}Clone:{RESET}           {info['clone_dir']}" + (f" ({', '.join(clone_notes)})" if clone_notes else ""))
+    print(f"{BOLD}Commit:{RESET}          {info['commit'] or f'{YELLOW}not cloned{RESET}'}")
+    print()
+    for name, size in info["entries"].items():
+        print(f"  {name:<40} {format_size(size):>10}")
+    print(f"  {BOLD}{'total':<40} {format_size(info['total_bytes']):>10}{RESET}")
+
+@cli_handler
+def handle_cache_prune(args):
+    """Handles 'cache prune' CLI commands"""
+    from ossfuzz_kit.cache import prune_cache
+
+    print(f"{CYAN}Pruning cache...{RESET}")
+    freed = prune_cache(older_than=args.older_than)
+    print(f"{BOLD}{GREEN}Freed {format_size(freed)}{RESET}")
+
+@cli_handler
+def handle_cache_clear(args):
+    """Handles 'cache clear' CLI commands"""
+    from ossfuzz_kit.cache import clear_cache, get_cache_dir
+
+    print(f"{CYAN}Clearing {get_cache_dir()}...{RESET}")
+    freed = clear_cache()
+    print(f"{BOLD}{GREEN}Freed {format_size(freed)}{RESET}")
+
+@cli_handler
+def handle_cache_seed(args):
+    """Handles 'cache seed' CLI commands"""
+    from ossfuzz_kit.cache import seed_cache
+
+    print(f"{CYAN}Seeding cache from {args.tarball}...{RESET}")
+    result = seed_cache(args.tarball, force=args.force)
+    print(f"{BOLD}{GREEN}Installed {', '.join(result['installed'])} at {result['commit'][:12]}{RESET}")
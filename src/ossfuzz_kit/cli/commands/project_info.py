@@ -2,12 +2,20 @@ import json
 import functools
 import sys
 import logging
-from ossfuzz_kit.client import OSSFuzzClient
-
-client = OSSFuzzClient()
+from urllib.parse import quote
 
 logger = logging.getLogger("ossfuzz_kit")
 
+_client = None
+
+def get_client():
+    """Returns the shared client, importing the library only once a command needs it."""
+    global _client
+    if _client is None:
+        from ossfuzz_kit.client import OSSFuzzClient
+        _client = OSSFuzzClient()
+    return _client
+
 # ANSI color codes
 GREEN = "\033[92m"
 YELLOW = "\033[93m"
@@ -27,12 +35,54 @@ def cli_handler(func):
             sys.exit(1)
     return wrapper
 
+def forward_to_server(args, path: str, params: dict = None):
+    """
+    Answers a lookup from a running `ossfuzz-kit serve` when one is available, skipping the
+    library import and the freshness check. Returns None when the command should run locally:
+    no server, `--no-server`, options only the local path honours, or any error from the server.
+    """
+    if args.no_server or args.cached or args.sync is not None or args.backend is not None:
+        return None
+
+    from ossfuzz_kit.server_client import find_server, call_server, ServerError
+
+    address = find_server()
+    if address is None:
+        return None
+    try:
+        return call_server(address, path, params)
+    except (OSError, ServerError) as e:
+        logger.info(f"Query server at {address} unavailable, answering locally: {e}")
+        return None
+
 @cli_handler
 def handle_list_projects(args):
     """Handles 'list-projects' CLI commands"""
 
     print(f"{CYAN}Fetching OSS-Fuzz projects...{RESET}")
-    projects = client.get_all_projects(use_fallback=not args.no_fallback)
+    filters = {
+        key: value
+        for key, value in {
+            "language__in": args.language,
+            "fuzzing_engines__contains": args.engine,
+            "sanitizers__contains": args.sanitizer,
+            "architectures__contains": args.arch,
+        }.items()
+        if value
+    }
+    forwarded = forward_to_server(args, "/projects", filters)
+    if forwarded is not None:
+        projects = forwarded["projects"]
+    elif args.cached:
+        from ossfuzz_kit.project_info.index import open_cached_index
+        from ossfuzz_kit.project_info.table import ProjectTable
+
+        index = open_cached_index()
+        projects = ProjectTable(index.iter_details()).filter(**filters) if filters else index.names()
+    elif filters:
+        projects = [p["name"] for p in get_client().query(**filters)]
+    else:
+        projects = get_client().get_all_projects(use_fallback=not args.no_fallback)
     limit = args.limit if args.limit is not None else len(projects)
         
     for project in projects[:limit]:
@@ -40,11 +90,218 @@ def handle_list_projects(args):
 
     print(f"\n{BOLD}{GREEN}Total projects listed: {min(limit, len(projects))} / {len(projects)}{RESET}")
 
+def read_project_names(args) -> list[str]:
+    """
+    Collects project names from the command line and `--from-file`, skipping blank lines and `#` comments.
+    """
+    names = list(args.projects)
+    if args.from_file:
+        if args.from_file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.from_file, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        names.extend(line.split("#", 1)[0].strip() for line in lines)
+    return [name for name in names if name]
+
 @cli_handler
 def handle_project_details(args):
     """Handles 'project-details' CLI commands"""
 
-    print(f"{CYAN}Fetching details for project: {args.project}{RESET}")
-    details = client.get_project_details(args.project, raw=args.raw, use_fallback=not args.no_fallback)
+    names = read_project_names(args)
+    if not names:
+        raise RuntimeError("No project names given")
+    if len(names) > 1 or args.from_file:
+        return handle_many_project_details(args, names)
+
+    project = names[0]
+    print(f"{CYAN}Fetching details for project: {project}{RESET}")
+    # Escaped whole, so names holding `/`, `?`, `#` or spaces cannot reach another route.
+    path = f"/projects/{quote(project, safe='')}"
+    details = None if args.at else forward_to_server(args, path, {"raw": 1} if args.raw else None)
+    if details is None and args.cached:
+        from ossfuzz_kit.project_info.index import open_cached_index
+
+        if args.at:
+            raise RuntimeError("--at cannot be answered from the cache")
+        details = open_cached_index().get(project, raw=args.raw)
+        if details is None:
+            raise RuntimeError(f"Project {project} is not in the cached index")
+    elif details is None:
+        details = get_client().get_project_details(project, raw=args.raw, use_fallback=not args.no_fallback, at=args.at)
     formatted = json.dumps(details, indent=2, sort_keys=False)
-    print(formatted)
\ No newline at end of file
+    print(formatted)
+
+def handle_many_project_details(args, names: list[str]):
+    # Results go to stdout as JSON Lines in input order; errors go to stderr so the stream stays parseable.
+    if args.at:
+        raise RuntimeError("--at only supports a single project")
+    print(f"{CYAN}Fetching details for {len(names)} projects...{RESET}", file=sys.stderr)
+
+    if args.cached:
+        from ossfuzz_kit.project_info.index import open_cached_index
+        from ossfuzz_kit.project_info.bulk_details import ProjectResult
+
+        def cached_results():
+            index = open_cached_index()
+            for name in dict.fromkeys(names):
+                details = index.get(name, raw=args.raw)
+                yield ProjectResult(name, details, None if details is not None else f"Project {name} is not in the cached index")
+
+        results = cached_results()
+    else:
+        results = get_client().get_projects_details(names, raw=args.raw, workers=args.workers, use_fallback=not args.no_fallback)
+
+    loaded, failed = 0, 0
+    for result in results:
+        if result.error:
+            failed += 1
+            print(f"{RED}{result.name}:{RESET} {result.error}", file=sys.stderr)
+            continue
+        loaded += 1
+        print(json.dumps(result.details, sort_keys=False), flush=True)
+
+    print(f"\n{BOLD}{GREEN}Loaded {loaded} projects{RESET} ({failed} failed)", file=sys.stderr)
+    if failed:
+        raise RuntimeError(f"{failed} of {loaded + failed} projects could not be loaded")
+
+@cli_handler
+def handle_all_project_details(args):
+    """Handles 'all-project-details' CLI commands"""
+
+    # Results go to stdout as JSON Lines; progress and errors go to stderr so the stream stays parseable.
+    print(f"{CYAN}Loading all OSS-Fuzz projects...{RESET}", file=sys.stderr)
+    loaded, failed = 0, 0
+
+    for result in get_client().get_all_project_details(
+        raw=args.raw, workers=args.workers, use_fallback=not args.no_fallback, remote=args.remote
+    ):
+        if result.error:
+            failed += 1
+            print(f"{RED}{result.name}:{RESET} {result.error}", file=sys.stderr)
+            continue
+        loaded += 1
+        print(json.dumps(result.details, sort_keys=False))
+
+    print(f"\n{BOLD}{GREEN}Loaded {loaded} projects{RESET} ({failed} failed)", file=sys.stderr)
+
+@cli_handler
+def handle_history_changes(args):
+    """Handles 'history-changes' CLI commands"""
+
+    print(f"{CYAN}Scanning history of '{args.field}'...{RESET}", file=sys.stderr)
+    history = get_client().get_history(since=args.since)
+    changes = history.changes(args.field, args.value, since=args.since, until=args.until, removed=args.removed)
+
+    for change in changes:
+        print(json.dumps(change, sort_keys=False))
+
+    print(f"\n{BOLD}{GREEN}Total changes: {len(changes)}{RESET}", file=sys.stderr)
+
+@cli_handler
+def handle_build_info(args):
+    """Handles 'build-info' CLI commands"""
+
+    if args.project:
+        print(json.dumps(get_client().get_build_info(args.project, workers=args.workers), indent=2))
+        return
+
+    if args.repo or args.base_image or args.dep or args.fuzzer:
+        projects = get_client().search_build_info(
+            repo=args.repo, base_image=args.base_image, dependency=args.dep, fuzzer=args.fuzzer, workers=args.workers,
+        )
+        for project in projects:
+            print(project)
+        print(f"\n{BOLD}{GREEN}Matching projects: {len(projects)}{RESET}", file=sys.stderr)
+        return
+
+    count = 0
+    for info in get_client().get_all_build_info(workers=args.workers):
+        print(json.dumps(info))
+        count += 1
+    print(f"\n{BOLD}{GREEN}Projects: {count}{RESET}", file=sys.stderr)
+
+@cli_handler
+def handle_coverage(args):
+    """Handles 'coverage' CLI commands"""
+
+    print(f"{CYAN}Loading coverage for {args.project}...{RESET}", file=sys.stderr)
+    records = get_client().get_coverage(
+        args.project, since=args.since, until=args.until, level=args.level,
+        fetch=not args.no_fetch, workers=args.workers,
+    )
+    for record in records:
+        print(json.dumps(record))
+
+    print(f"\n{BOLD}{GREEN}Coverage records: {len(records)}{RESET}", file=sys.stderr)
+
+@cli_handler
+def handle_watch(args):
+    """Handles 'watch' CLI commands"""
+
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+    print(f"{CYAN}Watching OSS-Fuzz projects every {args.interval}...{RESET}", file=sys.stderr)
+    count = 0
+    try:
+        for event in get_client().watch(
+            interval=args.interval.total_seconds(), fields=fields,
+            since_commit=args.since_commit, max_polls=args.count,
+        ):
+            print(json.dumps(event.to_dict()), flush=True)
+            count += 1
+    except KeyboardInterrupt:
+        pass
+    print(f"\n{BOLD}{GREEN}Events: {count}{RESET}", file=sys.stderr)
+
+@cli_handler
+def handle_crash_stats(args):
+    """Handles 'crash-stats' CLI commands"""
+
+    client = get_client()
+    if args.refresh or args.source:
+        print(f"{CYAN}Ingesting crash records...{RESET}", file=sys.stderr)
+        counts = client.refresh_crashes(args.source, full=args.full)
+        print(
+            f"{GREEN}{counts['added']} new, {counts['updated']} updated, {counts['unchanged']} unchanged{RESET}",
+            file=sys.stderr,
+        )
+
+    filters = {
+        "project": args.project,
+        "sanitizer": args.sanitizer,
+        "engine": args.engine,
+        "language": args.language,
+    }
+    if args.list:
+        records = client.get_crashes(since=args.since, until=args.until, limit=args.limit, **filters)
+        for record in records:
+            print(json.dumps(record))
+        print(f"\n{BOLD}{GREEN}Crashes: {len(records)}{RESET}", file=sys.stderr)
+        return
+
+    group_by = [g.strip() for g in args.by.split(",") if g.strip()]
+    rows = client.crash_stats(group_by, since=args.since, until=args.until, **filters)
+    for row in rows:
+        print(json.dumps(row))
+    print(f"\n{BOLD}{GREEN}Crashes: {sum(row['count'] for row in rows)} in {len(rows)} groups{RESET}", file=sys.stderr)
+
+@cli_handler
+def handle_export(args):
+    """Handles 'export' CLI commands"""
+
+    fields = [f.strip() for f in args.fields.split(",") if f.strip()] if args.fields else None
+    print(f"{CYAN}Exporting OSS-Fuzz projects as {args.format}...{RESET}", file=sys.stderr)
+
+    if args.output and args.output != "-":
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            count = get_client().export(
+                out, format=args.format, fields=fields, raw=args.raw,
+                use_fallback=not args.no_fallback, remote=args.remote,
+            )
+    else:
+        count = get_client().export(
+            sys.stdout, format=args.format, fields=fields, raw=args.raw,
+            use_fallback=not args.no_fallback, remote=args.remote,
+        )
+
+    print(f"\n{BOLD}{GREEN}Exported {count} projects{RESET}", file=sys.stderr)
\ No newline at end of file
@@ -0,0 +1,21 @@
+import logging
+
+from ossfuzz_kit.cli.commands.project_info import cli_handler, CYAN, RESET
+
+logger = logging.getLogger("ossfuzz_kit")
+
+@cli_handler
+def handle_serve(args):
+    """Handles 'serve' CLI commands"""
+    from ossfuzz_kit.server import serve
+    from ossfuzz_kit.sync_policy import SyncPolicy, TTL
+    from ossfuzz_kit.utils import get_repo_manager
+
+    # Without an explicit --sync, check upstream once per refresh rather than per default TTL.
+    if args.sync is None:
+        get_repo_manager().set_sync_policy(SyncPolicy(TTL, interval=args.refresh))
+
+    def on_ready(server):
+        print(f"{CYAN}Serving OSS-Fuzz project queries on {server.address}{RESET}", flush=True)
+
+    serve(host=args.host, port=args.port, socket_path=args.socket, refresh_interval=args.refresh, on_ready=on_ready)
@@ -2,13 +2,36 @@ import argparse
 import sys
 import logging
 
-from importlib.metadata import version, PackageNotFoundError
+from datetime import timedelta
+from importlib import import_module
 
-from ossfuzz_kit.cli.commands.project_info import handle_list_projects, handle_project_details
+from ossfuzz_kit.config import BACKENDS, SERVER_HOST, SERVER_PORT, SERVER_REFRESH_INTERVAL, WATCH_INTERVAL
+from ossfuzz_kit.export import FORMATS
+from ossfuzz_kit.sync_policy import SyncPolicy, parse_duration
 
 logger = logging.getLogger("ossfuzz-kit")
 
+def lazy_handler(module: str, name: str):
+    """
+    Returns a handler that imports `ossfuzz_kit.cli.commands.<module>` only when the command runs,
+    so parsing arguments (and `--version`/`--help`) never pays for the library's heavy imports.
+    """
+    def handler(args):
+        return getattr(import_module(f"ossfuzz_kit.cli.commands.{module}"), name)(args)
+    handler.__name__ = name
+    return handler
+
+class VersionAction(argparse.Action):
+    """
+    Like argparse's `version` action, but resolves the version only when the flag is given.
+    """
+    def __call__(self, parser, namespace, values, option_string=None):
+        parser.exit(message=f"ossfuzz-kit {get_package_version()}\n")
+
 def get_package_version(pkg_name: str = "ossfuzz-kit") -> str:
+    # importlib.metadata costs more to import than the rest of the CLI; only load it for --version.
+    from importlib.metadata import version, PackageNotFoundError
+
     try:
         return version(pkg_name)
     except PackageNotFoundError:
@@ -18,7 +41,7 @@ def get_parser():
     parser = argparse.ArgumentParser(
         description="OSSFuzz-Kit CLI — Interact with OSS-Fuzz"
     )
-    parser.add_argument('--version', action='version', version=f'ossfuzz-kit {get_package_version()}')
+    parser.add_argument('--version', action=VersionAction, nargs=0, help="show program's version number and exit")
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -29,19 +52,172 @@ def get_parser():
         action="store_true",
         help="Disable the Github API as fallback"
     )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a breakdown of time spent per stage, cache hit rates and network counters to stderr"
+    )
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Answer list-projects and project-details from the local index only, without git or network access"
+    )
+    parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Never forward list-projects and project-details to a running 'ossfuzz-kit serve'"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        metavar="DIR",
+        help="Where the clone, indexes and cached responses are kept (default: $OSSFUZZ_KIT_CACHE_DIR, "
+             "then $XDG_CACHE_HOME/ossfuzz-kit)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=None,
+        help="Read project files from the sparse checkout (worktree) or the git object store (git)"
+    )
+    parser.add_argument(
+        "--sync",
+        type=SyncPolicy.parse,
+        default=None,
+        metavar="POLICY",
+        help="When to sync the local clone: offline, ttl=<duration>, background[=<duration>] or pinned=<commit> "
+             "(default: $OSSFUZZ_KIT_SYNC or ttl=10m)"
+    )
 
     subparsers = parser.add_subparsers(dest="command", title="Commands", required=True)
 
     # --- list-projects ---
     list_cmd = subparsers.add_parser("list-projects", help="List all OSS-Fuzz projects")
     list_cmd.add_argument("--limit", type=int, default=None, help="Limit number of projects (default: all)")
-    list_cmd.set_defaults(func=handle_list_projects)
+    list_cmd.add_argument("--language", action="append", help="Only projects written in this language (repeatable: any of)")
+    list_cmd.add_argument("--engine", action="append", help="Only projects fuzzed with this engine (repeatable: all of)")
+    list_cmd.add_argument("--sanitizer", action="append", help="Only projects built with this sanitizer (repeatable: all of)")
+    list_cmd.add_argument("--arch", action="append", help="Only projects built for this architecture (repeatable: all of)")
+    list_cmd.set_defaults(func=lazy_handler("project_info", "handle_list_projects"))
 
     # --- project-details ---
-    details_cmd = subparsers.add_parser("project-details", help="Get detailed info for a project")
-    details_cmd.add_argument("project", help="Name of the OSS-Fuzz project")
+    details_cmd = subparsers.add_parser("project-details", help="Get detailed info for one or more projects")
+    details_cmd.add_argument("projects", nargs="*", metavar="project", help="Names of OSS-Fuzz projects; several are printed as JSON Lines in the order given")
+    details_cmd.add_argument("--from-file", default=None, metavar="FILE", help="Read project names from a file, one per line ('-' for stdin)")
+    details_cmd.add_argument("--workers", type=int, default=None, help="Lookups run at once for several projects (default: 16)")
     details_cmd.add_argument("--raw", action="store_true", help="Return full raw metadata from project.yaml")
-    details_cmd.set_defaults(func=handle_project_details)
+    details_cmd.add_argument("--at", default=None, help="Show the metadata as of a past date or datetime (ISO format)")
+    details_cmd.set_defaults(func=lazy_handler("project_info", "handle_project_details"))
+
+    # --- all-project-details ---
+    all_details_cmd = subparsers.add_parser("all-project-details", help="Stream details for every project as JSON Lines")
+    all_details_cmd.add_argument("--raw", action="store_true", help="Return full raw metadata from project.yaml")
+    all_details_cmd.add_argument("--workers", type=int, default=None, help="Number of parser processes (default: CPU count)")
+    all_details_cmd.add_argument("--remote", action="store_true", help="Stream metadata from one repository archive download instead of the local clone")
+    all_details_cmd.set_defaults(func=lazy_handler("project_info", "handle_all_project_details"))
+
+    # --- export ---
+    export_cmd = subparsers.add_parser("export", help="Stream every project's metadata as JSONL, CSV or columnar row groups")
+    export_cmd.add_argument("--format", choices=FORMATS, default="jsonl", help="Output format (default: jsonl)")
+    export_cmd.add_argument("--fields", default=None, help="Comma-separated fields to include, in order")
+    export_cmd.add_argument("--raw", action="store_true", help="Export full raw metadata from project.yaml")
+    export_cmd.add_argument("--output", "-o", default=None, help="Output file (default: stdout)")
+    export_cmd.add_argument("--remote", action="store_true", help="Stream metadata from one repository archive download instead of the local clone")
+    export_cmd.set_defaults(func=lazy_handler("project_info", "handle_export"))
+
+    # --- history-changes ---
+    history_cmd = subparsers.add_parser("history-changes", help="List changes to a project field over time")
+    history_cmd.add_argument("field", help="Normalized field, e.g. sanitizers, fuzzing_engines, language")
+    history_cmd.add_argument("value", nargs="?", default=None, help="Only changes that added this value")
+    history_cmd.add_argument("--since", default=None, help="Start of the range (ISO date)")
+    history_cmd.add_argument("--until", default=None, help="End of the range, exclusive (ISO date)")
+    history_cmd.add_argument("--removed", action="store_true", help="Match changes that removed the value instead")
+    history_cmd.set_defaults(func=lazy_handler("project_info", "handle_history_changes"))
+
+    # --- build-info ---
+    build_cmd = subparsers.add_parser("build-info", help="Repos, base image, dependencies and fuzzers declared by Dockerfile and build.sh")
+    build_cmd.add_argument("project", nargs="?", default=None, help="Show one project (default: every project, as JSON Lines)")
+    build_cmd.add_argument("--repo", default=None, help="Only list projects that clone this repository URL")
+    build_cmd.add_argument("--base-image", default=None, help="Only list projects built on this base image")
+    build_cmd.add_argument("--dep", default=None, help="Only list projects installing this system or pip package")
+    build_cmd.add_argument("--fuzzer", default=None, help="Only list projects declaring this fuzz target")
+    build_cmd.add_argument("--workers", type=int, default=None, help="Number of extractor processes (default: CPU count)")
+    build_cmd.set_defaults(func=lazy_handler("project_info", "handle_build_info"))
+
+    # --- coverage ---
+    coverage_cmd = subparsers.add_parser("coverage", help="Daily coverage of a project as JSON Lines")
+    coverage_cmd.add_argument("project", help="Name of the OSS-Fuzz project")
+    coverage_cmd.add_argument("--since", default=None, help="First date, ISO format (default: a week ago)")
+    coverage_cmd.add_argument("--until", default=None, help="End of the range, exclusive (default: through today)")
+    coverage_cmd.add_argument("--level", choices=("totals", "files", "functions"), default="totals", help="One record per date, source file or function")
+    coverage_cmd.add_argument("--no-fetch", action="store_true", help="Only read reports already in the local store")
+    coverage_cmd.add_argument("--workers", type=int, default=None, help="Reports downloaded at once (default: 8)")
+    coverage_cmd.set_defaults(func=lazy_handler("project_info", "handle_coverage"))
+
+    # --- crash-stats ---
+    crash_cmd = subparsers.add_parser("crash-stats", help="Crash counts per project, sanitizer, engine or period as JSON Lines")
+    crash_cmd.add_argument("--source", default=None, help="URL of a paginated JSON API or a JSON file to ingest from (default: $OSSFUZZ_KIT_CRASH_SOURCE)")
+    crash_cmd.add_argument("--refresh", action="store_true", help="Ingest new and changed records from the source first")
+    crash_cmd.add_argument("--full", action="store_true", help="With --refresh, ask the source for every record rather than only newer ones")
+    crash_cmd.add_argument(
+        "--by", default="project",
+        help="Comma-separated groups: project, sanitizer, engine, day, week, month, language, build_system (default: project)"
+    )
+    crash_cmd.add_argument("--since", default=None, help="Start of the range: an ISO date or a duration before now, e.g. 90d")
+    crash_cmd.add_argument("--until", default=None, help="End of the range, exclusive: an ISO date or a duration before now")
+    crash_cmd.add_argument("--project", action="append", default=None, help="Only these projects (repeatable)")
+    crash_cmd.add_argument("--sanitizer", action="append", default=None, help="Only crashes found with these sanitizers, e.g. msan (repeatable)")
+    crash_cmd.add_argument("--engine", action="append", default=None, help="Only crashes found by these fuzzing engines (repeatable)")
+    crash_cmd.add_argument("--language", action="append", default=None, help="Only projects in these languages (repeatable)")
+    crash_cmd.add_argument("--list", action="store_true", help="Print the matching crash records instead of counts")
+    crash_cmd.add_argument("--limit", type=int, default=None, help="With --list, print at most this many records")
+    crash_cmd.set_defaults(func=lazy_handler("project_info", "handle_crash_stats"))
+
+    # --- watch ---
+    watch_cmd = subparsers.add_parser("watch", help="Stream project additions, removals and field changes as JSON Lines")
+    watch_cmd.add_argument(
+        "--interval", type=parse_duration, default=timedelta(seconds=WATCH_INTERVAL), metavar="DURATION",
+        help="How often to check upstream, e.g. 10m (default: 5m)"
+    )
+    watch_cmd.add_argument("--fields", default=None, help="Comma-separated fields to report changes of (default: all)")
+    watch_cmd.add_argument("--since-commit", default=None, metavar="SHA", help="First report what changed since this commit")
+    watch_cmd.add_argument("--count", type=int, default=None, metavar="N", help="Stop after N checks")
+    watch_cmd.set_defaults(func=lazy_handler("project_info", "handle_watch"))
+
+    # --- cache ---
+    cache_cmd = subparsers.add_parser("cache", help="Inspect and manage the local cache")
+    cache_subparsers = cache_cmd.add_subparsers(dest="cache_command", title="Cache commands", required=True)
+
+    cache_info_cmd = cache_subparsers.add_parser("info", help="Show where the cache is and how much space it takes")
+    cache_info_cmd.add_argument("--json", action="store_true", help="Print the report as JSON")
+    cache_info_cmd.add_argument("--path", action="store_true", help="Only print the cache directory")
+    cache_info_cmd.set_defaults(func=lazy_handler("cache", "handle_cache_info"))
+
+    cache_prune_cmd = cache_subparsers.add_parser("prune", help="Remove stale responses, snapshots and git objects")
+    cache_prune_cmd.add_argument(
+        "--older-than", type=parse_duration, default=None, metavar="DURATION",
+        help="Remove cached responses unused for this long, e.g. 7d (default: 30d)"
+    )
+    cache_prune_cmd.set_defaults(func=lazy_handler("cache", "handle_cache_prune"))
+
+    cache_clear_cmd = cache_subparsers.add_parser("clear", help="Remove everything in the cache directory")
+    cache_clear_cmd.set_defaults(func=lazy_handler("cache", "handle_cache_clear"))
+
+    cache_seed_cmd = cache_subparsers.add_parser("seed", help="Fill the cache from a tarball, for machines without network access")
+    cache_seed_cmd.add_argument("tarball", help="Tarball of a cache directory or of an OSS-Fuzz clone")
+    cache_seed_cmd.add_argument("--force", action="store_true", help="Replace an existing clone")
+    cache_seed_cmd.set_defaults(func=lazy_handler("cache", "handle_cache_seed"))
+
+    # --- serve ---
+    serve_cmd = subparsers.add_parser("serve", help="Keep the project index in memory and answer queries over HTTP/JSON")
+    serve_cmd.add_argument("--host", default=SERVER_HOST, help=f"Address to listen on (default: {SERVER_HOST})")
+    serve_cmd.add_argument("--port", type=int, default=SERVER_PORT, help=f"Port to listen on (default: {SERVER_PORT})")
+    serve_cmd.add_argument("--socket", default=None, metavar="PATH", help="Listen on a Unix socket instead of a TCP port")
+    serve_cmd.add_argument(
+        "--refresh", type=parse_duration, default=timedelta(seconds=SERVER_REFRESH_INTERVAL), metavar="DURATION",
+        help="How often to sync the clone and reload the index, e.g. 5m (default: 10m)"
+    )
+    serve_cmd.set_defaults(func=lazy_handler("serve", "handle_serve"))
 
     return parser
 
@@ -57,8 +233,30 @@ def main():
         handlers=[logging.StreamHandler()]
     )
 
+    if args.cache_dir is not None:
+        from ossfuzz_kit.cache import set_cache_dir
+
+        set_cache_dir(args.cache_dir)
+
+    if args.sync is not None or args.backend is not None:
+        from ossfuzz_kit.utils import get_repo_manager
+
+        if args.sync is not None:
+            get_repo_manager().set_sync_policy(args.sync)
+        if args.backend is not None:
+            get_repo_manager().set_backend(args.backend)
+
     try:
-        args.func(args)
+        if args.profile:
+            from ossfuzz_kit.metrics import get_metrics
+
+            try:
+                with get_metrics().span("cli.command", command=args.func.__name__):
+                    args.func(args)
+            finally:
+                print(f"\n{get_metrics().format_report()}", file=sys.stderr)
+        else:
+            args.func(args)
     except Exception as e:
         logger.error(f"Command failed: {e}", exc_info=args.verbose)
         sys.exit(1)
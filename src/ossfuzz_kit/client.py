@@ -1,19 +1,485 @@
+import re
+import sys
+import logging
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from ossfuzz_kit.config import LOOKUP_WORKERS
+from ossfuzz_kit.utils import get_repo_manager
+from ossfuzz_kit.cache import set_cache_dir
+from ossfuzz_kit.sync_policy import SyncPolicy
+from ossfuzz_kit.export import export_records
+from ossfuzz_kit.metrics import SpanRecord, get_metrics, timed
+from ossfuzz_kit.rate_limit import get_scheduler
+
 from ossfuzz_kit.project_info.list_projects import list_all_projects
 from ossfuzz_kit.project_info.project_details import get_project_info
+from ossfuzz_kit.project_info.bulk_details import iter_all_project_details, ProjectResult
+from ossfuzz_kit.project_info.remote_bulk import iter_remote_project_details
+from ossfuzz_kit.project_info.index import ProjectIndex, get_fresh_index
+from ossfuzz_kit.project_info.table import ProjectTable
+from ossfuzz_kit.project_info.history import ProjectHistory, Moment, ensure_history
+from ossfuzz_kit.project_info.build_files import get_fresh_build_index
+from ossfuzz_kit.project_info.watch import WatchEvent, watch
+from ossfuzz_kit.coverage.reports import Day, iter_coverage
+from ossfuzz_kit.crashes.stats import Bound, crash_stats, list_crashes, refresh_crashes
+
+logger = logging.getLogger("ossfuzz_kit")
+
+# OSS-Fuzz project directory names; anything else cannot name a project (or escape `projects/`).
+_PROJECT_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._+-]*")
 
 class OSSFuzzClient:
-    def __init__(self):
-        # TODO: Expand for caching, config overrides, etc
-        pass
+    def __init__(
+        self,
+        use_index: bool = True,
+        sync_policy: Optional[Union[SyncPolicy, str]] = None,
+        backend: Optional[str] = None,
+        hooks: Optional[list[Callable[[SpanRecord], None]]] = None,
+        tracer: Any = None,
+        github_token: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        clone_dir: Optional[str] = None,
+        coverage_url: Optional[str] = None,
+        crash_source: Optional[str] = None,
+    ):
+        """
+        Args:
+            use_index: Answer listing and detail lookups from the persistent on-disk project index
+                when a local clone is available.
+            sync_policy: When the local clone is checked against the remote, e.g. `"offline"`,
+                `"ttl=1h"`, `"background"` or `"pinned=<sha>"`. Defaults to the `OSSFUZZ_KIT_SYNC`
+                environment variable, then `ttl=10m`.
+            backend: Where project files are read from: `"worktree"` (the sparse checkout) or
+                `"git"` (the clone's object store, one `git cat-file --batch` process).
+            hooks: Callbacks that receive a `SpanRecord` for every finished stage (git sync,
+                remote check, HTTP fetch, YAML parse, index refresh, ...).
+            tracer: An OpenTelemetry-compatible tracer that should receive a span for every stage.
+            github_token: Token for GitHub API requests. Defaults to `config.GITHUB_TOKEN`, then the
+                `OSSFUZZ_KIT_GITHUB_TOKEN` and `GITHUB_TOKEN` environment variables.
+            cache_dir: Where the clone, indexes and cached responses are kept. Defaults to the
+                `OSSFUZZ_KIT_CACHE_DIR` environment variable, then `$XDG_CACHE_HOME/ossfuzz-kit`.
+                Applies to the whole process.
+            clone_dir: An existing OSS-Fuzz clone to use instead of the one in the cache directory,
+                e.g. one shared by several services. Used read-only if it is not writable.
+            coverage_url: Where daily coverage reports are downloaded from, e.g. a mirror or a local
+                stand-in. Defaults to the `OSSFUZZ_KIT_COVERAGE_URL` environment variable, then
+                the public OSS-Fuzz coverage bucket.
+            crash_source: Where crash and issue records are ingested from: the URL of a paginated
+                JSON API or a local JSON file. Defaults to the `OSSFUZZ_KIT_CRASH_SOURCE`
+                environment variable.
+        """
+        self.use_index = use_index
+        self.coverage_url = coverage_url
+        self.crash_source = crash_source
+        if cache_dir is not None or clone_dir is not None:
+            set_cache_dir(cache_dir, clone_dir)
+        if sync_policy is not None:
+            get_repo_manager().set_sync_policy(sync_policy)
+        if backend is not None:
+            get_repo_manager().set_backend(backend)
+        if github_token is not None:
+            get_scheduler().set_token(github_token)
+        # Registered on the process-wide metrics; close() removes them again.
+        self._hooks = list(hooks or [])
+        self._tracer = tracer
+        for hook in self._hooks:
+            get_metrics().add_hook(hook)
+        if tracer is not None:
+            get_metrics().add_tracer(tracer)
+        self._table: Optional[ProjectTable] = None
+        self._table_commit: Optional[str] = None
+        self._index: Optional[ProjectIndex] = None
+        self._index_checked: Optional[datetime] = None
+        self._index_changes: Any = None
+
+    def __enter__(self) -> "OSSFuzzClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unregisters this client's hooks and tracer from the process-wide metrics.
+        """
+        metrics = get_metrics()
+        for hook in self._hooks:
+            metrics.remove_hook(hook)
+        if self._tracer is not None:
+            metrics.remove_tracer(self._tracer)
+        self._hooks = []
+        self._tracer = None
 
+    def stats(self, reset: bool = False) -> dict[str, Any]:
+        """
+        Returns the instrumentation collected in this process so far: per-stage timers, counters
+        (HTTP requests, retries, errors, bytes received, ...), gauges such as the remaining GitHub
+        rate limit, and hit rates for the HTTP cache and project index.
+
+        Args:
+            reset: Clear the collected data after reading it.
+        """
+        metrics = get_metrics()
+        snapshot = metrics.snapshot()
+        if reset:
+            metrics.reset()
+        return snapshot
+
+    def _fresh_index(self) -> Optional[ProjectIndex]:
+        """
+        The project index, checked against the clone again only when the clone can have moved:
+        after a sync in this process, or once the sync policy's interval has passed.
+        """
+        manager = get_repo_manager()
+        now = datetime.now()
+        if (
+            self._index is None
+            or manager.last_changes is not self._index_changes
+            or now - self._index_checked >= manager.sync_policy.interval
+        ):
+            self._index = get_fresh_index()
+            self._index_changes = manager.last_changes
+            self._index_checked = now
+        return self._index
+
+    @timed("client.get_all_projects")
     def get_all_projects(self, use_fallback: bool = True) -> list[str]:
         """
         Returns a list of all OSS-Fuzz projects.
         """
+        if self.use_index:
+            index = self._fresh_index()
+            if index is not None:
+                return index.names()
         return list_all_projects(use_fallback=use_fallback)
     
-    def get_project_details(self, project_name: str, raw: bool = False, use_fallback: bool = True) -> dict:
+    @timed("client.get_project_details")
+    def get_project_details(
+        self, project_name: str, raw: bool = False, use_fallback: bool = True, at: Optional[Moment] = None
+    ) -> dict:
         """
         Fetch metadata for a specific OSS-Fuzz project.
+
+        With `at` (an ISO date/datetime, `date`, `datetime` or epoch seconds), returns the metadata
+        as of that moment from the history timeline, extending the local history as needed.
+        """
+        if at is not None:
+            details = ensure_history(at).get_at(project_name, at, raw=raw)
+            if details is None:
+                raise RuntimeError(f"Project {project_name} did not exist at {at}")
+            return details
+
+        if self.use_index:
+            index = self._fresh_index()
+            details = index.get(project_name, raw=raw) if index is not None else None
+            if details is not None:
+                return details
+        return get_project_info(project_name=project_name, raw=raw, use_fallback=use_fallback)
+
+    def get_projects_details(
+        self,
+        project_names: Iterable[str],
+        raw: bool = False,
+        workers: Optional[int] = None,
+        use_fallback: bool = True,
+    ) -> Iterator[ProjectResult]:
+        """
+        Looks up several projects at once, yielding one result per distinct name in input order.
+
+        Names are first checked against the project list (the index, or the cached
+        `list_all_projects`), so unknown projects fail fast without a network call. Known
+        projects are answered from the index where possible; the rest are loaded on `workers`
+        threads, with results still yielded in order as soon as each one is ready.
+        Failures are reported through `ProjectResult.error`.
+        """
+        names = list(dict.fromkeys(name.strip() for name in project_names if name and name.strip()))
+        index = self._fresh_index() if self.use_index else None
+        known = set(index.names()) if index is not None else set(list_all_projects(use_fallback=use_fallback))
+
+        pending: list[Union[ProjectResult, Future]] = []
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            for name in names:
+                if not _PROJECT_NAME.fullmatch(name):
+                    pending.append(ProjectResult(name, None, f"ValueError: Invalid project name '{name}'"))
+                    continue
+                if name not in known:
+                    get_metrics().incr("project_info.unknown")
+                    pending.append(ProjectResult(name, None, f"LookupError: Unknown project '{name}'"))
+                    continue
+                details = index.get(name, raw=raw) if index is not None else None
+                if details is not None:
+                    pending.append(ProjectResult(name, details, None))
+                    continue
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=workers or LOOKUP_WORKERS, thread_name_prefix="ossfuzz-kit")
+                pending.append(executor.submit(self._load_project_result, name, raw, use_fallback))
+
+            for entry in pending:
+                yield entry.result() if isinstance(entry, Future) else entry
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _load_project_result(project_name: str, raw: bool, use_fallback: bool) -> ProjectResult:
+        try:
+            return ProjectResult(project_name, get_project_info(project_name, raw=raw, use_fallback=use_fallback), None)
+        except Exception as e:
+            return ProjectResult(project_name, None, f"{type(e).__name__}: {e}")
+
+    def get_all_project_details(
+        self,
+        raw: bool = False,
+        workers: Optional[int] = None,
+        use_fallback: bool = True,
+        remote: bool = False,
+    ) -> Iterator[ProjectResult]:
+        """
+        Stream metadata for every OSS-Fuzz project, parsed in parallel from the local clone.
+        Failed projects are yielded with `error` set instead of aborting the run.
+
+        With `remote=True`, or when the local clone is unavailable and `use_fallback` is set,
+        the metadata is streamed out of a single repository archive download instead.
+        """
+        if not remote:
+            try:
+                manager = get_repo_manager()
+                projects_dir = manager.get_projects_dir()
+                if manager.backend == "git":
+                    return iter_all_project_details(raw=raw, workers=workers, commit=manager.resolve_commit())
+                return iter_all_project_details(raw=raw, workers=workers, projects_dir=projects_dir)
+            except Exception as e:
+                if not use_fallback:
+                    raise RuntimeError(f"Local clone unavailable: {e}") from e
+                logger.warning(f"Local clone unavailable, streaming project metadata from the repository archive: {e}")
+        return iter_remote_project_details(raw=raw)
+
+    def get_project_table(self) -> ProjectTable:
+        """
+        Returns every project as a compact `ProjectTable`, rebuilt only when the project index moves
+        to a new commit. Raw `project.yaml` contents are read from the index when a record asks for them.
+        """
+        index = self._fresh_index()
+        if index is None:
+            raise RuntimeError("The project table requires a local clone of OSS-Fuzz")
+
+        if self._table is None or index.commit is None or index.commit != self._table_commit:
+            self._table = ProjectTable(index.iter_details(), raw_loader=lambda name: index.get(name, raw=True))
+            self._table_commit = index.commit
+        return self._table
+
+    @timed("client.query")
+    def query(self, **filters: Any) -> list[dict]:
+        """
+        Returns metadata for projects matching every filter, e.g.
+        `client.query(language="c++", fuzzing_engines__contains="afl", sanitizers__contains="memory")`.
+        See `parse_filters` for the supported lookups.
+        """
+        return [info.to_dict() for info in self.get_project_table().query(**filters)]
+
+    @timed("client.get_build_info")
+    def get_build_info(self, project_name: str, workers: Optional[int] = None) -> dict:
+        """
+        Returns what a project's `Dockerfile` and `build.sh` declare: `base_image`, cloned `repos`,
+        `build_deps`, `pip_deps`, `fuzzers` and the `fuzzer_sources` kept in OSS-Fuzz.
+
+        Build files of every project are extracted into the build index on first use, in parallel,
+        and afterwards only for projects changed by a sync.
         """
-        return get_project_info(project_name=project_name, raw=raw, use_fallback=use_fallback)
\ No newline at end of file
+        info = get_fresh_build_index(workers=workers).get(project_name)
+        if info is None:
+            raise RuntimeError(f"No build information for project {project_name}")
+        return info
+
+    def get_all_build_info(self, workers: Optional[int] = None) -> Iterator[dict]:
+        """
+        Yields build information for every project, sorted by name.
+        """
+        yield from get_fresh_build_index(workers=workers).iter_details()
+
+    @timed("client.search_build_info")
+    def search_build_info(
+        self,
+        repo: Optional[str] = None,
+        base_image: Optional[str] = None,
+        dependency: Optional[str] = None,
+        fuzzer: Optional[str] = None,
+        workers: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Returns the names of projects whose build files match every given criterion, e.g. the
+        projects cloning `https://github.com/madler/zlib` or installing `libssl-dev`.
+        `dependency` matches system and pip packages.
+        """
+        return get_fresh_build_index(workers=workers).search(
+            repo=repo, base_image=base_image, dependency=dependency, fuzzer=fuzzer,
+        )
+
+    @timed("client.get_coverage")
+    def get_coverage(
+        self,
+        project_name: str,
+        since: Optional[Day] = None,
+        until: Optional[Day] = None,
+        level: str = "totals",
+        fetch: bool = True,
+        workers: Optional[int] = None,
+    ) -> list[dict]:
+        """
+        Returns a project's daily coverage from `since` up to, but not including, `until`
+        (ISO dates, `date` or `datetime`; by default the last week).
+
+        Reports are streamed into a date-partitioned store in the cache directory; only dates not
+        stored yet are downloaded, several in parallel. With `fetch=False` only stored dates are read.
+
+        Args:
+            level: `"totals"` for one record per date, `"files"` or `"functions"` for one per
+                source file or function. Records carry `<kind>_count`, `<kind>_covered` and
+                `<kind>_percent` for lines, functions, regions, branches and instantiations.
+        """
+        if not _PROJECT_NAME.fullmatch(project_name):
+            raise ValueError(f"Invalid project name '{project_name}'")
+        return list(iter_coverage(
+            project_name, since=since, until=until, level=level,
+            fetch=fetch, base_url=self.coverage_url, workers=workers,
+        ))
+
+    def watch(
+        self,
+        interval: Optional[float] = None,
+        fields: Optional[Iterable[str]] = None,
+        since_commit: Optional[str] = None,
+        max_polls: Optional[int] = None,
+    ) -> Iterator[WatchEvent]:
+        """
+        Yields upstream metadata changes as they happen: `added` and `removed` projects, and one
+        `changed` event per field with its old and new value, e.g.
+        `for event in client.watch(interval=600, fields=["sanitizers"]): print(event.to_dict())`.
+
+        Upstream's head is polled every `interval` seconds (default: 5 minutes) and the clone is
+        synced only when it moved. Events come from comparing the blob SHA of every `project.yaml`,
+        so only changed files are parsed.
+
+        Args:
+            fields: The `get_project_info` fields to report changes of (default: all).
+            since_commit: Also report what changed between this commit and the current one.
+            max_polls: Stop after this many polls instead of running until the caller stops.
+        """
+        return watch(interval=interval, fields=fields, since_commit=since_commit, max_polls=max_polls)
+
+    @timed("client.refresh_crashes")
+    def refresh_crashes(self, source: Any = None, full: bool = False) -> dict[str, Any]:
+        """
+        Ingests new and changed crash records into the crash store and updates its aggregates.
+        `source` overrides the client's crash source: a URL, a JSON file or a `CrashSource`.
+
+        Returns:
+            `{"source": ..., "added": n, "updated": n, "unchanged": n, "skipped": n}`.
+        """
+        return refresh_crashes(source or self.crash_source, full=full)
+
+    @timed("client.crash_stats")
+    def crash_stats(
+        self,
+        group_by: Iterable[str] = ("project",),
+        since: Optional[Bound] = None,
+        until: Optional[Bound] = None,
+        refresh: bool = False,
+        **filters: Any,
+    ) -> list[dict]:
+        """
+        Counts stored crashes per group, e.g. MSan crashes in C++ projects over the last 90 days
+        per week: `client.crash_stats(["week"], since="90d", sanitizer="memory", language="c++")`.
+
+        Counts come from a daily rollup kept up to date on ingestion, and project metadata is
+        joined from a copy refreshed with the project index, so no query rescans the records.
+
+        Args:
+            group_by: Any of `project`, `sanitizer`, `engine`, `day`, `week`, `month`,
+                `language` and `build_system`.
+            since: Start of the range: a `Moment`, a `timedelta` or a duration such as `"90d"`
+                before now. Ranges are whole days.
+            refresh: Ingest from the crash source first.
+            **filters: `project`, `sanitizer` and `engine`, and project metadata (`language`,
+                `build_system`, `fuzzing_engines`, `sanitizers`, `architectures`).
+        """
+        if refresh:
+            self.refresh_crashes()
+        return crash_stats(group_by, since=since, until=until, use_index=self.use_index, **filters)
+
+    @timed("client.get_crashes")
+    def get_crashes(
+        self,
+        since: Optional[Bound] = None,
+        until: Optional[Bound] = None,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> list[dict]:
+        """
+        Returns stored crash records, newest first, filtered like `crash_stats()` and also by
+        `crash_type`, `fuzz_target`, `severity` and `status`.
+        """
+        return list_crashes(since=since, until=until, limit=limit, use_index=self.use_index, **filters)
+
+    @timed("client.get_history")
+    def get_history(self, since: Optional[Moment] = None) -> ProjectHistory:
+        """
+        Returns the metadata timeline, built or extended to cover `since` and the current HEAD.
+        Use it for questions such as `get_history("2024-01-01").changes("sanitizers", "memory", since="2024-01-01")`.
+        """
+        return ensure_history(since)
+
+    def iter_project_records(
+        self,
+        raw: bool = False,
+        workers: Optional[int] = None,
+        use_fallback: bool = True,
+        remote: bool = False,
+    ) -> Iterator[dict]:
+        """
+        Lazily yields metadata for every project, from the project index when it is available
+        and otherwise from a bulk load. Projects that fail to load are logged and skipped.
+        """
+        if self.use_index and not remote:
+            index = self._fresh_index()
+            if index is not None:
+                yield from index.iter_details(raw=raw)
+                return
+
+        for result in self.get_all_project_details(raw=raw, workers=workers, use_fallback=use_fallback, remote=remote):
+            if result.error:
+                logger.warning(f"Skipping {result.name}: {result.error}")
+                continue
+            yield result.details
+
+    @timed("client.export")
+    def export(
+        self,
+        out: Optional[TextIO] = None,
+        format: str = "jsonl",
+        fields: Optional[list[str]] = None,
+        raw: bool = False,
+        workers: Optional[int] = None,
+        use_fallback: bool = True,
+        remote: bool = False,
+    ) -> int:
+        """
+        Streams every project's metadata to `out` (default: stdout) as JSONL, CSV or columnar
+        row groups, in constant memory.
+
+        Args:
+            fields: Columns to keep, in order. Required for CSV and columnar output with `raw=True`,
+                since raw `project.yaml` keys vary between projects.
+            raw: Export full `project.yaml` contents instead of the normalized fields.
+
+        Returns:
+            Number of projects written.
+        """
+        if raw and not fields and format != "jsonl":
+            raise ValueError(f"Exporting raw metadata as {format} requires an explicit list of fields")
+
+        records = self.iter_project_records(raw=raw, workers=workers, use_fallback=use_fallback, remote=remote)
+        return export_records(records, out or sys.stdout, format=format, fields=fields)
\ No newline at end of file
@@ -1,10 +1,75 @@
 OSS_FUZZ_REPO_URL = "https://github.com/google/oss-fuzz.git"
 GITHUB_API_URL = "https://api.github.com/repos/google/oss-fuzz/contents/projects"
 GIT_TREE_API_URL = "https://api.github.com/repos/google/oss-fuzz/git/trees/master?recursive=1"
+ARCHIVE_URL = "https://codeload.github.com/google/oss-fuzz/tar.gz/refs/heads/master"
+PROJECT_YAML_URL = "https://raw.githubusercontent.com/google/oss-fuzz/master/projects/{project}/project.yaml"
 
+# Where clones, indexes and cached responses are kept. When unset, the environment variable
+# below is used, then `$XDG_CACHE_HOME/ossfuzz-kit`, then `~/.cache/ossfuzz-kit`.
+CACHE_DIR = None
+CACHE_DIR_ENV_VAR = "OSSFUZZ_KIT_CACHE_DIR"
+# A clone of OSS-Fuzz to use instead of `<cache dir>/oss-fuzz`, e.g. one shared by several users
+# or services. A clone the process cannot write to is used read-only and never synced.
+CLONE_DIR = None
+CLONE_DIR_ENV_VAR = "OSSFUZZ_KIT_CLONE_DIR"
+# Cached HTTP responses not used for this long are removed by `ossfuzz-kit cache prune`.
+CACHE_PRUNE_AFTER = 30 * 86400
+# "worktree" reads project files from the sparse checkout; "git" reads them from the object store.
+BACKENDS = ("worktree", "git")
 CLONE_DEPTH = 1
 DEFAULT_TIMEOUT = 10
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
 DEFAULT_HEADERS = {
     "Accept": "application/vnd.github.v3+json",
     "User-Agent": "ossfuzz-kit"
-}
\ No newline at end of file
+}
+# GitHub token sent to the API hosts below. When unset, the first of the environment
+# variables that is set is used. Authenticated requests get a much larger rate-limit budget.
+GITHUB_TOKEN = None
+GITHUB_TOKEN_ENV_VARS = ("OSSFUZZ_KIT_GITHUB_TOKEN", "GITHUB_TOKEN")
+GITHUB_AUTH_HOSTS = ("api.github.com",)
+
+# Share of the rate-limit budget bulk requests leave for interactive lookups.
+RATE_LIMIT_RESERVE = 0.1
+# Below this share of the budget, bulk requests are spread evenly until the reset.
+RATE_LIMIT_PACE_BELOW = 0.25
+# Longest a request waits for the budget to reset before failing, in seconds.
+RATE_LIMIT_MAX_WAIT = 3600
+# Back-off for throttled responses that carry neither Retry-After nor a reset time.
+RATE_LIMIT_DEFAULT_BACKOFF = 60
+# Throttled responses a single fetch tolerates before giving up.
+RATE_LIMIT_MAX_THROTTLED = 5
+RATE_LIMIT_POLL_INTERVAL = 0.5
+
+# `ossfuzz-kit serve`: where it listens by default and how often it refreshes its index.
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_REFRESH_INTERVAL = 600
+# Address of a running server ("http://host:port" or "unix:/path") the CLI forwards lookups to.
+# When unset, the address a local server advertises in the cache directory is used.
+SERVER_ENV_VAR = "OSSFUZZ_KIT_SERVER"
+SERVER_TIMEOUT = 5
+
+# Lookups run at once by `get_projects_details` when projects are read from the clone or GitHub.
+LOOKUP_WORKERS = 16
+
+# Daily OSS-Fuzz coverage reports, at `<base url>/<COVERAGE_REPORT_PATH>`. When unset, the
+# environment variable below is used, then the public bucket.
+COVERAGE_BASE_URL = None
+COVERAGE_BASE_URL_ENV_VAR = "OSSFUZZ_KIT_COVERAGE_URL"
+DEFAULT_COVERAGE_BASE_URL = "https://storage.googleapis.com/oss-fuzz-coverage"
+COVERAGE_REPORT_PATH = "{project}/reports/{date}/linux/summary.json"
+# Reports downloaded and ingested at once.
+COVERAGE_WORKERS = 8
+# Range queried when no start date is given.
+COVERAGE_DEFAULT_DAYS = 7
+
+# Crash and issue records for `crash-stats`: an http(s) URL of a paginated JSON API or a local
+# JSON / JSON Lines file. When unset, the environment variable below is used.
+CRASH_SOURCE = None
+CRASH_SOURCE_ENV_VAR = "OSSFUZZ_KIT_CRASH_SOURCE"
+CRASH_PAGE_SIZE = 100
+
+# Seconds between upstream checks of `ossfuzz-kit watch`.
+WATCH_INTERVAL = 300
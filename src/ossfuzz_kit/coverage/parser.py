@@ -0,0 +1,200 @@
+import json
+import codecs
+import logging
+from typing import Any, BinaryIO, Iterator, Optional, TextIO, Union
+
+logger = logging.getLogger("ossfuzz_kit")
+
+CHUNK_SIZE = 1 << 16
+# Consumed input is dropped from the buffer once this much has piled up.
+_COMPACT_AFTER = 1 << 20
+
+# Summary entries of an llvm-cov export, flattened to `<kind>_count` and `<kind>_covered` columns.
+SUMMARY_KINDS = ("lines", "functions", "instantiations", "regions", "branches")
+SUMMARY_FIELDS = tuple(f"{kind}_{part}" for kind in SUMMARY_KINDS for part in ("count", "covered"))
+FILE_FIELDS = ("filename",) + SUMMARY_FIELDS
+FUNCTION_FIELDS = ("name", "filename", "count", "regions_count", "regions_covered")
+
+# Index of the execution count and region kind in an llvm-cov region array; kind 0 is a code region.
+_REGION_COUNT = 4
+_REGION_KIND = 7
+_CODE_REGION = 0
+
+class JSONStreamReader:
+    """
+    Walks a JSON document read incrementally from a stream.
+
+    Containers the caller wants to iterate over are entered with `iter_object()` and
+    `iter_array()`; every other value is decoded in one piece with `value()`, at the C
+    decoder's speed. Memory is bounded by the largest value decoded at once rather than the
+    size of the document.
+    """
+
+    def __init__(self, stream: Union[BinaryIO, TextIO], chunk_size: int = CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        if self._eof:
+            return False
+        if self._pos > _COMPACT_AFTER:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        chunk = self._stream.read(size or self._chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def peek(self) -> str:
+        """
+        Returns the next non-whitespace character without consuming it, or "" at the end.
+        """
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' at offset {self._pos}, found {found!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """
+        Decodes and consumes the next complete value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Most likely the value runs past the buffer; read as much again and retry, so
+                # re-decoding a large value stays linear overall.
+                if not self._fill(max(self._chunk_size, len(self._buf) - self._pos)):
+                    raise
+                continue
+            if end == len(self._buf) and not isinstance(value, (dict, list, str)) and self._fill():
+                # A number or literal at the end of the buffer may continue in the next chunk.
+                continue
+            self._pos = end
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Enters an object and yields its keys. After each key the caller must consume the value,
+        with `value()` or by iterating into it.
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self._expect(":")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' at offset {self._pos - 1}, found {separator!r}")
+
+    def iter_array(self) -> Iterator[None]:
+        """
+        Enters an array and yields once per item; the caller must consume each item.
+        """
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {self._pos - 1}, found {separator!r}")
+
+def flatten_summary(summary: dict[str, Any]) -> dict[str, Any]:
+    """
+    Turns an llvm-cov summary (`{"lines": {"count": .., "covered": ..}, ...}`) into flat columns.
+    """
+    record = {}
+    for kind in SUMMARY_KINDS:
+        entry = summary.get(kind) or {}
+        record[f"{kind}_count"] = entry.get("count")
+        record[f"{kind}_covered"] = entry.get("covered")
+    return record
+
+def function_record(function: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduces an llvm-cov function entry to its execution count and code region coverage.
+    """
+    regions = [r for r in function.get("regions") or [] if len(r) <= _REGION_KIND or r[_REGION_KIND] == _CODE_REGION]
+    filenames = function.get("filenames") or []
+    return {
+        "name": function.get("name"),
+        "filename": filenames[0] if filenames else None,
+        "count": function.get("count"),
+        "regions_count": len(regions),
+        "regions_covered": sum(1 for r in regions if r[_REGION_COUNT] > 0),
+    }
+
+def _iter_export(reader: JSONStreamReader) -> Iterator[tuple[str, dict[str, Any]]]:
+    # One element of the top-level "data" array: {"files": [...], "functions": [...], "totals": {...}}.
+    for key in reader.iter_object():
+        if key == "files":
+            for _ in reader.iter_array():
+                record = {"filename": None}
+                for file_key in reader.iter_object():
+                    if file_key == "filename":
+                        record["filename"] = reader.value()
+                    elif file_key == "summary":
+                        record.update(flatten_summary(reader.value()))
+                    else:
+                        # Segments, branches and expansions of full exports: decoded and dropped.
+                        reader.value()
+                yield "file", record
+        elif key == "functions":
+            for _ in reader.iter_array():
+                yield "function", function_record(reader.value())
+        elif key == "totals":
+            yield "totals", flatten_summary(reader.value())
+        else:
+            reader.value()
+
+def iter_coverage_records(
+    stream: Union[BinaryIO, TextIO], chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Streams the records of an llvm-cov JSON export (`llvm-cov export`, or the `summary.json`
+    OSS-Fuzz publishes with `-summary-only`) without loading the document.
+
+    Yields:
+        `("file", record)` per source file with the `FILE_FIELDS` columns, `("function", record)`
+        per function with the `FUNCTION_FIELDS` columns (full exports only), and one
+        `("totals", record)` with the `SUMMARY_FIELDS` columns per export.
+    """
+    reader = JSONStreamReader(stream, chunk_size)
+    for key in reader.iter_object():
+        if key == "data":
+            for _ in reader.iter_array():
+                yield from _iter_export(reader)
+        else:
+            reader.value()
@@ -0,0 +1,170 @@
+import os
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterator, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ossfuzz_kit import config
+from ossfuzz_kit.utils import FetchError, stream_from_url
+from ossfuzz_kit.rate_limit import BULK
+from ossfuzz_kit.metrics import get_metrics
+from ossfuzz_kit.coverage.parser import iter_coverage_records
+from ossfuzz_kit.coverage.store import LEVELS, CoverageStore
+
+logger = logging.getLogger("ossfuzz_kit")
+
+REPORT_HEADERS = {"User-Agent": "ossfuzz-kit", "Accept": "application/json"}
+# Reports are published a day or so late; a date this recent without one is retried later.
+_PUBLISH_DELAY = timedelta(days=2)
+
+Day = Union[str, date, datetime]
+
+def to_date(day: Day) -> date:
+    """
+    Converts an ISO date or datetime string, `date` or `datetime` to a `date`.
+    """
+    if isinstance(day, datetime):
+        return day.date()
+    if isinstance(day, date):
+        return day
+    return datetime.fromisoformat(day).date()
+
+def today() -> date:
+    return datetime.now(timezone.utc).date()
+
+def get_coverage_base_url(base_url: Optional[str] = None) -> str:
+    """
+    Returns where coverage reports are downloaded from: `base_url`, `config.COVERAGE_BASE_URL`,
+    the `OSSFUZZ_KIT_COVERAGE_URL` environment variable, then the public OSS-Fuzz bucket.
+    """
+    url = base_url or config.COVERAGE_BASE_URL or os.environ.get(config.COVERAGE_BASE_URL_ENV_VAR) or config.DEFAULT_COVERAGE_BASE_URL
+    return url.rstrip("/")
+
+def report_url(project: str, day: date, base_url: Optional[str] = None) -> str:
+    path = config.COVERAGE_REPORT_PATH.format(project=project, date=day.strftime("%Y%m%d"))
+    return f"{get_coverage_base_url(base_url)}/{path}"
+
+def date_range(since: date, until: date) -> list[date]:
+    """
+    Returns every date from `since` up to, but not including, `until`.
+    """
+    return [since + timedelta(days=i) for i in range((until - since).days)]
+
+def ingest_report(project: str, day: date, store: CoverageStore, base_url: Optional[str] = None) -> Optional[dict[str, Any]]:
+    """
+    Downloads one day's report and streams it into the store.
+
+    Returns:
+        The report's totals, or None if no report was published for the date.
+    """
+    url = report_url(project, day, base_url)
+    with get_metrics().span("coverage.ingest", project=project, date=day.isoformat()):
+        try:
+            with stream_from_url(url, headers=REPORT_HEADERS, timeout=60, priority=BULK) as body:
+                totals = store.write(project, day, iter_coverage_records(body), source=url)
+        except FetchError as e:
+            if e.status_code not in (403, 404):
+                raise
+            # The bucket answers 403 for objects that do not exist.
+            if today() - day >= _PUBLISH_DELAY:
+                store.mark_missing(project, day)
+            logger.info(f"No coverage report for {project} on {day}")
+            return None
+    logger.info(f"Ingested coverage for {project} on {day}: {totals['files_records']} files")
+    return totals
+
+def missing_dates(project: str, days: list[date], store: CoverageStore) -> list[date]:
+    """
+    Returns the dates that are neither stored nor known to have no report.
+    """
+    return [
+        day for day in days
+        if day <= today() and not store.has(project, day) and not store.is_missing(project, day)
+    ]
+
+def ensure_coverage(
+    project: str,
+    days: list[date],
+    store: CoverageStore,
+    base_url: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Fetches and ingests the reports of `days` that are not in the store yet, several at a time.
+
+    Returns:
+        `{"fetched": [...], "unavailable": [...], "errors": {date: message}}` for the dates looked up.
+    """
+    todo = missing_dates(project, days, store)
+    result: dict[str, Any] = {"fetched": [], "unavailable": [], "errors": {}}
+    if not todo:
+        return result
+
+    workers = min(workers or config.COVERAGE_WORKERS, len(todo))
+    logger.info(f"Fetching {len(todo)} coverage reports for {project} with {workers} workers...")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ossfuzz-kit-coverage") as executor:
+        futures = {executor.submit(ingest_report, project, day, store, base_url): day for day in todo}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                totals = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to ingest coverage for {project} on {day}: {e}")
+                result["errors"][day.isoformat()] = str(e)
+                continue
+            result["fetched" if totals is not None else "unavailable"].append(day.isoformat())
+
+    for key in ("fetched", "unavailable"):
+        result[key].sort()
+    return result
+
+def _with_percentages(record: dict[str, Any]) -> dict[str, Any]:
+    for field in list(record):
+        if field.endswith("_covered"):
+            kind = field[:-len("_covered")]
+            count, covered = record.get(f"{kind}_count"), record[field]
+            if count is not None and covered is not None:
+                record[f"{kind}_percent"] = round(100.0 * covered / count, 2) if count else 0.0
+    return record
+
+def iter_coverage(
+    project: str,
+    since: Optional[Day] = None,
+    until: Optional[Day] = None,
+    level: str = "totals",
+    store: Optional[CoverageStore] = None,
+    fetch: bool = True,
+    base_url: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yields a project's coverage from `since` up to, but not including, `until`, date by date.
+
+    Args:
+        since: First date; defaults to `COVERAGE_DEFAULT_DAYS` before `until`.
+        until: End of the range, exclusive; defaults to tomorrow, so today is included.
+        level: `totals` for one record per date, or `files` / `functions` for one per source
+            file or function, each with its `date`.
+        fetch: Download the dates missing from the store first. With False, only what is
+            already stored is read.
+    """
+    if level not in LEVELS:
+        raise ValueError(f"Unknown coverage level '{level}'. Expected one of: {', '.join(LEVELS)}")
+    store = store or CoverageStore()
+    end = to_date(until) if until is not None else today() + timedelta(days=1)
+    start = to_date(since) if since is not None else end - timedelta(days=config.COVERAGE_DEFAULT_DAYS)
+    if start >= end:
+        raise ValueError(f"Empty date range: {start} to {end}")
+
+    days = date_range(start, end)
+    if fetch:
+        ensure_coverage(project, days, store, base_url=base_url, workers=workers)
+
+    for day in days:
+        if not store.has(project, day):
+            continue
+        if level == "totals":
+            yield _with_percentages(store.totals(project, day))
+            continue
+        for record in store.read(project, day, level):
+            yield _with_percentages({"date": day.isoformat(), **record})
@@ -0,0 +1,163 @@
+import os
+import gzip
+import json
+import shutil
+import logging
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from ossfuzz_kit.cache import get_cache_dir
+from ossfuzz_kit.export import ColumnarWriter, read_columnar
+from ossfuzz_kit.coverage.parser import FILE_FIELDS, FUNCTION_FIELDS, SUMMARY_FIELDS
+
+logger = logging.getLogger("ossfuzz_kit")
+
+COVERAGE_DIR_NAME = "coverage"
+LEVELS = ("totals", "files", "functions")
+
+_TOTALS_FILE = "totals.json"
+_COLUMN_FILES = {"files": "files.columns.jsonl.gz", "functions": "functions.columns.jsonl.gz"}
+_COLUMNS = {"files": FILE_FIELDS, "functions": FUNCTION_FIELDS}
+_KIND_LEVEL = {"file": "files", "function": "functions"}
+# Written instead of a partition when no report was published for the date.
+_MISSING_SUFFIX = ".missing"
+
+class CoverageStore:
+    """
+    Local store of ingested coverage reports, partitioned by project and date.
+
+    Each partition is a directory `<project>/<YYYY-MM-DD>/` holding `totals.json` and gzipped
+    columnar row groups (the `export --format columnar` layout) of the per-file and per-function
+    records. Partitions are written to a temporary directory and renamed into place, so a
+    partition that exists is complete, and a query only opens the partitions in its date range.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else get_cache_dir() / COVERAGE_DIR_NAME
+
+    def partition_path(self, project: str, day: date) -> Path:
+        path = self.root / project / day.isoformat()
+        # The project name comes from the caller; it must not lead out of the store.
+        if not path.resolve().is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid project name '{project}'")
+        return path
+
+    def has(self, project: str, day: date) -> bool:
+        return (self.partition_path(project, day) / _TOTALS_FILE).exists()
+
+    def is_missing(self, project: str, day: date) -> bool:
+        """
+        Whether an earlier fetch found no report for the date.
+        """
+        return self.partition_path(project, day).with_suffix(_MISSING_SUFFIX).exists()
+
+    def mark_missing(self, project: str, day: date) -> None:
+        marker = self.partition_path(project, day).with_suffix(_MISSING_SUFFIX)
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+
+    def projects(self) -> list[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir())
+
+    def dates(self, project: str) -> list[date]:
+        """
+        Returns the dates with an ingested report, oldest first.
+        """
+        project_dir = self.root / project
+        if not project_dir.is_dir():
+            return []
+        found = []
+        for path in project_dir.iterdir():
+            try:
+                day = date.fromisoformat(path.name)
+            except ValueError:
+                continue
+            if (path / _TOTALS_FILE).exists():
+                found.append(day)
+        return sorted(found)
+
+    def write(
+        self,
+        project: str,
+        day: date,
+        records: Iterable[tuple[str, dict[str, Any]]],
+        source: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """
+        Stores the records of one report, as yielded by `iter_coverage_records`, streaming them
+        into the partition's column files.
+
+        Returns:
+            The partition's totals.
+        """
+        final = self.partition_path(project, day)
+        final.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{day.isoformat()}-", dir=final.parent))
+        try:
+            outputs, writers = {}, {}
+            totals: dict[str, Any] = {}
+            counts = {f"{level}_records": 0 for level in _COLUMN_FILES}
+            try:
+                for kind, record in records:
+                    if kind == "totals":
+                        totals = record
+                        continue
+                    level = _KIND_LEVEL.get(kind)
+                    if level is None:
+                        continue
+                    if level not in writers:
+                        outputs[level] = gzip.open(staging / _COLUMN_FILES[level], "wt", encoding="utf-8", compresslevel=6)
+                        writers[level] = ColumnarWriter(outputs[level], list(_COLUMNS[level]))
+                    writers[level].write(record)
+                for level, writer in writers.items():
+                    writer.flush()
+                    counts[f"{level}_records"] = writer.count
+            finally:
+                for out in outputs.values():
+                    out.close()
+
+            summary = {
+                "project": project,
+                "date": day.isoformat(),
+                **{field: totals.get(field) for field in SUMMARY_FIELDS},
+                **counts,
+                "source": source,
+            }
+            (staging / _TOTALS_FILE).write_text(json.dumps(summary), encoding="utf-8")
+
+            if final.exists():
+                shutil.rmtree(final)
+            os.rename(staging, final)
+            final.with_suffix(_MISSING_SUFFIX).unlink(missing_ok=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return summary
+
+    def totals(self, project: str, day: date) -> Optional[dict[str, Any]]:
+        path = self.partition_path(project, day) / _TOTALS_FILE
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+
+    def read(self, project: str, day: date, level: str, fields: Optional[list[str]] = None) -> Iterator[dict[str, Any]]:
+        """
+        Yields the `files` or `functions` records of one partition, one row group at a time.
+        """
+        if level not in _COLUMN_FILES:
+            raise ValueError(f"Unknown coverage level '{level}'. Expected one of: {', '.join(_COLUMN_FILES)}")
+        path = self.partition_path(project, day) / _COLUMN_FILES[level]
+        if not path.exists():
+            return
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            yield from read_columnar(f, fields)
+
+    def remove(self, project: str, day: date) -> None:
+        partition = self.partition_path(project, day)
+        shutil.rmtree(partition, ignore_errors=True)
+        partition.with_suffix(_MISSING_SUFFIX).unlink(missing_ok=True)
@@ -0,0 +1,248 @@
+import os
+import json
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ossfuzz_kit import config
+
+logger = logging.getLogger("ossfuzz_kit")
+
+# Columns of a normalized crash record, and the keys each one is read from, in order of preference.
+FIELD_ALIASES = {
+    "id": ("id", "crash_id", "issue_id", "testcase_id", "localId"),
+    "project": ("project", "project_name"),
+    "timestamp": ("timestamp", "crash_time", "reported", "created", "opened", "date"),
+    "sanitizer": ("sanitizer",),
+    "engine": ("engine", "fuzzing_engine"),
+    "crash_type": ("crash_type", "type"),
+    "fuzz_target": ("fuzz_target", "fuzz_target_name", "fuzzer", "target"),
+    "severity": ("severity", "security_severity"),
+    "status": ("status", "state"),
+}
+FIELDS = tuple(FIELD_ALIASES)
+
+# Sanitizer spellings found in job types, labels and reports, by the name project.yaml uses.
+SANITIZER_ALIASES = {
+    "address": ("asan", "addresssanitizer", "address"),
+    "memory": ("msan", "memorysanitizer", "memory"),
+    "undefined": ("ubsan", "undefinedbehaviorsanitizer", "undefined"),
+    "thread": ("tsan", "threadsanitizer", "thread"),
+    "hwaddress": ("hwasan", "hwaddress"),
+    "coverage": ("coverage",),
+    "dataflow": ("dfsan", "dataflow"),
+}
+_SANITIZERS = {alias: name for name, aliases in SANITIZER_ALIASES.items() for alias in aliases}
+ENGINES = ("libfuzzer", "afl", "honggfuzz", "centipede", "none")
+
+# Keys under which paginated APIs commonly return their records.
+RECORD_KEYS = ("records", "crashes", "issues", "testcases", "items", "results")
+
+def normalize_sanitizer(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return None
+    key = str(value).strip().lower().replace(" ", "").replace("-", "")
+    return _SANITIZERS.get(key, key)
+
+def to_epoch(value: Any) -> int:
+    """
+    Converts epoch seconds (or milliseconds) or an ISO date/datetime string to epoch seconds.
+    Naive datetimes are taken as UTC.
+    """
+    if isinstance(value, (int, float)):
+        # Values this large can only be milliseconds.
+        return int(value / 1000) if value > 10**11 else int(value)
+    if isinstance(value, datetime):
+        moment = value
+    else:
+        text = str(value).strip()
+        if text.isdigit():
+            return to_epoch(int(text))
+        moment = datetime.fromisoformat(text[:-1] + "+00:00" if text.endswith("Z") else text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+def normalize_crash(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Maps a crash or issue record from any source onto `FIELDS`.
+
+    An OSS-Fuzz job type such as `libfuzzer_asan_curl` fills in the engine, sanitizer and project
+    when they are not given separately. Records without an id get one derived from their content.
+
+    Raises:
+        ValueError: If the record has no project or timestamp.
+    """
+    crash: dict[str, Any] = {}
+    for field, aliases in FIELD_ALIASES.items():
+        crash[field] = next((record[key] for key in aliases if record.get(key) not in (None, "")), None)
+
+    job_type = record.get("job_type") or record.get("job")
+    if job_type:
+        parts = str(job_type).lower().split("_")
+        if parts[0] in ENGINES:
+            crash["engine"] = crash["engine"] or parts[0]
+            parts = parts[1:]
+        if parts and parts[0] in _SANITIZERS:
+            crash["sanitizer"] = crash["sanitizer"] or parts[0]
+            parts = parts[1:]
+        if parts and not crash["project"]:
+            crash["project"] = "_".join(parts)
+
+    if not crash["project"] or crash["timestamp"] is None:
+        raise ValueError(f"Crash record needs a project and a timestamp: {record}")
+    crash["project"] = str(crash["project"])
+    crash["timestamp"] = to_epoch(crash["timestamp"])
+    crash["sanitizer"] = normalize_sanitizer(crash["sanitizer"])
+    crash["engine"] = str(crash["engine"]).lower() if crash["engine"] else None
+    if crash["id"] is None:
+        content = json.dumps([crash[field] for field in FIELDS[1:]], default=str)
+        crash["id"] = hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+    crash["id"] = str(crash["id"])
+    return crash
+
+class CrashSource(ABC):
+    """
+    Where crash records come from. Subclasses yield raw records; `normalize_crash` maps them.
+    """
+
+    name = "source"
+
+    @abstractmethod
+    def iter_records(self, since: Optional[int] = None) -> Iterator[dict[str, Any]]:
+        """
+        Yields raw crash records, at least those reported at or after `since` (epoch seconds)
+        when given. Sources that cannot filter by time may yield everything.
+        """
+
+class JSONFileSource(CrashSource):
+    """
+    Crash records from a local file: a JSON array, an object holding the array under one of
+    `RECORD_KEYS`, or JSON Lines. Useful as a fixture or for exports from other tools.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.name = str(self.path.resolve())
+
+    def iter_records(self, since: Optional[int] = None) -> Iterator[dict[str, Any]]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            head = f.read(1)
+            while head and head.isspace():
+                head = f.read(1)
+            f.seek(0)
+            if head == "[" or head == "{":
+                try:
+                    document = json.load(f)
+                except json.JSONDecodeError:
+                    document = None
+                if document is not None:
+                    yield from _page_records(document)
+                    return
+                f.seek(0)
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+def _page_records(document: Any) -> Iterable[dict[str, Any]]:
+    if isinstance(document, list):
+        return document
+    if isinstance(document, dict):
+        for key in RECORD_KEYS:
+            if isinstance(document.get(key), list):
+                return document[key]
+    raise ValueError(f"No list of records in response (expected one of: {', '.join(RECORD_KEYS)})")
+
+def _with_params(url: str, params: dict[str, Any]) -> str:
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.update({key: value for key, value in params.items() if value is not None})
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+class HTTPSource(CrashSource):
+    """
+    Crash records from a paginated JSON API, fetched with `fetch_from_url` (so responses are
+    cached, retried and rate limited like every other request).
+
+    Each page holds its records as a list, or under one of `RECORD_KEYS`. The next page is the
+    URL in `next_key` when the body carries one, otherwise the same request with the page token
+    from `token_key` sent as `token_param`. Pagination stops at a page without either.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        since_param: Optional[str] = "since",
+        token_key: str = "nextPageToken",
+        token_param: str = "pageToken",
+        next_key: str = "next",
+        page_size_param: Optional[str] = "pageSize",
+        page_size: int = config.CRASH_PAGE_SIZE,
+        headers: Optional[dict] = None,
+        max_pages: Optional[int] = None,
+    ):
+        self.url = url
+        self.name = url
+        self.since_param = since_param
+        self.token_key = token_key
+        self.token_param = token_param
+        self.next_key = next_key
+        self.page_size_param = page_size_param
+        self.page_size = page_size
+        self.headers = headers or {"Accept": "application/json", "User-Agent": "ossfuzz-kit"}
+        self.max_pages = max_pages
+
+    def iter_records(self, since: Optional[int] = None) -> Iterator[dict[str, Any]]:
+        from ossfuzz_kit.utils import fetch_from_url
+        from ossfuzz_kit.rate_limit import BULK
+
+        params = {}
+        if self.page_size_param:
+            params[self.page_size_param] = self.page_size
+        if since is not None and self.since_param:
+            params[self.since_param] = since
+        url = _with_params(self.url, params)
+
+        pages = 0
+        while url:
+            # Pages past the first change between runs, so they are never served from the HTTP cache.
+            page = fetch_from_url(url, headers=self.headers, format="json", use_cache=False, priority=BULK)
+            pages += 1
+            yield from _page_records(page)
+
+            url = None
+            if isinstance(page, dict):
+                if page.get(self.next_key):
+                    url = page[self.next_key]
+                elif page.get(self.token_key):
+                    url = _with_params(self.url, {**params, self.token_param: page[self.token_key]})
+            if self.max_pages is not None and pages >= self.max_pages:
+                logger.warning(f"Stopping after {pages} pages of {self.url}")
+                break
+
+def get_crash_source_spec(source: Optional[str] = None) -> Optional[str]:
+    """
+    Returns the configured crash source: `source`, `config.CRASH_SOURCE`, then the
+    `OSSFUZZ_KIT_CRASH_SOURCE` environment variable.
+    """
+    return source or config.CRASH_SOURCE or os.environ.get(config.CRASH_SOURCE_ENV_VAR) or None
+
+def open_source(source: Any = None) -> CrashSource:
+    """
+    Returns a `CrashSource` for a source object, an `http(s)://` URL, or the path of a JSON file.
+    """
+    if isinstance(source, CrashSource):
+        return source
+    spec = get_crash_source_spec(source)
+    if spec is None:
+        raise RuntimeError(
+            f"No crash source configured; pass one or set {config.CRASH_SOURCE_ENV_VAR} to a URL or JSON file"
+        )
+    spec = str(spec)
+    if spec.startswith(("http://", "https://")):
+        return HTTPSource(spec)
+    return JSONFileSource(Path(spec[len("file://"):] if spec.startswith("file://") else spec))
@@ -0,0 +1,124 @@
+import re
+import time
+import logging
+from datetime import timedelta
+from typing import Any, Iterable, Optional, Union
+
+from ossfuzz_kit.metrics import get_metrics
+from ossfuzz_kit.sync_policy import parse_duration
+from ossfuzz_kit.project_info.history import Moment, to_timestamp
+from ossfuzz_kit.project_info.query import INDEXED_FIELDS, SCALAR_FIELDS
+from ossfuzz_kit.crashes.sources import CrashSource, open_source
+from ossfuzz_kit.crashes.store import CrashStore, get_crash_store
+
+logger = logging.getLogger("ossfuzz_kit")
+
+# A bound given as a duration ("90d", timedelta) is measured back from now.
+Bound = Union[Moment, timedelta]
+_DURATION = re.compile(r"\d+(\.\d+)?[smhd]?")
+
+def to_bound(value: Optional[Bound]) -> Optional[int]:
+    """
+    Converts a time bound to epoch seconds: a `Moment`, a `timedelta` or a duration such as
+    `"90d"` before now.
+    """
+    if value is None:
+        return None
+    if isinstance(value, timedelta):
+        return int(time.time() - value.total_seconds())
+    if isinstance(value, str) and _DURATION.fullmatch(value.strip().lower()):
+        return int(time.time() - parse_duration(value).total_seconds())
+    return to_timestamp(value)
+
+def refresh_crashes(source: Any = None, store: Optional[CrashStore] = None, full: bool = False) -> dict[str, Any]:
+    """
+    Ingests new and changed crash records from `source` (see `open_source`).
+
+    Sources that can filter by time are asked for records from the newest one ingested earlier
+    onwards; records seen before are recognized by id, so overlaps cost nothing.
+
+    Args:
+        full: Ask the source for everything, not only what is newer than the last refresh.
+
+    Returns:
+        The counts from `CrashStore.add()`, with the `source`.
+    """
+    crash_source: CrashSource = open_source(source)
+    store = store or get_crash_store()
+    since = None if full else store.latest(crash_source.name)
+    with get_metrics().span("crashes.refresh", source=crash_source.name) as span:
+        counts = store.add(crash_source.iter_records(since=since), source=crash_source.name)
+        span.update(counts)
+    logger.info(
+        f"Ingested crashes from {crash_source.name}: {counts['added']} new, {counts['updated']} updated, "
+        f"{counts['unchanged']} unchanged, {counts['skipped']} skipped"
+    )
+    return {"source": crash_source.name, **counts}
+
+def sync_project_metadata(store: CrashStore, use_index: bool = True) -> int:
+    """
+    Brings the metadata joined by `CrashStore.stats()` up to date.
+
+    With a usable project index, every project's metadata is copied whenever the index moved to
+    another commit. Otherwise the projects that crashed but have no metadata yet are looked up
+    with `get_project_info`.
+
+    Returns:
+        Number of projects whose metadata was stored.
+    """
+    from ossfuzz_kit.project_info.index import get_fresh_index
+    from ossfuzz_kit.project_info.project_details import get_project_info
+
+    index = get_fresh_index() if use_index else None
+    if index is not None and index.commit is not None:
+        if store.projects_commit == index.commit:
+            return 0
+        return store.set_projects(index.iter_details(), commit=index.commit)
+
+    records = []
+    for name in store.projects_without_metadata():
+        try:
+            records.append(get_project_info(name))
+        except Exception as e:
+            logger.warning(f"No metadata for crashed project {name}: {e}")
+            # Stored without fields, so the lookup is not repeated on every query.
+            records.append({"name": name})
+    return store.add_projects(records)
+
+def crash_stats(
+    group_by: Iterable[str] = ("project",),
+    since: Optional[Bound] = None,
+    until: Optional[Bound] = None,
+    store: Optional[CrashStore] = None,
+    use_index: bool = True,
+    **filters: Any,
+) -> list[dict[str, Any]]:
+    """
+    Aggregates stored crashes, joining project metadata when grouping or filtering by it.
+    See `CrashStore.stats()` for the groups and filters.
+    """
+    store = store or get_crash_store()
+    group_by = list(group_by)
+    if any(g in SCALAR_FIELDS for g in group_by) or _filters_metadata(filters):
+        sync_project_metadata(store, use_index=use_index)
+    with get_metrics().span("crashes.stats"):
+        return store.stats(group_by, since=to_bound(since), until=to_bound(until), **filters)
+
+def list_crashes(
+    since: Optional[Bound] = None,
+    until: Optional[Bound] = None,
+    limit: Optional[int] = None,
+    store: Optional[CrashStore] = None,
+    use_index: bool = True,
+    **filters: Any,
+) -> list[dict[str, Any]]:
+    """
+    Returns stored crash records, newest first. See `CrashStore.crashes()` for the filters.
+    """
+    store = store or get_crash_store()
+    if _filters_metadata(filters):
+        sync_project_metadata(store, use_index=use_index)
+    return store.crashes(since=to_bound(since), until=to_bound(until), limit=limit, **filters)
+
+def _filters_metadata(filters: dict[str, Any]) -> bool:
+    return any(field in INDEXED_FIELDS and value is not None for field, value in filters.items())
@@ -0,0 +1,385 @@
+import json
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from ossfuzz_kit.cache import get_cache_dir
+from ossfuzz_kit.sqlite_store import SQLiteStore
+from ossfuzz_kit.project_info.query import INDEXED_FIELDS, LIST_FIELDS, SCALAR_FIELDS, _key, field_values
+from ossfuzz_kit.crashes.sources import normalize_crash, normalize_sanitizer
+
+logger = logging.getLogger("ossfuzz_kit")
+
+CRASH_STORE_FILENAME = "crash-stats.sqlite3"
+SCHEMA_VERSION = "1"
+# Records are looked up and written this many at a time while ingesting.
+INGEST_BATCH_SIZE = 500
+
+# Crash columns that can be filtered on, and the dimensions `stats()` can group by.
+CRASH_FILTERS = ("project", "sanitizer", "engine", "crash_type", "fuzz_target", "severity", "status")
+ROLLUP_DIMENSIONS = ("project", "sanitizer", "engine")
+GROUPS = ROLLUP_DIMENSIONS + ("day", "week", "month") + SCALAR_FIELDS
+
+# `day` is an ISO date, so weeks (starting on Monday) and months are computed from it in SQL.
+_TIME_GROUPS = {
+    "day": "r.day",
+    "week": "date(r.day, '-6 days', 'weekday 1')",
+    "month": "substr(r.day, 1, 7)",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS crashes (
+    id TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    sanitizer TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    crash_type TEXT,
+    fuzz_target TEXT,
+    severity TEXT,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS crashes_project_ts ON crashes (project, ts);
+CREATE INDEX IF NOT EXISTS crashes_ts ON crashes (ts);
+CREATE TABLE IF NOT EXISTS rollup (
+    day TEXT NOT NULL,
+    project TEXT NOT NULL,
+    sanitizer TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (day, project, sanitizer, engine)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rollup_project ON rollup (project, day);
+CREATE TABLE IF NOT EXISTS project_values (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS project_values_lookup ON project_values (field, value);
+CREATE INDEX IF NOT EXISTS project_values_name ON project_values (name, field);
+"""
+
+def _day(ts: int) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).date().isoformat()
+
+def _as_list(value: Any) -> list:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    return [value]
+
+def _bucket(crash: dict[str, Any]) -> tuple[str, str, str, str]:
+    # Unknown sanitizers and engines are stored as "" so they take part in the rollup's key.
+    return (_day(crash["timestamp"]), crash["project"], crash["sanitizer"] or "", crash["engine"] or "")
+
+class CrashStore(SQLiteStore):
+    """
+    Persistent SQLite store of crash records and their aggregates.
+
+    Records are keyed by id and indexed by project and time. A daily rollup of crash counts per
+    project, sanitizer and engine is kept up to date as records are added or change, so
+    aggregates over any date range read the rollup instead of rescanning the records. Project
+    metadata is stored as indexed `(field, value)` rows, which lets `stats()` filter and group by
+    language, build system, sanitizers or engines with a join.
+    """
+
+    SCHEMA = _SCHEMA
+    SCHEMA_VERSION = SCHEMA_VERSION
+    TABLES = ("crashes", "rollup", "project_values")
+
+    def __init__(self, db_path: Optional[Path] = None):
+        super().__init__(db_path or get_cache_dir() / CRASH_STORE_FILENAME)
+
+    def latest(self, source: str) -> Optional[int]:
+        """
+        The newest crash timestamp ingested from `source`, where the next refresh resumes.
+        """
+        value = self._get_meta(f"latest:{source}")
+        return int(value) if value is not None else None
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM crashes").fetchone()[0]
+
+    def add(self, records: Iterable[dict[str, Any]], source: Optional[str] = None) -> dict[str, int]:
+        """
+        Inserts or updates crash records and adjusts the rollup by the difference.
+
+        Records are normalized with `normalize_crash`; ones that cannot be are skipped with a
+        warning. A record whose id is already stored with the same content changes nothing.
+
+        Returns:
+            `{"added": n, "updated": n, "unchanged": n, "skipped": n}`.
+        """
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        latest = self.latest(source) if source else None
+        batch: list[dict[str, Any]] = []
+
+        def flush() -> None:
+            nonlocal latest
+            with self.conn:
+                self._add_batch(batch, counts)
+                if source and batch:
+                    newest = max(crash["timestamp"] for crash in batch)
+                    latest = newest if latest is None else max(latest, newest)
+                    self._set_meta(f"latest:{source}", str(latest))
+            batch.clear()
+
+        for record in records:
+            try:
+                batch.append(normalize_crash(record))
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Skipping crash record: {e}")
+                counts["skipped"] += 1
+                continue
+            if len(batch) >= INGEST_BATCH_SIZE:
+                flush()
+        flush()
+        return counts
+
+    def _add_batch(self, batch: list[dict[str, Any]], counts: dict[str, int]) -> None:
+        # The last occurrence of an id within a batch wins, as it would across batches.
+        crashes = {crash["id"]: crash for crash in batch}
+        ids = list(crashes)
+        placeholders = ",".join("?" * len(ids))
+        stored = {
+            row[0]: row[1:]
+            for row in self.conn.execute(
+                f"SELECT id, day, project, sanitizer, engine, data FROM crashes WHERE id IN ({placeholders})", ids
+            )
+        } if ids else {}
+
+        delta: Counter = Counter()
+        rows = []
+        for crash_id, crash in crashes.items():
+            data = json.dumps(crash, sort_keys=True)
+            previous = stored.get(crash_id)
+            if previous is not None:
+                if previous[4] == data:
+                    counts["unchanged"] += 1
+                    continue
+                delta[previous[:4]] -= 1
+                counts["updated"] += 1
+            else:
+                counts["added"] += 1
+            bucket = _bucket(crash)
+            delta[bucket] += 1
+            rows.append((
+                crash_id, crash["project"], crash["timestamp"], bucket[0], bucket[2], bucket[3],
+                crash["crash_type"], crash["fuzz_target"], crash["severity"], crash["status"], data,
+            ))
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO crashes (id, project, ts, day, sanitizer, engine, crash_type, fuzz_target, severity, status, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        changes = [(*bucket, n) for bucket, n in delta.items() if n]
+        self.conn.executemany(
+            "INSERT INTO rollup (day, project, sanitizer, engine, count) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (day, project, sanitizer, engine) DO UPDATE SET count = count + excluded.count",
+            changes,
+        )
+        if any(n < 0 for *_, n in changes):
+            self.conn.execute("DELETE FROM rollup WHERE count <= 0")
+
+    def rebuild_rollup(self) -> None:
+        """
+        Recomputes the rollup from the stored records.
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM rollup")
+            self.conn.execute(
+                "INSERT INTO rollup (day, project, sanitizer, engine, count) "
+                "SELECT day, project, sanitizer, engine, COUNT(*) FROM crashes GROUP BY day, project, sanitizer, engine"
+            )
+
+    @property
+    def projects_commit(self) -> Optional[str]:
+        """
+        The commit of the project index the stored metadata was copied from, if any.
+        """
+        return self._get_meta("projects_commit")
+
+    def set_projects(self, records: Iterable[dict[str, Any]], commit: Optional[str] = None) -> int:
+        """
+        Replaces the stored project metadata with normalized project records.
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM project_values")
+            count = self._insert_projects(records)
+            self._set_meta("projects_commit", commit)
+        return count
+
+    def add_projects(self, records: Iterable[dict[str, Any]]) -> int:
+        """
+        Adds or replaces the metadata of individual projects.
+        """
+        with self.conn:
+            return self._insert_projects(records)
+
+    def _insert_projects(self, records: Iterable[dict[str, Any]]) -> int:
+        count = 0
+        for record in records:
+            name = record.get("name")
+            if not name:
+                continue
+            self.conn.execute("DELETE FROM project_values WHERE name = ?", (name,))
+            rows = [
+                (field, value, name)
+                for field in INDEXED_FIELDS
+                for value in field_values(record, field)
+                if value is not None
+            ]
+            # Projects without any of the fields still get a row, so they are not fetched again.
+            rows.append(("name", _key(name), name))
+            self.conn.executemany("INSERT INTO project_values (field, value, name) VALUES (?, ?, ?)", rows)
+            count += 1
+        return count
+
+    def projects_without_metadata(self) -> list[str]:
+        rows = self.conn.execute(
+            "SELECT DISTINCT project FROM rollup WHERE project NOT IN (SELECT name FROM project_values) ORDER BY project"
+        )
+        return [row[0] for row in rows]
+
+    def _where(
+        self,
+        since: Optional[int],
+        until: Optional[int],
+        filters: dict[str, Any],
+        time_column: str,
+        allowed: tuple[str, ...],
+    ) -> tuple[list[str], list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if since is not None:
+            clauses.append(f"r.{time_column} >= ?")
+            params.append(_day(since) if time_column == "day" else since)
+        if until is not None:
+            clauses.append(f"r.{time_column} < ?")
+            params.append(_day(until) if time_column == "day" else until)
+
+        for field, value in filters.items():
+            if value is None:
+                continue
+            values = _as_list(value)
+            if field in allowed:
+                if field == "sanitizer":
+                    values = [normalize_sanitizer(v) or "" for v in values]
+                elif field == "engine":
+                    values = [str(v).lower() for v in values]
+                clauses.append(f"r.{field} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+            elif field in SCALAR_FIELDS:
+                # Scalar metadata matches any of the values.
+                clauses.append(
+                    f"r.project IN (SELECT name FROM project_values WHERE field = ? AND value IN ({','.join('?' * len(values))}))"
+                )
+                params.extend([field, *(_key(v) for v in values)])
+            elif field in LIST_FIELDS:
+                # List metadata must contain every value.
+                for v in values:
+                    clauses.append("r.project IN (SELECT name FROM project_values WHERE field = ? AND value = ?)")
+                    params.extend([field, _key(v)])
+            else:
+                raise ValueError(
+                    f"Unknown crash filter '{field}'. Expected one of: {', '.join(allowed + INDEXED_FIELDS)}"
+                )
+        return clauses, params
+
+    def stats(
+        self,
+        group_by: Iterable[str] = ("project",),
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Counts crashes per group, from the rollup.
+
+        Args:
+            group_by: Any of `GROUPS`: `project`, `sanitizer`, `engine`, `day`, `week` (the
+                Monday it starts on), `month`, and the project's `language` or `build_system`.
+            since: Only crashes reported on or after this day (epoch seconds).
+            until: Only crashes reported before this day (epoch seconds).
+            **filters: `project`, `sanitizer` or `engine` matching any of the given values, and
+                project metadata: `language` / `build_system` matching any of the given values,
+                `fuzzing_engines` / `sanitizers` / `architectures` containing all of them.
+
+        Returns:
+            One `{<group>: value, ..., "count": n}` per group, by count, or in time order when
+            grouped by time.
+        """
+        group_by = list(group_by)
+        unknown = [g for g in group_by if g not in GROUPS]
+        if unknown:
+            raise ValueError(f"Unknown crash grouping '{unknown[0]}'. Expected any of: {', '.join(GROUPS)}")
+        unsupported = [f for f in filters if f in CRASH_FILTERS and f not in ROLLUP_DIMENSIONS and filters[f] is not None]
+        if unsupported:
+            raise ValueError(f"Crash stats cannot filter on '{unsupported[0]}'; use crashes() instead")
+
+        clauses, params = self._where(since, until, filters, "day", ROLLUP_DIMENSIONS)
+        columns, joins, join_params = [], [], []
+        for i, group in enumerate(group_by):
+            if group in ROLLUP_DIMENSIONS:
+                columns.append(f"NULLIF(r.{group}, '')")
+            elif group in _TIME_GROUPS:
+                columns.append(_TIME_GROUPS[group])
+            else:
+                joins.append(f"LEFT JOIN project_values AS m{i} ON m{i}.name = r.project AND m{i}.field = ?")
+                join_params.append(group)
+                columns.append(f"m{i}.value")
+
+        keys = [f"g{i}" for i in range(len(group_by))]
+        select = ", ".join(f"{column} AS {key}" for column, key in zip(columns, keys))
+        sql = f"SELECT {select + ', ' if select else ''}SUM(r.count) AS total FROM rollup AS r {' '.join(joins)}"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if keys:
+            sql += " GROUP BY " + ", ".join(keys)
+            time_keys = [key for key, group in zip(keys, group_by) if group in _TIME_GROUPS]
+            sql += " ORDER BY " + ", ".join(time_keys + ["total DESC"] + keys if time_keys else ["total DESC"] + keys)
+
+        results = []
+        for row in self.conn.execute(sql, join_params + params):
+            if row[-1] is None:
+                # No grouping and nothing matched.
+                row = (0,)
+            results.append({**dict(zip(group_by, row[:-1])), "count": row[-1]})
+        return results
+
+    def crashes(
+        self,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Returns stored crash records, newest first, filtered like `stats()` plus `crash_type`,
+        `fuzz_target`, `severity` and `status`. `since` and `until` are exact timestamps here.
+        """
+        clauses, params = self._where(since, until, filters, "ts", CRASH_FILTERS)
+        sql = "SELECT data FROM crashes AS r"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY r.ts DESC, r.id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row[0]) for row in self.conn.execute(sql, params)]
+
+_crash_store_instance = None
+
+def get_crash_store() -> CrashStore:
+    global _crash_store_instance
+    if _crash_store_instance is None:
+        _crash_store_instance = CrashStore()
+    return _crash_store_instance
@@ -0,0 +1,145 @@
+import csv
+import json
+import logging
+from typing import Any, Iterable, Optional, TextIO
+
+from ossfuzz_kit.project_info.query import PROJECT_FIELDS
+
+logger = logging.getLogger("ossfuzz_kit")
+
+FORMATS = ("jsonl", "csv", "columnar")
+
+# Column order for normalized records, matching `get_project_info`.
+DEFAULT_FIELDS = PROJECT_FIELDS
+
+DEFAULT_ROW_GROUP_SIZE = 256
+
+def project_record(record: dict[str, Any], fields: Optional[list[str]]) -> dict[str, Any]:
+    """
+    Projects a record onto `fields`, keeping their order. Missing fields become None.
+    """
+    if not fields:
+        return record
+    return {field: record.get(field) for field in fields}
+
+def _csv_value(value: Any) -> Any:
+    # Lists and mappings are JSON-encoded so they survive a round trip through a single cell.
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return value
+
+def write_jsonl(records: Iterable[dict[str, Any]], out: TextIO, fields: Optional[list[str]] = None) -> int:
+    """
+    Writes one JSON object per line.
+    """
+    count = 0
+    for record in records:
+        out.write(json.dumps(project_record(record, fields), default=str))
+        out.write("\n")
+        count += 1
+    return count
+
+def write_csv(records: Iterable[dict[str, Any]], out: TextIO, fields: Optional[list[str]] = None) -> int:
+    """
+    Writes a CSV file with a header row. Columns default to the normalized fields.
+    """
+    fields = list(fields or DEFAULT_FIELDS)
+    writer = csv.DictWriter(out, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow({field: _csv_value(record.get(field)) for field in fields})
+        count += 1
+    return count
+
+class ColumnarWriter:
+    """
+    Writes records pushed one at a time as row groups of the form `{"rows": n, "columns": {field: [values...]}}`,
+    one JSON line per group. Only the current row group is held in memory.
+    """
+
+    def __init__(self, out: TextIO, fields: list[str], row_group_size: int = DEFAULT_ROW_GROUP_SIZE):
+        self.out = out
+        self.fields = list(fields)
+        self.row_group_size = row_group_size
+        self.count = 0
+        self._columns: dict[str, list] = {field: [] for field in self.fields}
+        self._rows = 0
+
+    def write(self, record: dict[str, Any]) -> None:
+        for field in self.fields:
+            self._columns[field].append(record.get(field))
+        self._rows += 1
+        self.count += 1
+        if self._rows >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        self.out.write(json.dumps({"rows": self._rows, "columns": self._columns}, default=str))
+        self.out.write("\n")
+        self._columns = {field: [] for field in self.fields}
+        self._rows = 0
+
+def read_columnar(lines: Iterable[str], fields: Optional[list[str]] = None) -> Iterable[dict[str, Any]]:
+    """
+    Yields the records of columnar row groups written by `write_columnar` or `ColumnarWriter`.
+
+    Args:
+        fields: Only materialize these columns.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        group = json.loads(line)
+        columns = group["columns"]
+        names = [field for field in (fields or columns) if field in columns]
+        for values in zip(*(columns[name] for name in names)):
+            yield dict(zip(names, values))
+
+def write_columnar(
+    records: Iterable[dict[str, Any]],
+    out: TextIO,
+    fields: Optional[list[str]] = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Writes row groups as JSON lines of the form `{"rows": n, "columns": {field: [values...]}}`.
+
+    Only one row group is held in memory at a time, and each column can be loaded straight
+    into a dataframe or columnar store without reshaping.
+    """
+    writer = ColumnarWriter(out, list(fields or DEFAULT_FIELDS), row_group_size)
+    for record in records:
+        writer.write(record)
+    writer.flush()
+    return writer.count
+
+def export_records(
+    records: Iterable[dict[str, Any]],
+    out: TextIO,
+    format: str = "jsonl",
+    fields: Optional[list[str]] = None,
+) -> int:
+    """
+    Streams records to `out` in the given format without materializing them.
+
+    Args:
+        records: Project metadata dicts, consumed lazily.
+        out: Text stream to write to.
+        format: One of `jsonl`, `csv` or `columnar`.
+        fields: Columns to keep, in order. Defaults to every key for JSONL and to the
+            normalized fields otherwise.
+
+    Returns:
+        Number of records written.
+    """
+    if format == "jsonl":
+        return write_jsonl(records, out, fields)
+    elif format == "csv":
+        return write_csv(records, out, fields)
+    elif format == "columnar":
+        return write_columnar(records, out, fields)
+    else:
+        raise ValueError(f"Unsupported export format: {format}. Expected one of: {', '.join(FORMATS)}")
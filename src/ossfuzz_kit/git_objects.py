@@ -0,0 +1,116 @@
+import logging
+import threading
+import subprocess
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+logger = logging.getLogger("ossfuzz_kit")
+
+class TreeEntry(NamedTuple):
+    mode: str
+    type: str
+    sha: str
+    path: str
+
+class GitObjectReader:
+    """
+    Reads objects straight from a repository's object store through a single long-lived
+    `git cat-file --batch` process, without touching the working tree.
+
+    Reads are addressed by object name, so `<commit>:projects/curl/project.yaml` always returns
+    the file as of that commit, even while another process is moving the checkout. The reader
+    is safe to share between threads.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo_path), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._proc
+
+    def read(self, spec: str) -> Optional[bytes]:
+        """
+        Returns the contents of an object (e.g. a blob SHA or `<rev>:<path>`), or None if it doesn't exist.
+        """
+        with self._lock:
+            proc = self._process()
+            try:
+                proc.stdin.write(spec.encode("utf-8") + b"\n")
+                proc.stdin.flush()
+                header = proc.stdout.readline()
+                if not header:
+                    raise RuntimeError(f"git cat-file exited while reading {spec}")
+
+                fields = header.split()
+                if len(fields) != 3:
+                    # "<spec> missing" or "<spec> ambiguous"
+                    return None
+
+                size = int(fields[2])
+                data = proc.stdout.read(size)
+                proc.stdout.read(1)
+                return data
+            except (OSError, ValueError) as e:
+                self._terminate()
+                raise RuntimeError(f"Failed to read {spec} from {self.repo_path}: {e}")
+
+    def read_text(self, spec: str) -> Optional[str]:
+        data = self.read(spec)
+        return data.decode("utf-8") if data is not None else None
+
+    def ls_tree(self, rev: str, path: str = "", recursive: bool = False) -> list[TreeEntry]:
+        """
+        Lists tree entries under `path` at a revision.
+        """
+        args = ["git", "-C", str(self.repo_path), "ls-tree", "-z"]
+        if recursive:
+            args.append("-r")
+        args.append(rev)
+        if path:
+            args += ["--", path]
+
+        output = subprocess.run(args, check=True, capture_output=True, text=True).stdout
+        entries = []
+        for record in output.split("\0"):
+            if not record:
+                continue
+            meta, _, entry_path = record.partition("\t")
+            mode, obj_type, sha = meta.split()
+            entries.append(TreeEntry(mode, obj_type, sha, entry_path))
+        return entries
+
+    def iter_blobs(self, shas: Iterable[str]) -> Iterator[tuple[str, Optional[bytes]]]:
+        """
+        Reads a set of blobs over the shared batch process, yielding `(sha, contents)` pairs.
+        Contents are None for blobs that don't exist.
+        """
+        for sha in shas:
+            yield sha, self.read(sha)
+
+    def _terminate(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                self._proc.stdin.close()
+                self._proc.wait()
+            self._proc = None
@@ -0,0 +1,153 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from datetime import timedelta
+from typing import Optional, NamedTuple
+
+from ossfuzz_kit.cache import HTTP_CACHE_NAME, get_cache_dir
+
+logger = logging.getLogger("ossfuzz_kit")
+
+class CachedResponse(NamedTuple):
+    """
+    A response body stored alongside the validators needed to revalidate it.
+    """
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    encoding: Optional[str]
+    content: bytes
+
+    def conditional_headers(self) -> dict[str, str]:
+        """
+        Headers that turn a GET into a conditional request for this entry.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+class HTTPCache:
+    """
+    On-disk store of HTTP responses keyed by URL and `Accept` header.
+
+    Only responses carrying an `ETag` or `Last-Modified` validator are stored, so every
+    cached body can be revalidated with a conditional request and served on `304 Not Modified`.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else get_cache_dir() / HTTP_CACHE_NAME
+
+    def _key(self, url: str, accept: Optional[str]) -> str:
+        return hashlib.sha256(f"{url}\n{accept or ''}".encode("utf-8")).hexdigest()
+
+    def get(self, url: str, accept: Optional[str] = None) -> Optional[CachedResponse]:
+        """
+        Returns the stored response for a URL, or None on a miss or unreadable entry.
+        """
+        key = self._key(url, accept)
+        try:
+            meta = json.loads((self.cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+            content = (self.cache_dir / f"{key}.body").read_bytes()
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(url, meta.get("etag"), meta.get("last_modified"), meta.get("encoding"), content)
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        encoding: Optional[str] = None,
+        accept: Optional[str] = None,
+    ) -> None:
+        """
+        Stores a response body with its validators. Bodies without validators are ignored.
+        """
+        if not etag and not last_modified:
+            return
+
+        key = self._key(url, accept)
+        meta = {"url": url, "etag": etag, "last_modified": last_modified, "encoding": encoding}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Body first, then metadata: a reader only trusts an entry once its metadata exists.
+            self._atomic_write(self.cache_dir / f"{key}.body", content)
+            self._atomic_write(self.cache_dir / f"{key}.json", json.dumps(meta).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry for {url}: {e}")
+
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def touch(self, url: str, accept: Optional[str] = None) -> None:
+        """
+        Marks an entry as used, e.g. after a `304 Not Modified`, so `prune()` keeps it.
+        """
+        try:
+            os.utime(self.cache_dir / f"{self._key(url, accept)}.json")
+        except OSError:
+            pass
+
+    def prune(self, older_than: timedelta) -> int:
+        """
+        Removes entries not stored or used within `older_than`, and temporary files left by
+        interrupted writes.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.cache_dir.exists():
+            return 0
+        cutoff = time.time() - older_than.total_seconds()
+        removed = 0
+        for entry in self.cache_dir.iterdir():
+            try:
+                stale = entry.stat().st_mtime < cutoff
+            except OSError:
+                continue
+            if entry.name.startswith(".tmp-") and stale:
+                entry.unlink(missing_ok=True)
+            elif entry.suffix == ".json" and stale:
+                # Metadata first, so a concurrent reader never trusts a half-removed entry.
+                entry.unlink(missing_ok=True)
+                entry.with_suffix(".body").unlink(missing_ok=True)
+                removed += 1
+            elif entry.suffix == ".body" and not entry.with_suffix(".json").exists() and stale:
+                entry.unlink(missing_ok=True)
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes every cached response.
+        """
+        if not self.cache_dir.exists():
+            return
+        for entry in self.cache_dir.iterdir():
+            entry.unlink(missing_ok=True)
+
+_cache_instance = None
+
+def get_http_cache() -> HTTPCache:
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = HTTPCache()
+    return _cache_instance
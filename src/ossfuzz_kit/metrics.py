@@ -0,0 +1,175 @@
+import time
+import logging
+import functools
+import threading
+from contextlib import contextmanager, ExitStack
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+logger = logging.getLogger("ossfuzz_kit")
+
+class SpanRecord(NamedTuple):
+    """
+    A finished stage, as passed to hooks.
+    """
+    name: str
+    start: float
+    duration: float
+    attributes: dict[str, Any]
+    error: Optional[str]
+
+class Metrics:
+    """
+    In-process instrumentation: per-stage timers, counters and gauges, plus hooks.
+
+    Stages are timed with `span()`; nested stages are timed inclusively. Every finished span is
+    passed to the registered callbacks, and OpenTelemetry-compatible tracers (anything with a
+    `start_as_current_span(name, attributes=...)` context manager) receive a matching span.
+    Metrics are per process; work done in worker processes is not included.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hooks: list[Callable[[SpanRecord], None]] = []
+        self._tracers: list[Any] = []
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timers: dict[str, list[float]] = {}
+            self._counters: dict[str, float] = {}
+            self._gauges: dict[str, Any] = {}
+
+    def incr(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: Any) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def record(self, name: str, duration: float) -> None:
+        with self._lock:
+            timer = self._timers.setdefault(name, [0, 0.0, 0.0])
+            timer[0] += 1
+            timer[1] += duration
+            timer[2] = max(timer[2], duration)
+
+    def add_hook(self, hook: Callable[[SpanRecord], None]) -> None:
+        """
+        Registers a callback that receives a `SpanRecord` whenever a stage finishes.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[SpanRecord], None]) -> None:
+        self._hooks.remove(hook)
+
+    def add_tracer(self, tracer: Any) -> None:
+        """
+        Mirrors every stage as a span on an OpenTelemetry-compatible tracer, e.g.
+        `opentelemetry.trace.get_tracer("ossfuzz_kit")`.
+        """
+        self._tracers.append(tracer)
+
+    def remove_tracer(self, tracer: Any) -> None:
+        self._tracers.remove(tracer)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[dict[str, Any]]:
+        """
+        Times a stage. The yielded dict can be updated with attributes known only once the stage runs.
+        """
+        error = None
+        start = time.time()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for tracer in self._tracers:
+                stack.enter_context(tracer.start_as_current_span(name, attributes=attributes))
+            try:
+                yield attributes
+            except BaseException as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                duration = time.perf_counter() - started
+                self.record(name, duration)
+                if self._hooks:
+                    self._notify(SpanRecord(name, start, duration, attributes, error))
+
+    def _notify(self, record: SpanRecord) -> None:
+        for hook in list(self._hooks):
+            try:
+                hook(record)
+            except Exception as e:
+                logger.warning(f"Metrics hook {hook!r} failed: {e}")
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns the current timers, counters, gauges and cache hit rates as plain data.
+
+        Counters named `<cache>.hits` and `<cache>.misses` are paired into
+        `caches[<cache>] = {"hits", "misses", "hit_rate"}`.
+        """
+        with self._lock:
+            timers = {
+                name: {"count": count, "total_s": total, "mean_s": total / count, "max_s": longest}
+                for name, (count, total, longest) in self._timers.items()
+            }
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+
+        caches = {}
+        for name in counters:
+            if name.endswith(".hits") or name.endswith(".misses"):
+                cache = name.rsplit(".", 1)[0]
+                hits = counters.get(f"{cache}.hits", 0)
+                misses = counters.get(f"{cache}.misses", 0)
+                caches[cache] = {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else None}
+
+        return {"timers": timers, "counters": counters, "gauges": gauges, "caches": caches}
+
+    def format_report(self) -> str:
+        """
+        Renders the snapshot as a plain-text breakdown, slowest stages first.
+        """
+        snapshot = self.snapshot()
+        lines = [f"{'stage':<28} {'calls':>6} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        for name, timer in sorted(snapshot["timers"].items(), key=lambda item: -item[1]["total_s"]):
+            lines.append(
+                f"{name:<28} {timer['count']:>6} {timer['total_s'] * 1000:>10.1f} "
+                f"{timer['mean_s'] * 1000:>9.2f} {timer['max_s'] * 1000:>9.2f}"
+            )
+        if snapshot["caches"]:
+            lines.append("")
+            for name, cache in sorted(snapshot["caches"].items()):
+                rate = f"{cache['hit_rate']:.0%}" if cache["hit_rate"] is not None else "n/a"
+                lines.append(f"{name + ' hit rate':<28} {rate:>6} ({cache['hits']:g} hits, {cache['misses']:g} misses)")
+        if snapshot["counters"] or snapshot["gauges"]:
+            lines.append("")
+            for name, value in sorted(snapshot["counters"].items()):
+                lines.append(f"{name:<28} {value:>10g}")
+            for name, value in sorted(snapshot["gauges"].items()):
+                lines.append(f"{name:<28} {value!s:>10}")
+        return "\n".join(lines)
+
+_metrics_instance = None
+_metrics_instance_lock = threading.Lock()
+
+def get_metrics() -> Metrics:
+    global _metrics_instance
+    if _metrics_instance is None:
+        with _metrics_instance_lock:
+            if _metrics_instance is None:
+                _metrics_instance = Metrics()
+    return _metrics_instance
+
+def timed(name: str):
+    """
+    Decorator that times every call of a function as the stage `name`.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_metrics().span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
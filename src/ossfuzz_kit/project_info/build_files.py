@@ -0,0 +1,499 @@
+import os
+import re
+import json
+import shlex
+import hashlib
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from ossfuzz_kit.cache import get_cache_dir
+from ossfuzz_kit.metrics import get_metrics
+from ossfuzz_kit.project_info.bulk_details import ProjectResult, _run_batches
+from ossfuzz_kit.project_info.index import CommitIndex, changes_since
+
+if TYPE_CHECKING:
+    from ossfuzz_kit.utils import ChangeSet
+
+logger = logging.getLogger("ossfuzz_kit")
+
+BUILD_INDEX_FILENAME = "build-index.sqlite3"
+SCHEMA_VERSION = "1"
+
+# Fields of an extracted record that can be searched, and the record key each one comes from.
+SEARCH_FIELDS = {
+    "repo": "repos",
+    "base_image": "base_image",
+    "build_dep": "build_deps",
+    "pip_dep": "pip_deps",
+    "fuzzer": "fuzzers",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    stamp TEXT NOT NULL,
+    info TEXT,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_lookup ON entries (field, value);
+CREATE INDEX IF NOT EXISTS entries_name ON entries (name);
+"""
+
+# `git clone` options that take a separate value.
+_GIT_CLONE_VALUE_OPTIONS = {
+    "-b", "--branch", "--depth", "-c", "--config", "-o", "--origin", "-j", "--jobs", "--filter",
+    "--reference", "--reference-if-able", "--shallow-since", "--shallow-exclude", "--separate-git-dir",
+    "--template", "-u", "--upload-pack", "--server-option",
+}
+# Package manager options that take a separate value.
+_PACKAGE_VALUE_OPTIONS = {"-o", "-t", "--target-release", "--repository", "-X", "--index-url", "-i", "--extra-index-url", "-f", "--find-links"}
+_PIP_SKIP_NEXT = {"-r", "--requirement", "-c", "--constraint", "-e", "--editable"}
+
+_COMMAND_SEPARATOR = re.compile(r"&&|\|\||;|\|")
+_OUT = r"[\"']?\$(?:OUT\b|\{OUT\})[\"']?"
+_OUTPUT_FLAG = re.compile(rf"(?:^|\s)-o\s*{_OUT}/([^\s\"';|&]+)")
+_FUZZER_SIDECAR = re.compile(rf"{_OUT}/([^\s\"';|&/]+?)(?:_seed_corpus\.zip|\.options)(?![\w.])")
+_HELPERS = {
+    # helper name -> index of the argument naming the fuzzer
+    "compile_go_fuzzer": 2,
+    "compile_native_go_fuzzer": 2,
+    "compile_python_fuzzer": 0,
+    "compile_javascript_fuzzer": 1,
+}
+# Built files copied to $OUT that are not fuzz targets.
+_NON_FUZZER_SUFFIXES = (".zip", ".dict", ".options", ".so", ".a", ".jar", ".txt", ".py", ".sh", ".json", ".class")
+
+_SOURCE_SUFFIXES = {".c", ".cc", ".cpp", ".cxx", ".h", ".rs", ".go", ".py", ".java", ".js", ".swift"}
+_FUZZER_ENTRY_POINTS = (b"LLVMFuzzerTestOneInput", b"fuzzerTestOneInput", b"atheris.Setup", b"fuzz_target!", b"func Fuzz")
+
+def _logical_lines(text: str) -> Iterator[str]:
+    """
+    Yields lines with backslash continuations joined and comment lines dropped.
+    """
+    current = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#") or (not stripped and current):
+            continue
+        if stripped.endswith("\\"):
+            current.append(stripped[:-1])
+            continue
+        current.append(stripped)
+        joined = " ".join(current).strip()
+        current = []
+        if joined:
+            yield joined
+    if current:
+        yield " ".join(current).strip()
+
+def _split_commands(script: str) -> Iterator[list[str]]:
+    """
+    Splits a shell snippet into the argument lists of its simple commands.
+    """
+    for command in _COMMAND_SEPARATOR.split(script):
+        try:
+            args = shlex.split(command, comments=True)
+        except ValueError:
+            args = command.split()
+        # Drop leading environment assignments and wrappers such as `sudo`.
+        while args and (re.match(r"^\w+=", args[0]) or args[0] in ("sudo", "env", "exec", "time")):
+            args = args[1:]
+        if args:
+            yield args
+
+def _positionals(args: list[str], value_options: set[str]) -> list[str]:
+    found, skip = [], False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg.startswith("-"):
+            skip = arg in value_options
+        else:
+            found.append(arg)
+    return found
+
+def normalize_repo_url(url: str) -> str:
+    """
+    Returns the form of a repository URL used for lookups: scheme and host lower-cased, without a
+    trailing slash or `.git`, so `https://GitHub.com/curl/curl.git` matches `https://github.com/curl/curl`.
+    """
+    url = url.strip().rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-len(".git")]
+    scheme, sep, rest = url.partition("://")
+    if sep:
+        host, slash, path = rest.partition("/")
+        url = f"{scheme.lower()}://{host.lower()}{slash}{path}"
+    return url
+
+def _parse_clone(vcs: str, args: list[str]) -> Optional[dict[str, Any]]:
+    # `args` follow the tool name, e.g. `clone --depth 1 <url> <dest>` or `co <url>`.
+    branch = None
+    if vcs == "git":
+        # Skip global options such as `git -C dir -c key=value clone`.
+        while args and args[0] != "clone":
+            args = args[2:] if args[0] in ("-C", "-c") else args[1:]
+        rest = args[1:]
+        positionals = _positionals(rest, _GIT_CLONE_VALUE_OPTIONS)
+        for i, arg in enumerate(rest):
+            if arg in ("-b", "--branch") and i + 1 < len(rest):
+                branch = rest[i + 1]
+            elif arg.startswith("--branch="):
+                branch = arg.partition("=")[2]
+    else:
+        positionals = _positionals(args[1:], {"-r", "--rev", "-u", "--updaterev", "-b", "--branch"})
+    if not positionals:
+        return None
+    return {
+        "url": positionals[0],
+        "vcs": vcs,
+        "branch": branch,
+        "dest": positionals[1] if len(positionals) > 1 else None,
+    }
+
+def _parse_packages(args: list[str]) -> tuple[str, list[str]]:
+    """
+    Returns `("system" | "pip" | "", packages)` for an install command.
+    """
+    tool = Path(args[0]).name
+    if tool.startswith("python") and args[1:3] == ["-m", "pip"]:
+        tool, args = "pip", args[2:]
+    if tool in ("apt-get", "apt", "apk", "yum", "dnf", "microdnf") and len(args) > 1 and args[1] in ("install", "add"):
+        packages = _positionals(args[2:], _PACKAGE_VALUE_OPTIONS)
+        return "system", [p.split("=", 1)[0] for p in packages if "$" not in p]
+    if re.fullmatch(r"pip[\d.]*", tool) and len(args) > 1 and args[1] == "install":
+        packages, skip = [], False
+        for arg in args[2:]:
+            if skip:
+                skip = False
+            elif arg in _PIP_SKIP_NEXT:
+                skip = True
+            elif arg.startswith("-"):
+                skip = arg in _PACKAGE_VALUE_OPTIONS
+            elif not re.match(r"^[./$~]", arg) and "/" not in arg:
+                packages.append(re.split(r"[<>=!~\[;]", arg, 1)[0])
+        return "pip", [p for p in packages if p]
+    return "", []
+
+def parse_dockerfile(text: str) -> dict[str, Any]:
+    """
+    Extracts the base image, cloned repositories and installed packages from a project's Dockerfile.
+
+    Returns:
+        A dict with `base_image`, `repos` (`url`, `vcs`, `branch`, `dest`), `build_deps` (system
+        packages), `pip_deps` and `workdir`.
+    """
+    stages: dict[str, str] = {}
+    base_image = None
+    repos: list[dict[str, Any]] = []
+    build_deps: list[str] = []
+    pip_deps: list[str] = []
+    workdir = None
+
+    for line in _logical_lines(text):
+        instruction, _, rest = line.partition(" ")
+        instruction = instruction.upper()
+        if instruction == "FROM":
+            words = [w for w in rest.split() if not w.startswith("--")]
+            if not words:
+                continue
+            image = stages.get(words[0].lower(), words[0])
+            if len(words) >= 3 and words[1].lower() == "as":
+                stages[words[2].lower()] = image
+            base_image = image
+        elif instruction == "WORKDIR":
+            workdir = rest.strip()
+        elif instruction == "RUN":
+            for args in _split_commands(rest):
+                tool = Path(args[0]).name
+                if (tool == "git" and "clone" in args) or (tool, *args[1:2]) in (("hg", "clone"), ("svn", "co"), ("svn", "checkout")):
+                    repo = _parse_clone(tool, args[1:])
+                    if repo is not None:
+                        repos.append(repo)
+                    continue
+                kind, packages = _parse_packages(args)
+                target = build_deps if kind == "system" else pip_deps
+                target.extend(p for p in packages if p not in target)
+
+    return {
+        "base_image": base_image,
+        "repos": repos,
+        "build_deps": build_deps,
+        "pip_deps": pip_deps,
+        "workdir": workdir,
+    }
+
+def _is_fuzzer_name(name: str) -> bool:
+    return bool(name) and not any(c in name for c in "$*?{}") and not name.endswith(_NON_FUZZER_SUFFIXES)
+
+def parse_build_script(text: str) -> list[str]:
+    """
+    Returns the fuzz targets a `build.sh` declares, sorted.
+
+    Targets are recognised from `-o $OUT/<name>`, the `compile_*_fuzzer` helpers, `<name>_seed_corpus.zip`
+    and `<name>.options` files, and binaries copied into `$OUT` whose name mentions "fuzz". Names built
+    in loops or from variables cannot be known without running the script and are left out.
+    """
+    fuzzers: set[str] = set()
+    for line in _logical_lines(text):
+        fuzzers.update(_OUTPUT_FLAG.findall(line))
+        fuzzers.update(_FUZZER_SIDECAR.findall(line))
+        for args in _split_commands(line):
+            tool = args[0]
+            if tool in _HELPERS:
+                position = _HELPERS[tool]
+                if len(args) > position + 1:
+                    name = Path(args[position + 1]).name
+                    fuzzers.add(name.rsplit(".", 1)[0] if tool in ("compile_python_fuzzer", "compile_javascript_fuzzer") else name)
+            elif tool == "cp" and len(args) >= 3 and re.fullmatch(_OUT + r"/?", args[-1]):
+                fuzzers.update(Path(source).name for source in args[1:-1] if not source.startswith("-") and "fuzz" in Path(source).name.lower())
+    return sorted(name for name in fuzzers if _is_fuzzer_name(name))
+
+def find_fuzzer_sources(project_dir: Path) -> list[str]:
+    """
+    Returns the paths, relative to the project directory, of fuzz target sources kept in OSS-Fuzz itself.
+    """
+    sources = []
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for file in sorted(files):
+            path = Path(root) / file
+            if path.suffix not in _SOURCE_SUFFIXES:
+                continue
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+            if any(marker in content for marker in _FUZZER_ENTRY_POINTS):
+                sources.append(path.relative_to(project_dir).as_posix())
+    return sources
+
+def extract_build_info(project_dir: Path) -> ProjectResult:
+    """
+    Parses a project's `Dockerfile` and `build.sh` and finds its fuzzer sources, capturing any
+    failure in the result. A missing file leaves its fields empty.
+    """
+    project_dir = Path(project_dir)
+    name = project_dir.name
+    try:
+        dockerfile = project_dir / "Dockerfile"
+        build_script = project_dir / "build.sh"
+        info = {"name": name}
+        info.update(parse_dockerfile(dockerfile.read_text(encoding="utf-8", errors="replace")) if dockerfile.is_file() else {
+            "base_image": None, "repos": [], "build_deps": [], "pip_deps": [], "workdir": None,
+        })
+        info["fuzzers"] = parse_build_script(build_script.read_text(encoding="utf-8", errors="replace")) if build_script.is_file() else []
+        info["fuzzer_sources"] = find_fuzzer_sources(project_dir)
+        return ProjectResult(name, info, None)
+    except Exception as e:
+        return ProjectResult(name, None, f"{type(e).__name__}: {e}")
+
+def _extract_batch(paths: list[str]) -> list[ProjectResult]:
+    # Runs inside worker processes, so it takes plain strings and must stay importable at module level.
+    return [extract_build_info(Path(p)) for p in paths]
+
+def extract_build_infos(project_dirs: list[Path], workers: Optional[int] = None) -> Iterator[ProjectResult]:
+    """
+    Extracts build information for the given project directories, fanning out across worker processes.
+    Results are yielded as batches finish, not in input order.
+    """
+    yield from _run_batches(_extract_batch, [str(p) for p in project_dirs], workers, action="Extracting build files of")
+
+def _stamp(project_dir: Path) -> str:
+    # Every file's path, mtime and size: any edit, addition or removal changes the stamp.
+    digest = hashlib.blake2b(digest_size=16)
+    for root, dirs, files in os.walk(project_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for file in sorted(files):
+            path = os.path.join(root, file)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"{os.path.relpath(path, project_dir)}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
+
+def _entries(info: dict[str, Any]) -> Iterator[tuple[str, str]]:
+    for field, key in SEARCH_FIELDS.items():
+        value = info.get(key)
+        if value is None:
+            continue
+        if field == "repo":
+            for repo in value:
+                yield field, normalize_repo_url(repo["url"])
+        elif isinstance(value, list):
+            for item in value:
+                yield field, item
+        else:
+            yield field, value
+
+class BuildIndex(CommitIndex):
+    """
+    Persistent SQLite index of what every project's `Dockerfile` and `build.sh` declare: upstream
+    repositories, base image, build dependencies and fuzz targets.
+
+    Like `ProjectIndex`, it is keyed by the clone's HEAD commit and only re-extracts projects whose
+    files changed. Each repository URL, base image, dependency and fuzzer name is also stored as an
+    indexed row, so `search()` is a lookup rather than a scan.
+    """
+
+    SCHEMA = _SCHEMA
+    SCHEMA_VERSION = SCHEMA_VERSION
+    TABLES = ("projects", "entries")
+
+    def __init__(self, db_path: Optional[Path] = None):
+        super().__init__(db_path or get_cache_dir() / BUILD_INDEX_FILENAME)
+
+    def refresh(
+        self,
+        projects_dir: Path,
+        commit: Optional[str] = None,
+        workers: Optional[int] = None,
+        changes: Optional["ChangeSet"] = None,
+    ) -> int:
+        """
+        Brings the index in line with `projects_dir`.
+
+        Args:
+            projects_dir: The `projects/` directory of the clone.
+            commit: HEAD commit of the clone. When it matches the indexed commit the scan is skipped.
+            workers: Worker processes used to re-extract changed projects.
+            changes: The result of the `RepoManager.sync()` that produced `commit`. When it starts
+                from the indexed commit, only the projects it names are looked at.
+
+        Returns:
+            Number of projects re-extracted or removed.
+        """
+        if self.is_fresh(projects_dir, commit):
+            return 0
+
+        projects_dir = Path(projects_dir)
+        known = dict(self.conn.execute("SELECT name, stamp FROM projects"))
+
+        scope = self._refresh_scope(commit, changes)
+        if scope is not None:
+            candidates = [projects_dir / name for name in sorted(scope) if (projects_dir / name).is_dir()]
+        else:
+            with os.scandir(projects_dir) as entries:
+                candidates = sorted(Path(entry.path) for entry in entries if entry.is_dir())
+
+        stamps = {project_dir.name: _stamp(project_dir) for project_dir in candidates}
+        changed = [project_dir for project_dir in candidates if known.get(project_dir.name) != stamps[project_dir.name]]
+        removed = [name for name in known if name not in stamps and (scope is None or name in scope)]
+
+        with self.conn:
+            stale = [(name,) for name in removed] + [(p.name,) for p in changed]
+            self.conn.executemany("DELETE FROM projects WHERE name = ?", stale)
+            self.conn.executemany("DELETE FROM entries WHERE name = ?", stale)
+
+            rows, entries = [], []
+            for result in extract_build_infos(changed, workers=workers):
+                if result.error:
+                    rows.append((result.name, stamps[result.name], None, result.error))
+                    continue
+                rows.append((result.name, stamps[result.name], json.dumps(result.details), None))
+                entries.extend((field, value, result.name) for field, value in _entries(result.details))
+            self.conn.executemany("INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?)", rows)
+            self.conn.executemany("INSERT INTO entries VALUES (?, ?, ?)", entries)
+
+            self._mark_refreshed(projects_dir, commit)
+
+        if changed or removed:
+            logger.info(f"Build index updated: {len(changed)} re-extracted, {len(removed)} removed")
+        return len(changed) + len(removed)
+
+    def names(self) -> list[str]:
+        """
+        Returns the sorted list of indexed project names.
+        """
+        return [row[0] for row in self.conn.execute("SELECT name FROM projects ORDER BY name")]
+
+    def get(self, project_name: str) -> Optional[dict[str, Any]]:
+        """
+        Returns a project's extracted build information, or None if it is unknown or failed to extract.
+        """
+        row = self.conn.execute("SELECT info FROM projects WHERE name = ?", (project_name,)).fetchone()
+        if row is None or row[0] is None:
+            get_metrics().incr("build_index.misses")
+            return None
+        get_metrics().incr("build_index.hits")
+        return json.loads(row[0])
+
+    def iter_details(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields build information for every successfully extracted project, sorted by name.
+        """
+        for (value,) in self.conn.execute("SELECT info FROM projects WHERE info IS NOT NULL ORDER BY name"):
+            yield json.loads(value)
+
+    def errors(self) -> dict[str, str]:
+        """
+        Returns the extraction error of every project that failed, by name.
+        """
+        return dict(self.conn.execute("SELECT name, error FROM projects WHERE error IS NOT NULL ORDER BY name"))
+
+    def search(self, **criteria: Optional[str]) -> list[str]:
+        """
+        Returns the sorted names of projects matching every given criterion, e.g.
+        `search(repo="https://github.com/madler/zlib", fuzzer="zlib_uncompress_fuzzer")`.
+
+        Criteria are the keys of `SEARCH_FIELDS`; `dependency` matches either kind of dependency.
+        Repository URLs are compared after `normalize_repo_url`.
+        """
+        clauses, params = [], []
+        for field, value in criteria.items():
+            if value is None:
+                continue
+            if field == "dependency":
+                fields = ("build_dep", "pip_dep")
+            elif field in SEARCH_FIELDS:
+                fields = (field,)
+            else:
+                raise ValueError(f"Unknown search field '{field}'. Expected one of: {', '.join([*SEARCH_FIELDS, 'dependency'])}")
+            if field == "repo":
+                value = normalize_repo_url(value)
+            placeholders = ", ".join("?" for _ in fields)
+            clauses.append(f"SELECT name FROM entries WHERE field IN ({placeholders}) AND value = ?")
+            params.extend([*fields, value])
+
+        if not clauses:
+            return self.names()
+        query = " INTERSECT ".join(clauses) + " ORDER BY name"
+        return [row[0] for row in self.conn.execute(query, params)]
+
+_build_index_instance = None
+
+def get_build_index() -> BuildIndex:
+    global _build_index_instance
+    if _build_index_instance is None:
+        _build_index_instance = BuildIndex()
+    return _build_index_instance
+
+def get_fresh_build_index(workers: Optional[int] = None) -> BuildIndex:
+    """
+    Returns the shared build index refreshed against the local clone.
+    """
+    from ossfuzz_kit.utils import get_repo_manager
+
+    manager = get_repo_manager()
+    projects_dir = manager.get_projects_dir()
+    try:
+        commit = manager.head_commit()
+    except Exception:
+        commit = None
+
+    index = get_build_index()
+    changes = changes_since(manager, index.commit, commit)
+    with get_metrics().span("build_index.refresh") as span:
+        span["extracted"] = index.refresh(projects_dir, commit, workers=workers, changes=changes)
+    return index
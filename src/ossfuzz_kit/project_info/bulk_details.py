@@ -0,0 +1,130 @@
+import os
+import logging
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ossfuzz_kit.utils import get_repo_manager
+from ossfuzz_kit.project_info.project_details import load_yaml, normalize_project_info
+
+logger = logging.getLogger("ossfuzz_kit")
+
+BATCH_SIZE = 32
+
+class ProjectResult(NamedTuple):
+    """
+    Outcome of loading a single project during a bulk pass.
+    Exactly one of `details` and `error` is set.
+    """
+    name: str
+    details: Optional[dict[str, Any]]
+    error: Optional[str]
+
+def load_project_file(yaml_path: Path, raw: bool = False) -> ProjectResult:
+    """
+    Parses a single `project.yaml` and normalizes it, capturing any failure in the result.
+    """
+    project_name = yaml_path.parent.name
+    try:
+        with open(yaml_path, "r", encoding="utf-8") as f:
+            data = load_yaml(f)
+        return ProjectResult(project_name, normalize_project_info(project_name, data, raw=raw), None)
+    except Exception as e:
+        return ProjectResult(project_name, None, f"{type(e).__name__}: {e}")
+
+def parse_project_text(project_name: str, text: str, raw: bool = False) -> ProjectResult:
+    """
+    Parses `project.yaml` contents and normalizes them, capturing any failure in the result.
+    """
+    try:
+        return ProjectResult(project_name, normalize_project_info(project_name, load_yaml(text), raw=raw), None)
+    except Exception as e:
+        return ProjectResult(project_name, None, f"{type(e).__name__}: {e}")
+
+def _load_batch(paths: list[str], raw: bool) -> list[ProjectResult]:
+    # Runs inside worker processes, so it takes plain strings and must stay importable at module level.
+    return [load_project_file(Path(p), raw=raw) for p in paths]
+
+def _parse_batch(items: list[tuple[str, str]], raw: bool) -> list[ProjectResult]:
+    return [parse_project_text(name, text, raw=raw) for name, text in items]
+
+def iter_project_files(projects_dir: Path) -> Iterator[Path]:
+    """
+    Yields the `project.yaml` path of every project directory, in a single directory walk.
+    """
+    with os.scandir(projects_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield Path(entry.path) / "project.yaml"
+
+def _run_batches(func, items: list, workers: Optional[int], *args, action: str = "Parsing") -> Iterator[ProjectResult]:
+    # Calls `func(batch, *args)` on chunks of `items`, in worker processes unless there is only one
+    # worker or one batch. `func` must be importable at module level.
+    batches = [items[i:i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(batches) <= 1:
+        for batch in batches:
+            yield from func(batch, *args)
+        return
+
+    logger.info(f"{action} {len(items)} projects across {workers} processes...")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, batch, *args) for batch in batches]
+        for future in as_completed(futures):
+            yield from future.result()
+
+def load_project_files(paths: list[Path], raw: bool = False, workers: Optional[int] = None) -> Iterator[ProjectResult]:
+    """
+    Parses the given `project.yaml` files, fanning out across worker processes.
+
+    Args:
+        paths: `project.yaml` paths to parse; the project name is the parent directory.
+        raw: If True, yield full YAML contents merged with name.
+        workers: Number of worker processes. Defaults to the CPU count; 0 or 1 parses in-process.
+
+    Yields:
+        ProjectResult for each path, in completion order.
+    """
+    yield from _run_batches(_load_batch, [str(p) for p in paths], workers, raw)
+
+def load_project_texts(
+    items: Iterable[tuple[str, str]], raw: bool = False, workers: Optional[int] = None
+) -> Iterator[ProjectResult]:
+    """
+    Parses `(project_name, project.yaml text)` pairs, fanning out across worker processes.
+    """
+    yield from _run_batches(_parse_batch, list(items), workers, raw)
+
+def iter_all_project_details(
+    raw: bool = False,
+    workers: Optional[int] = None,
+    projects_dir: Optional[Path] = None,
+    commit: Optional[str] = None,
+) -> Iterator[ProjectResult]:
+    """
+    Loads every project's metadata from the local clone in one pass.
+
+    Args:
+        raw: If True, yield full YAML contents merged with name.
+        workers: Number of worker processes. Defaults to the CPU count; 0 or 1 parses in-process.
+        projects_dir: Directory to scan. Defaults to the managed clone's `projects/` directory.
+        commit: Read every `project.yaml` from the git object store at this commit instead of
+            the working tree.
+
+    Yields:
+        ProjectResult for each project, in completion order. Per-project failures are
+        reported through `ProjectResult.error` and never abort the run.
+    """
+    if commit is None and projects_dir is None:
+        manager = get_repo_manager()
+        projects_dir = manager.get_projects_dir()
+        if manager.backend == "git":
+            commit = manager.resolve_commit()
+
+    if commit is not None:
+        yield from load_project_texts(get_repo_manager().iter_project_yamls(commit), raw=raw, workers=workers)
+        return
+
+    yield from load_project_files(list(iter_project_files(projects_dir)), raw=raw, workers=workers)
@@ -0,0 +1,332 @@
+import json
+import logging
+from pathlib import Path
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterator, Optional, Union
+
+from ossfuzz_kit.cache import get_cache_dir
+from ossfuzz_kit.sqlite_store import SQLiteStore
+from ossfuzz_kit.utils import RepoManager, get_repo_manager
+from ossfuzz_kit.project_info.project_details import load_yaml, normalize_project_info
+from ossfuzz_kit.project_info.query import PROJECT_FIELDS
+
+logger = logging.getLogger("ossfuzz_kit")
+
+HISTORY_FILENAME = "project-history.sqlite3"
+
+# Normalized fields tracked over time (all but the name); list fields are stored as JSON arrays.
+FIELDS = PROJECT_FIELDS[1:]
+LIST_FIELDS = ("fuzzing_engines", "sanitizers", "architectures", "vendor_ccs")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS versions (
+    project TEXT NOT NULL,
+    ts INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    commit_sha TEXT NOT NULL,
+    blob TEXT,
+    {", ".join(f"{field} TEXT" for field in FIELDS)}
+);
+CREATE INDEX IF NOT EXISTS versions_project_ts ON versions (project, ts, seq);
+CREATE INDEX IF NOT EXISTS versions_ts ON versions (ts);
+"""
+
+Moment = Union[str, date, datetime, int, float]
+
+def to_timestamp(moment: Moment) -> int:
+    """
+    Converts an ISO date/datetime string, `date`, `datetime` or epoch seconds to epoch seconds.
+    Dates and naive datetimes are taken as UTC; a bare date means the start of that day.
+    """
+    if isinstance(moment, (int, float)):
+        return int(moment)
+    if isinstance(moment, str):
+        moment = datetime.fromisoformat(moment)
+    if not isinstance(moment, datetime):
+        moment = datetime(moment.year, moment.month, moment.day)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+def _encode(info: Optional[dict[str, Any]]) -> list[Optional[str]]:
+    if info is None:
+        return [None] * len(FIELDS)
+    return [json.dumps(info.get(field), default=str) for field in FIELDS]
+
+def _decode(project_name: str, values) -> dict[str, Any]:
+    return {
+        "name": project_name,
+        **{field: json.loads(value) if value is not None else None for field, value in zip(FIELDS, values)},
+    }
+
+class ProjectHistory(SQLiteStore):
+    """
+    Timeline of every project's normalized metadata, built from a single walk over the
+    `project.yaml` commits of the local clone.
+
+    A row is stored only when a project's normalized fields actually change (or it is removed),
+    one column per field, so the timeline stays compact and point-in-time lookups are a single
+    indexed query. Later updates walk only the commits added since the last one processed.
+    """
+
+    SCHEMA = _SCHEMA
+
+    def __init__(self, db_path: Optional[Path] = None, manager: Optional[RepoManager] = None):
+        super().__init__(db_path or get_cache_dir() / HISTORY_FILENAME)
+        self._manager = manager
+
+    @property
+    def manager(self) -> RepoManager:
+        return self._manager or get_repo_manager()
+
+    @property
+    def start(self) -> Optional[int]:
+        """
+        Timestamp of the oldest commit in the timeline; earlier moments cannot be answered.
+        """
+        value = self._get_meta("start_ts")
+        return int(value) if value is not None else None
+
+    @property
+    def last_commit(self) -> Optional[str]:
+        return self._get_meta("last_commit")
+
+    def covers(self, moment: Moment) -> bool:
+        return self.start is not None and self.start <= to_timestamp(moment)
+
+    def build(self, since: Optional[Moment] = None) -> int:
+        """
+        Deepens the clone back to `since` (or to the first commit) and rebuilds the timeline from scratch.
+
+        Returns:
+            Number of versions stored.
+        """
+        since_dt = datetime.fromtimestamp(to_timestamp(since), tz=timezone.utc) if since is not None else None
+        logger.info(f"Fetching history since {since_dt or 'the first commit'}...")
+        self.manager.deepen(since_dt)
+
+        with self.conn:
+            self.conn.execute("DELETE FROM versions")
+            self.conn.execute("DELETE FROM meta")
+        return self._walk(since_commit=None)
+
+    def update(self) -> int:
+        """
+        Extends the timeline with commits added since the last build or update.
+
+        Returns:
+            Number of versions stored.
+        """
+        last_commit = self.last_commit
+        if last_commit is None:
+            raise RuntimeError("History has not been built yet; call build() first")
+
+        last_ts = self._get_meta("last_ts")
+        if last_ts is not None:
+            # A depth-1 sync leaves a gap behind the new HEAD; fill it before walking.
+            try:
+                self.manager.deepen(datetime.fromtimestamp(int(last_ts), tz=timezone.utc))
+            except Exception as e:
+                logger.warning(f"Could not deepen clone before history update: {e}")
+        return self._walk(since_commit=last_commit)
+
+    def _latest(self) -> dict[str, tuple[Optional[str], list[Optional[str]]]]:
+        rows = self.conn.execute(
+            f"""
+            SELECT project, blob, {", ".join(FIELDS)} FROM (
+                SELECT *, ROW_NUMBER() OVER (PARTITION BY project ORDER BY ts DESC, seq DESC) AS rn
+                FROM versions
+            ) WHERE rn = 1
+            """
+        )
+        return {row[0]: (row[1], list(row[2:])) for row in rows}
+
+    def _walk(self, since_commit: Optional[str]) -> int:
+        manager = self.manager
+        latest = self._latest()
+        parsed: dict[str, list[Optional[str]]] = {}
+        seq = int(self._get_meta("seq") or 0)
+        stored = 0
+        last = None
+
+        commits = list(manager.iter_project_changes(since_commit=since_commit))
+        # In a blobless clone, fetch every project.yaml version up front instead of one per read.
+        blobs = {blob for commit in commits for _, blob in commit.changes if blob is not None}
+        manager.prefetch_blobs(blobs)
+        contents = dict(manager.object_reader.iter_blobs(sorted(blobs)))
+
+        with self.conn:
+            for commit in commits:
+                last = commit
+                if self._get_meta("start_ts") is None:
+                    self._set_meta("start_ts", str(commit.timestamp))
+
+                rows = []
+                for project_name, blob in commit.changes:
+                    if blob is None:
+                        values = _encode(None)
+                    elif blob in parsed:
+                        values = parsed[blob]
+                    else:
+                        try:
+                            text = contents[blob].decode("utf-8")
+                            values = _encode(normalize_project_info(project_name, load_yaml(text)))
+                        except Exception as e:
+                            logger.debug(f"Skipping unparsable {project_name}/project.yaml at {commit.commit[:12]}: {e}")
+                            continue
+                        parsed[blob] = values
+
+                    previous = latest.get(project_name)
+                    if previous is not None and previous[1] == values and (blob is None) == (previous[0] is None):
+                        continue
+                    if previous is None and blob is None:
+                        continue
+
+                    seq += 1
+                    rows.append((project_name, commit.timestamp, seq, commit.commit, blob, *values))
+                    latest[project_name] = (blob, values)
+
+                if rows:
+                    self.conn.executemany(
+                        f"INSERT INTO versions VALUES ({', '.join('?' * (5 + len(FIELDS)))})", rows
+                    )
+                    stored += len(rows)
+
+            if last is not None:
+                self._set_meta("last_commit", last.commit)
+                self._set_meta("last_ts", str(last.timestamp))
+                self._set_meta("seq", str(seq))
+
+        logger.info(f"History updated: {stored} versions stored")
+        return stored
+
+    def _row_at(self, project_name: str, moment: Moment):
+        if not self.covers(moment):
+            raise ValueError(f"History starts at {self.start}; build it with an earlier `since`")
+        return self.conn.execute(
+            f"""
+            SELECT blob, commit_sha, ts, {", ".join(FIELDS)} FROM versions
+            WHERE project = ? AND ts <= ? ORDER BY ts DESC, seq DESC LIMIT 1
+            """,
+            (project_name, to_timestamp(moment)),
+        ).fetchone()
+
+    def get_at(self, project_name: str, moment: Moment, raw: bool = False) -> Optional[dict[str, Any]]:
+        """
+        Returns a project's metadata as of `moment`, or None if it did not exist then.
+        With `raw=True` the full `project.yaml` of that version is read from the object store.
+        """
+        row = self._row_at(project_name, moment)
+        if row is None or row[0] is None:
+            return None
+        if raw:
+            return normalize_project_info(project_name, load_yaml(self.manager.object_reader.read_text(row[0])), raw=True)
+        return _decode(project_name, row[3:])
+
+    def iter_versions(self, project_name: str) -> Iterator[dict[str, Any]]:
+        """
+        Yields each stored version of a project, oldest first, with its `commit` and `timestamp`.
+        A removed project yields a version whose fields are all None.
+        """
+        rows = self.conn.execute(
+            f"SELECT commit_sha, ts, {', '.join(FIELDS)} FROM versions WHERE project = ? ORDER BY ts, seq",
+            (project_name,),
+        )
+        for commit_sha, ts, *values in rows:
+            yield {"commit": commit_sha, "timestamp": ts, **_decode(project_name, values)}
+
+    def changes(
+        self,
+        field: str,
+        value: Any = None,
+        since: Optional[Moment] = None,
+        until: Optional[Moment] = None,
+        removed: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Lists changes to a field between `since` and `until`.
+
+        For list fields, `value` selects versions that added it (or removed it, with `removed=True`),
+        e.g. `changes("sanitizers", "memory", since="2024-01-01")`. For scalar fields, `value`
+        selects changes to (or away from) that value. Without `value`, every change to the field is listed.
+        """
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field '{field}'. Expected one of: {', '.join(FIELDS)}")
+
+        lower = to_timestamp(since) if since is not None else None
+        upper = to_timestamp(until) if until is not None else None
+        rows = self.conn.execute(
+            f"""
+            SELECT project, ts, commit_sha, prev, cur FROM (
+                SELECT project, ts, commit_sha, {field} AS cur,
+                       LAG({field}) OVER (PARTITION BY project ORDER BY ts, seq) AS prev
+                FROM versions
+            )
+            WHERE (? IS NULL OR ts >= ?) AND (? IS NULL OR ts < ?)
+            ORDER BY ts, project
+            """,
+            (lower, lower, upper, upper),
+        )
+
+        results = []
+        for project_name, ts, commit_sha, prev, cur in rows:
+            old = json.loads(prev) if prev is not None else None
+            new = json.loads(cur) if cur is not None else None
+            if old == new:
+                continue
+            if value is not None:
+                before, after = (old, new) if not removed else (new, old)
+                if field in LIST_FIELDS:
+                    has_before = value in _names(before)
+                    has_after = value in _names(after)
+                else:
+                    has_before, has_after = before == value, after == value
+                if has_before or not has_after:
+                    continue
+            results.append({"name": project_name, "timestamp": ts, "commit": commit_sha, "old": old, "new": new})
+        return results
+
+def _names(values: Optional[list]) -> set:
+    # Sanitizer entries may be mappings such as {"memory": {"experimental": True}}.
+    names = set()
+    for item in values or []:
+        names.update(item if isinstance(item, dict) else [item])
+    return names
+
+_history_instance = None
+
+def get_project_history() -> ProjectHistory:
+    global _history_instance
+    if _history_instance is None:
+        _history_instance = ProjectHistory()
+    return _history_instance
+
+def ensure_history(moment: Optional[Moment] = None) -> ProjectHistory:
+    """
+    Returns the shared history, building or extending it so that it covers `moment` and the current HEAD.
+    """
+    history = get_project_history()
+    if history.last_commit is None or (moment is not None and not history.covers(moment)):
+        if moment is None:
+            history.build()
+            return history
+        # The timeline has to start at the commit in effect at `moment`. One shallow fetch with a
+        # small margin usually reaches it; otherwise fetch the whole history once.
+        manager = history.manager
+        timestamp = to_timestamp(moment)
+        start = manager.last_commit_time_before(timestamp)
+        if start is None:
+            manager.deepen(datetime.fromtimestamp(timestamp - int(timedelta(days=7).total_seconds()), tz=timezone.utc))
+            start = manager.last_commit_time_before(timestamp)
+        if start is None:
+            manager.deepen()
+            start = manager.last_commit_time_before(timestamp)
+        # A moment before the first commit can never be covered; build the full timeline anyway.
+        history.build(since=start - 1 if start is not None else None)
+    elif history.last_commit != history.manager.head_commit():
+        history.update()
+    return history
@@ -0,0 +1,253 @@
+import os
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+from ossfuzz_kit.cache import get_cache_dir
+from ossfuzz_kit.metrics import get_metrics
+from ossfuzz_kit.sqlite_store import SQLiteStore
+
+if TYPE_CHECKING:
+    from ossfuzz_kit.utils import ChangeSet
+
+logger = logging.getLogger("ossfuzz_kit")
+
+INDEX_FILENAME = "project-index.sqlite3"
+SCHEMA_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    info TEXT,
+    raw TEXT,
+    error TEXT
+);
+"""
+
+class CommitIndex(SQLiteStore):
+    """
+    Base for the SQLite indexes derived from the clone's `projects/` directory and keyed by its
+    HEAD commit. While the commit is unchanged the index is served as-is; a refresh after a sync
+    looks only at the projects the sync reported changed.
+    """
+
+    @property
+    def commit(self) -> Optional[str]:
+        """
+        The commit the index was last refreshed against.
+        """
+        return self._get_meta("commit")
+
+    @property
+    def built(self) -> bool:
+        """
+        Whether the index has been populated at least once.
+        """
+        return self._get_meta("projects_dir") is not None
+
+    def is_fresh(self, projects_dir: Path, commit: Optional[str]) -> bool:
+        """
+        Returns True if the index was built from `projects_dir` at `commit`.
+        """
+        return (
+            commit is not None
+            and self.commit == commit
+            and self._get_meta("projects_dir") == str(Path(projects_dir).resolve())
+        )
+
+    def _refresh_scope(self, commit: Optional[str], changes: Optional["ChangeSet"]) -> Optional[set[str]]:
+        # The projects to look at when `changes` leads from the indexed commit to `commit`; None means all.
+        if (
+            changes is not None
+            and commit is not None
+            and changes.new_commit == commit
+            and changes.old_commit is not None
+            and changes.old_commit == self.commit
+        ):
+            return changes.projects
+        return None
+
+    def _mark_refreshed(self, projects_dir: Path, commit: Optional[str]) -> None:
+        self._set_meta("commit", commit)
+        self._set_meta("projects_dir", str(Path(projects_dir).resolve()))
+
+class ProjectIndex(CommitIndex):
+    """
+    Persistent SQLite index of every project's normalized and raw metadata.
+
+    The index is keyed by the clone's HEAD commit: while the commit is unchanged it is
+    served as-is, and after a pull only `project.yaml` files whose mtime or size changed
+    are re-parsed.
+    """
+
+    SCHEMA = _SCHEMA
+    SCHEMA_VERSION = SCHEMA_VERSION
+    TABLES = ("projects",)
+
+    def __init__(self, db_path: Optional[Path] = None):
+        super().__init__(db_path or get_cache_dir() / INDEX_FILENAME)
+
+    def refresh(
+        self,
+        projects_dir: Path,
+        commit: Optional[str] = None,
+        workers: Optional[int] = None,
+        changes: Optional["ChangeSet"] = None,
+    ) -> int:
+        """
+        Brings the index in line with `projects_dir`.
+
+        Args:
+            projects_dir: The `projects/` directory of the clone.
+            commit: HEAD commit of the clone. When it matches the indexed commit the scan is skipped.
+            workers: Worker processes used to re-parse changed files.
+            changes: The result of the `RepoManager.sync()` that produced `commit`. When it starts
+                from the indexed commit, only the projects it names are looked at.
+
+        Returns:
+            Number of projects re-parsed or removed.
+        """
+        if self.is_fresh(projects_dir, commit):
+            return 0
+
+        # Reading the index must stay cheap to import; parsing is only needed when refreshing.
+        from ossfuzz_kit.project_info.project_details import normalize_project_info
+        from ossfuzz_kit.project_info.bulk_details import iter_project_files, load_project_files
+
+        known = {
+            name: (mtime_ns, size)
+            for name, mtime_ns, size in self.conn.execute("SELECT name, mtime_ns, size FROM projects")
+        }
+
+        scope = self._refresh_scope(commit, changes)
+        if scope is not None:
+            candidates = [Path(projects_dir) / name / "project.yaml" for name in sorted(scope)]
+            candidates = [p for p in candidates if p.parent.is_dir()]
+        else:
+            candidates = list(iter_project_files(Path(projects_dir)))
+
+        stats: dict[str, tuple[int, int]] = {}
+        changed: list[Path] = []
+        for yaml_path in candidates:
+            name = yaml_path.parent.name
+            try:
+                st = os.stat(yaml_path)
+                stats[name] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stats[name] = (-1, -1)
+            if known.get(name) != stats[name]:
+                changed.append(yaml_path)
+
+        removed = [name for name in known if name not in stats and (scope is None or name in scope)]
+
+        with self.conn:
+            if removed:
+                self.conn.executemany("DELETE FROM projects WHERE name = ?", [(name,) for name in removed])
+
+            rows = []
+            for result in load_project_files(changed, raw=True, workers=workers):
+                mtime_ns, size = stats[result.name]
+                if result.error:
+                    rows.append((result.name, mtime_ns, size, None, None, result.error))
+                    continue
+                info = normalize_project_info(result.name, result.details)
+                rows.append((
+                    result.name, mtime_ns, size,
+                    json.dumps(info, default=str), json.dumps(result.details, default=str), None,
+                ))
+            self.conn.executemany("INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+            self._mark_refreshed(projects_dir, commit)
+
+        if changed or removed:
+            logger.info(f"Project index updated: {len(changed)} re-parsed, {len(removed)} removed")
+        return len(changed) + len(removed)
+
+    def names(self) -> list[str]:
+        """
+        Returns the sorted list of indexed project names.
+        """
+        return [row[0] for row in self.conn.execute("SELECT name FROM projects ORDER BY name")]
+
+    def get(self, project_name: str, raw: bool = False) -> Optional[dict[str, Any]]:
+        """
+        Returns indexed metadata for a project, or None if it is unknown or failed to parse.
+        """
+        column = "raw" if raw else "info"
+        row = self.conn.execute(f"SELECT {column} FROM projects WHERE name = ?", (project_name,)).fetchone()
+        if row is None or row[0] is None:
+            get_metrics().incr("index.misses")
+            return None
+        get_metrics().incr("index.hits")
+        return json.loads(row[0])
+
+    def iter_details(self, raw: bool = False) -> Iterator[dict[str, Any]]:
+        """
+        Yields metadata for every successfully parsed project, sorted by name.
+        """
+        column = "raw" if raw else "info"
+        for (value,) in self.conn.execute(f"SELECT {column} FROM projects WHERE {column} IS NOT NULL ORDER BY name"):
+            yield json.loads(value)
+
+_index_instance = None
+
+def get_project_index() -> ProjectIndex:
+    global _index_instance
+    if _index_instance is None:
+        _index_instance = ProjectIndex()
+    return _index_instance
+
+def changes_since(manager, indexed_commit: Optional[str], commit: Optional[str]) -> Optional["ChangeSet"]:
+    """
+    Returns the projects changed between the commit an index was built at and the clone's HEAD,
+    for an incremental refresh, or None if they cannot be told.
+    """
+    changes = manager.last_changes
+    if commit and indexed_commit and indexed_commit != commit and (changes is None or changes.old_commit != indexed_commit):
+        # Another process synced the clone. Every snapshot is a fresh checkout, so file
+        # mtimes cannot tell what changed; ask git instead.
+        try:
+            changes = manager.diff_projects(indexed_commit, commit)
+        except Exception as e:
+            logger.debug(f"Could not diff {indexed_commit}..{commit}: {e}")
+    return changes
+
+def get_fresh_index() -> Optional[ProjectIndex]:
+    """
+    Returns the shared index refreshed against the local clone, or None if no clone is usable.
+    """
+    from ossfuzz_kit.utils import get_repo_manager
+
+    try:
+        manager = get_repo_manager()
+        projects_dir = manager.get_projects_dir()
+        try:
+            commit = manager.head_commit()
+        except Exception:
+            commit = None
+
+        index = get_project_index()
+        changes = changes_since(manager, index.commit, commit)
+        with get_metrics().span("index.refresh") as span:
+            span["reparsed"] = index.refresh(projects_dir, commit, changes=changes)
+        return index
+    except Exception as e:
+        logger.warning(f"Project index unavailable: {e}")
+        return None
+
+def open_cached_index() -> ProjectIndex:
+    """
+    Returns the on-disk index as it is, without refreshing it against the clone, touching git
+    or the network. Raises if no index has been built yet.
+    """
+    index = get_project_index()
+    if not index.db_path.exists() or not index.built:
+        raise RuntimeError("No cached project index yet; run once without --cached to build it")
+    return index
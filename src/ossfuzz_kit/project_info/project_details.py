@@ -3,45 +3,34 @@ import yaml
 import logging
 from typing import Any
 
-from ossfuzz_kit.utils import fetch_from_url, get_repo_manager
+from ossfuzz_kit.utils import fetch_from_url, get_repo_manager, FetchError
+from ossfuzz_kit.config import PROJECT_YAML_URL
+from ossfuzz_kit.metrics import get_metrics
 
 logger = logging.getLogger("ossfuzz_kit")
 
-def get_project_info(project_name: str, raw: bool = False, use_fallback: bool = True) -> dict[str, Any]:
+# libyaml's C loader is several times faster than the pure-Python one; fall back when it isn't built in.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def load_yaml(stream) -> Any:
     """
-    Retrieves project metadata from OSS-Fuzz Project's `project.yaml`
+    Safely parses YAML text or a file object, preferring the C loader when available.
+    """
+    with get_metrics().span("yaml.parse"):
+        return yaml.load(stream, Loader=YamlLoader)
+
+def normalize_project_info(project_name: str, data: Any, raw: bool = False) -> dict[str, Any]:
+    """
+    Converts a parsed `project.yaml` document into the structure returned by `get_project_info`.
 
     Args:
         project_name: Name of the OSS-Fuzz project.
+        data: Parsed YAML document.
         raw: If True, return full YAML contents merged with name.
 
     Returns:
         Dict with structured metadata or raw YAML merged.
     """
-    try:
-        manager = get_repo_manager()
-        projects_dir = manager.get_projects_dir()
-        yaml_path = projects_dir / project_name / "project.yaml"
-
-        if not yaml_path.exists():
-            raise FileNotFoundError(f"Local file {yaml_path} does not exist")
-
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-
-    except Exception as e:
-        logger.warning(f"Failed to load project.yaml from local clone for '{project_name}': {e}")
-        url = f"https://raw.githubusercontent.com/google/oss-fuzz/master/projects/{project_name}/project.yaml"
-        logger.warning(f"Falling back to fetching project.yaml from remote: {url}")
-
-        try:
-            response = fetch_from_url(url, format="text")
-            data = yaml.safe_load(response)
-        except requests.RequestException as e:
-            raise RuntimeError(f"Failed to fetch project.yaml for {project_name}: {e}")
-        except yaml.YAMLError as e:
-            raise RuntimeError(f"Error parsing YAML for {project_name}: {e}")
-
     if not isinstance(data, dict):
         raise RuntimeError(f"Unexpected YAML format for {project_name}")
 
@@ -62,4 +51,49 @@ def get_project_info(project_name: str, raw: bool = False, use_fallback: bool =
             "repo": data.get("main_repo"),
             "primary_contact": data.get("primary_contact"),
             "vendor_ccs": data.get("vendor_ccs"),
-        }
\ No newline at end of file
+        }
+
+def get_project_info(project_name: str, raw: bool = False, use_fallback: bool = True) -> dict[str, Any]:
+    """
+    Retrieves project metadata from OSS-Fuzz Project's `project.yaml`
+
+    Args:
+        project_name: Name of the OSS-Fuzz project.
+        raw: If True, return full YAML contents merged with name.
+
+    Returns:
+        Dict with structured metadata or raw YAML merged.
+    """
+    try:
+        manager = get_repo_manager()
+        projects_dir = manager.get_projects_dir()
+
+        if manager.backend == "git":
+            data = load_yaml(manager.read_project_yaml(project_name))
+        else:
+            yaml_path = projects_dir / project_name / "project.yaml"
+
+            if not yaml_path.exists():
+                raise FileNotFoundError(f"Local file {yaml_path} does not exist")
+
+            with open(yaml_path, "r", encoding="utf-8") as f:
+                data = load_yaml(f)
+
+    except Exception as e:
+        logger.warning(f"Failed to load project.yaml from local clone for '{project_name}': {e}")
+        if not use_fallback:
+            raise RuntimeError(f"Could not load project.yaml for {project_name} from the local clone: {e}") from e
+
+        url = PROJECT_YAML_URL.format(project=project_name)
+        logger.warning(f"Falling back to fetching project.yaml from remote: {url}")
+        get_metrics().incr("project_info.remote_fallbacks")
+
+        try:
+            response = fetch_from_url(url, format="text")
+            data = load_yaml(response)
+        except (requests.RequestException, FetchError) as e:
+            raise RuntimeError(f"Failed to fetch project.yaml for {project_name}: {e}")
+        except yaml.YAMLError as e:
+            raise RuntimeError(f"Error parsing YAML for {project_name}: {e}")
+
+    return normalize_project_info(project_name, data, raw=raw)
\ No newline at end of file
@@ -0,0 +1,78 @@
+import logging
+from typing import Any
+
+logger = logging.getLogger("ossfuzz_kit")
+
+# The normalized fields of `normalize_project_info`, in order.
+PROJECT_FIELDS = (
+    "name", "language", "build_system", "fuzzing_engines", "sanitizers", "architectures",
+    "homepage", "repo", "primary_contact", "vendor_ccs",
+)
+
+# Fields with an inverted index. List fields match per element, scalar fields match the whole value.
+LIST_FIELDS = ("fuzzing_engines", "sanitizers", "architectures")
+SCALAR_FIELDS = ("language", "build_system")
+INDEXED_FIELDS = SCALAR_FIELDS + LIST_FIELDS
+
+# What OSS-Fuzz builds when a project.yaml leaves a list field out.
+PROJECT_DEFAULTS = {
+    "fuzzing_engines": ["libfuzzer", "afl", "honggfuzz", "centipede"],
+    "sanitizers": ["address", "undefined"],
+    "architectures": ["x86_64"],
+}
+
+OPERATORS = ("eq", "in", "contains")
+
+def _key(value: Any) -> Any:
+    return value.lower() if isinstance(value, str) else value
+
+def field_values(record: dict[str, Any], field: str, use_defaults: bool = True) -> set:
+    """
+    Returns the normalized set of values a record holds for `field`.
+
+    Sanitizer entries such as `{"memory": {"experimental": True}}` are reduced to their name.
+    """
+    value = record.get(field)
+    if field not in LIST_FIELDS:
+        return {_key(value)}
+
+    if not value and use_defaults:
+        value = PROJECT_DEFAULTS[field]
+    values = set()
+    for item in value or []:
+        if isinstance(item, dict):
+            values.update(_key(k) for k in item)
+        else:
+            values.add(_key(item))
+    return values
+
+def parse_filters(filters: dict[str, Any]) -> list[tuple[str, str, Any]]:
+    """
+    Splits `field=value` / `field__<op>=value` lookups into `(field, op, value)` triples.
+
+    Supported operators:
+        - `eq`: the field equals the value (list fields: contains it)
+        - `in`: the field equals any of the given values
+        - `contains`: the list field contains the value, or every value when given a list
+    """
+    parsed = []
+    for lookup, value in filters.items():
+        field, _, op = lookup.partition("__")
+        op = op or "eq"
+        if op not in OPERATORS:
+            raise ValueError(f"Unsupported lookup '{lookup}'. Expected one of: {', '.join(OPERATORS)}")
+        if op == "in" and isinstance(value, str):
+            value = [value]
+        parsed.append((field, op, value))
+    return parsed
+
+def matches(record: Any, field: str, op: str, value: Any, use_defaults: bool = True) -> bool:
+    """
+    Checks a single parsed lookup against a record, case-insensitively.
+    """
+    values = field_values(record, field, use_defaults)
+    if op == "in":
+        return any(_key(v) in values for v in value)
+    if op == "contains" and isinstance(value, (list, tuple, set)):
+        return all(_key(v) in values for v in value)
+    return _key(value) in values
@@ -0,0 +1,69 @@
+import tarfile
+import logging
+from typing import Iterator, Optional
+
+from ossfuzz_kit.config import ARCHIVE_URL
+from ossfuzz_kit.utils import stream_from_url
+from ossfuzz_kit.rate_limit import BULK
+from ossfuzz_kit.project_info.project_details import load_yaml, normalize_project_info
+from ossfuzz_kit.project_info.bulk_details import ProjectResult
+
+logger = logging.getLogger("ossfuzz_kit")
+
+ARCHIVE_HEADERS = {"User-Agent": "ossfuzz-kit"}
+
+def _project_member(member_name: str) -> Optional[tuple[str, str]]:
+    # Archive entries look like "oss-fuzz-<sha>/projects/<name>[/<file>]"; anything else is skipped.
+    parts = member_name.strip("/").split("/")
+    if len(parts) < 3 or parts[1] != "projects":
+        return None
+    return parts[2], "/".join(parts[3:])
+
+def iter_archive_project_details(fileobj, raw: bool = False) -> Iterator[ProjectResult]:
+    """
+    Stream-extracts `project.yaml` files from a gzipped OSS-Fuzz repository tarball.
+
+    The archive is read sequentially and only `projects/*/project.yaml` members are decompressed
+    into memory, one at a time; nothing is written to disk.
+    """
+    seen_dirs: set[str] = set()
+    loaded: set[str] = set()
+
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+        for member in archive:
+            parsed = _project_member(member.name)
+            if parsed is None:
+                continue
+            project_name, rel_path = parsed
+
+            if member.isdir() and not rel_path:
+                seen_dirs.add(project_name)
+                continue
+            if rel_path != "project.yaml" or not member.isfile():
+                continue
+
+            seen_dirs.add(project_name)
+            loaded.add(project_name)
+            try:
+                content = archive.extractfile(member).read().decode("utf-8")
+                yield ProjectResult(project_name, normalize_project_info(project_name, load_yaml(content), raw=raw), None)
+            except Exception as e:
+                yield ProjectResult(project_name, None, f"{type(e).__name__}: {e}")
+
+    for project_name in sorted(seen_dirs - loaded):
+        yield ProjectResult(project_name, None, "FileNotFoundError: project.yaml missing from archive")
+
+def iter_remote_project_details(raw: bool = False, url: str = ARCHIVE_URL) -> Iterator[ProjectResult]:
+    """
+    Loads every project's metadata with a single archive download instead of one request per project.
+
+    Args:
+        raw: If True, yield full YAML contents merged with name.
+        url: Location of the gzipped repository tarball.
+
+    Yields:
+        ProjectResult for each project in archive order.
+    """
+    logger.info(f"Streaming project metadata from {url}...")
+    with stream_from_url(url, headers=ARCHIVE_HEADERS, timeout=60, priority=BULK) as body:
+        yield from iter_archive_project_details(body, raw=raw)
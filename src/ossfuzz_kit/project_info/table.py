@@ -0,0 +1,240 @@
+import sys
+import copy
+import logging
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from ossfuzz_kit.project_info.query import (
+    INDEXED_FIELDS, LIST_FIELDS, PROJECT_FIELDS as FIELDS, _key, field_values, matches, parse_filters,
+)
+
+logger = logging.getLogger("ossfuzz_kit")
+
+# Fields stored as tuples; `vendor_ccs` keeps None apart from an empty list.
+_TUPLE_FIELDS = LIST_FIELDS + ("vendor_ccs",)
+
+def _freeze(value: Any) -> Any:
+    # Hashable stand-in for list items, so equal tuples can be shared between records.
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+class ProjectInfo:
+    """
+    Compact record of one project's normalized metadata.
+
+    List fields are tuples shared between every record holding the same values, and strings
+    such as languages and engines are interned, so a corpus of records costs a fraction of the
+    equivalent dicts. The raw `project.yaml` is not kept; `raw()` loads it on demand.
+    """
+
+    __slots__ = FIELDS + ("_raw_loader",)
+
+    def __init__(self, raw_loader: Optional[Callable[[str], Optional[dict]]] = None, **values: Any):
+        for field in FIELDS:
+            setattr(self, field, values.get(field))
+        self._raw_loader = raw_loader
+
+    @classmethod
+    def from_dict(
+        cls,
+        record: dict[str, Any],
+        raw_loader: Optional[Callable[[str], Optional[dict]]] = None,
+        _shared: Optional[dict] = None,
+    ) -> "ProjectInfo":
+        """
+        Builds a record from the dict returned by `get_project_info`.
+        """
+        shared = {} if _shared is None else _shared
+        values = {}
+        for field in FIELDS:
+            value = record.get(field)
+            if field in _TUPLE_FIELDS and value is not None:
+                items = tuple(_intern(v) for v in value)
+                value = shared.setdefault((field, _freeze(items)), items)
+            else:
+                value = _intern(value)
+            values[field] = value
+        return cls(raw_loader, **values)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """
+        Dict-style access, so records can be used wherever normalized dicts are expected.
+        """
+        return getattr(self, field) if field in FIELDS else default
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the record as the dict `get_project_info` returns.
+        """
+        record = {}
+        for field in FIELDS:
+            value = getattr(self, field)
+            if field in _TUPLE_FIELDS and value is not None:
+                value = [copy.deepcopy(v) if isinstance(v, dict) else v for v in value]
+            record[field] = value
+        return record
+
+    def raw(self) -> dict[str, Any]:
+        """
+        Loads the full `project.yaml` contents merged with the name.
+        """
+        if self._raw_loader is None:
+            raise RuntimeError(f"No raw metadata source for {self.name}")
+        data = self._raw_loader(self.name)
+        if data is None:
+            raise RuntimeError(f"Raw metadata for {self.name} is not available")
+        return data
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ProjectInfo):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ProjectInfo(name={self.name!r}, language={self.language!r})"
+
+class ProjectTable:
+    """
+    Every project's metadata as `ProjectInfo` records, with a row bitset per indexed value.
+
+    Each value of `language`, `build_system`, `fuzzing_engines`, `sanitizers` and `architectures`
+    maps to an integer whose bit `i` is set when row `i` holds it, so a filter is a handful of
+    bitwise operations over the whole corpus instead of a loop over records. Filters use the
+    lookups of `parse_filters`, e.g. `filter(language="c++", sanitizers__contains="memory")`;
+    string comparisons are case-insensitive, and filters on other fields are checked per remaining row.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[dict[str, Any]],
+        raw_loader: Optional[Callable[[str], Optional[dict]]] = None,
+        use_defaults: bool = True,
+    ):
+        """
+        Args:
+            records: Normalized project dicts, e.g. `ProjectIndex.iter_details()`. They are
+                consumed one at a time and not kept.
+            raw_loader: Returns a project's raw metadata by name, for `ProjectInfo.raw()`.
+            use_defaults: Treat an empty list field as the OSS-Fuzz default when filtering.
+        """
+        self.use_defaults = use_defaults
+        shared: dict = {}
+        rows = [ProjectInfo.from_dict(record, raw_loader, shared) for record in records]
+        # Rows in name order keep every result sorted without sorting it.
+        rows.sort(key=lambda info: info.name)
+
+        postings: dict[str, dict[Any, list[int]]] = {field: {} for field in INDEXED_FIELDS}
+        # Values are shared between rows (and kept alive by them), so their ids identify them.
+        seen: dict[tuple[str, int], list[list[int]]] = {}
+        for row, info in enumerate(rows):
+            for field in INDEXED_FIELDS:
+                value = getattr(info, field)
+                targets = seen.get((field, id(value)))
+                if targets is None:
+                    targets = [
+                        postings[field].setdefault(_intern(v), []) for v in field_values(info, field, use_defaults)
+                    ]
+                    seen[(field, id(value))] = targets
+                for target in targets:
+                    target.append(row)
+
+        self.rows = rows
+        self._row_of = {info.name: row for row, info in enumerate(rows)}
+        self._all = (1 << len(rows)) - 1
+        self.bitsets: dict[str, dict[Any, int]] = {
+            field: {value: self._to_bits(found) for value, found in values.items()}
+            for field, values in postings.items()
+        }
+
+    def _to_bits(self, rows: list[int]) -> int:
+        bitmap = bytearray((len(self.rows) + 7) // 8)
+        for row in rows:
+            bitmap[row >> 3] |= 1 << (row & 7)
+        return int.from_bytes(bitmap, "little")
+
+    def _iter_rows(self, bits: int) -> Iterator[int]:
+        for offset, byte in enumerate(bits.to_bytes((len(self.rows) + 7) // 8, "little")):
+            while byte:
+                low = byte & -byte
+                yield offset * 8 + low.bit_length() - 1
+                byte ^= low
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[ProjectInfo]:
+        return iter(self.rows)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._row_of
+
+    def names(self) -> list[str]:
+        return [info.name for info in self.rows]
+
+    def get(self, name: str) -> Optional[ProjectInfo]:
+        row = self._row_of.get(name)
+        return self.rows[row] if row is not None else None
+
+    def values(self, field: str) -> list:
+        """
+        Returns the distinct values seen for an indexed field.
+        """
+        if field not in self.bitsets:
+            raise ValueError(f"Field '{field}' is not indexed")
+        return sorted(self.bitsets[field], key=str)
+
+    def count(self, field: str) -> dict[Any, int]:
+        """
+        Returns how many projects hold each value of an indexed field.
+        """
+        if field not in self.bitsets:
+            raise ValueError(f"Field '{field}' is not indexed")
+        return {value: bits.bit_count() for value, bits in sorted(self.bitsets[field].items(), key=lambda i: str(i[0]))}
+
+    def _lookup(self, field: str, op: str, value: Any) -> int:
+        index = self.bitsets[field]
+        if op == "in":
+            bits = 0
+            for v in value:
+                bits |= index.get(_key(v), 0)
+            return bits
+        if op == "contains" and isinstance(value, (list, tuple, set)):
+            bits = self._all
+            for v in value:
+                bits &= index.get(_key(v), 0)
+            return bits
+        return index.get(_key(value), 0)
+
+    def mask(self, **filters: Any) -> int:
+        """
+        Returns the bitset of rows matching every filter.
+        """
+        parsed = parse_filters(filters)
+        bits = self._all
+        for field, op, value in sorted(parsed, key=lambda f: f[0] not in self.bitsets):
+            if field in self.bitsets:
+                bits &= self._lookup(field, op, value)
+            else:
+                bits = self._to_bits([
+                    row for row in self._iter_rows(bits) if matches(self.rows[row], field, op, value, self.use_defaults)
+                ])
+            if not bits:
+                break
+        return bits
+
+    def filter(self, **filters: Any) -> list[str]:
+        """
+        Returns the sorted names of projects matching every filter.
+        """
+        return [self.rows[row].name for row in self._iter_rows(self.mask(**filters))]
+
+    def query(self, **filters: Any) -> list[ProjectInfo]:
+        """
+        Returns the records of projects matching every filter, sorted by name.
+        """
+        return [self.rows[row] for row in self._iter_rows(self.mask(**filters))]
@@ -0,0 +1,194 @@
+import time
+import logging
+import subprocess
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+from ossfuzz_kit import config
+from ossfuzz_kit.metrics import get_metrics
+from ossfuzz_kit.sync_policy import OFFLINE, PINNED
+from ossfuzz_kit.utils import RepoManager, get_repo_manager
+from ossfuzz_kit.project_info.project_details import load_yaml, normalize_project_info
+from ossfuzz_kit.project_info.history import FIELDS
+
+logger = logging.getLogger("ossfuzz_kit")
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+class WatchEvent(NamedTuple):
+    """
+    One upstream change. `added` events carry the new metadata in `new`, `removed` events the
+    last known metadata in `old`, and `changed` events one `field` with its `old` and `new` value.
+    """
+    type: str
+    project: str
+    commit: str
+    field: Optional[str] = None
+    old: Any = None
+    new: Any = None
+
+    def to_dict(self) -> dict[str, Any]:
+        event = {"type": self.type, "project": self.project, "commit": self.commit}
+        if self.field is not None:
+            event["field"] = self.field
+        if self.type != ADDED:
+            event["old"] = self.old
+        if self.type != REMOVED:
+            event["new"] = self.new
+        return event
+
+class ProjectWatcher:
+    """
+    Turns upstream commits into project events.
+
+    The watcher keeps only the blob SHA of every `project.yaml` at the last commit it saw. On each
+    poll it asks the remote for its head (a conditional request, or `git ls-remote` for other
+    remotes), syncs the clone only when the head moved, lists the new blob SHAs from the tree, and
+    parses just the files whose SHA differs; the previous versions are read back from the object
+    store. Nothing else is re-read, so a long-running watcher costs one cheap request per poll.
+    """
+
+    def __init__(
+        self,
+        manager: Optional[RepoManager] = None,
+        fields: Optional[Iterable[str]] = None,
+        since_commit: Optional[str] = None,
+    ):
+        """
+        Args:
+            fields: The `get_project_info` fields compared for `changed` events (default: all).
+            since_commit: Report the changes since this commit on the first poll. By default the
+                watcher starts from the clone's current commit and reports only later changes.
+        """
+        self._manager = manager
+        self.fields = tuple(fields) if fields else FIELDS
+        unknown = [field for field in self.fields if field not in FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown field '{unknown[0]}'. Expected any of: {', '.join(FIELDS)}")
+        self.since_commit = since_commit
+        self.commit: Optional[str] = None
+        self.blobs: dict[str, str] = {}
+
+    @property
+    def manager(self) -> RepoManager:
+        return self._manager or get_repo_manager()
+
+    def start(self) -> str:
+        """
+        Makes sure the clone exists and records the commit the watcher starts from.
+        """
+        manager = self.manager
+        manager.get_projects_dir()
+        commit = self._resolve_since(manager) if self.since_commit else manager.resolve_commit()
+        self.blobs = manager.list_project_blobs(commit)
+        self.commit = commit
+        logger.info(f"Watching {len(self.blobs)} projects from {commit[:12]}")
+        return commit
+
+    def _resolve_since(self, manager: RepoManager) -> str:
+        try:
+            return manager.resolve_commit(self.since_commit)
+        except subprocess.CalledProcessError:
+            pass
+        # Older than the shallow clone's tip. Fetch just that commit; a name the remote will not
+        # serve directly (such as an abbreviated SHA) needs the full history instead.
+        logger.info(f"Fetching {self.since_commit} from upstream...")
+        try:
+            manager.fetch_commit(self.since_commit)
+        except subprocess.CalledProcessError:
+            manager.deepen()
+        return manager.resolve_commit(self.since_commit)
+
+    def _can_sync(self) -> bool:
+        manager = self.manager
+        return manager.sync_policy.mode not in (OFFLINE, PINNED) and not manager.read_only
+
+    def poll(self) -> list[WatchEvent]:
+        """
+        Checks upstream once and returns the events since the previous poll, in project order.
+        """
+        if self.commit is None:
+            self.start()
+        manager = self.manager
+
+        with get_metrics().span("watch.poll") as span:
+            if self._can_sync():
+                remote = manager.remote_commit()
+                if remote is not None and remote != manager.head_commit():
+                    manager.sync()
+            # Without syncing here, the clone may still have been moved by another process.
+            head = manager.head_commit()
+            if head == self.commit:
+                span["events"] = 0
+                return []
+
+            blobs = manager.list_project_blobs(head)
+            events = self.diff(self.blobs, blobs, head)
+            self.commit, self.blobs = head, blobs
+            span["events"] = len(events)
+
+        logger.info(f"Upstream moved to {head[:12]}: {len(events)} events")
+        return events
+
+    def _parse(self, project_name: str, blob: str) -> Optional[dict[str, Any]]:
+        try:
+            text = self.manager.object_reader.read_text(blob)
+            if text is None:
+                raise FileNotFoundError(f"blob {blob[:12]} is not in the object store")
+            return normalize_project_info(project_name, load_yaml(text))
+        except Exception as e:
+            logger.warning(f"Could not read {project_name}/project.yaml ({blob[:12]}): {e}")
+            return None
+
+    def diff(self, old_blobs: dict[str, str], new_blobs: dict[str, str], commit: str) -> list[WatchEvent]:
+        """
+        Compares two `{project: blob SHA}` maps, parsing only the files whose SHA differs.
+        """
+        events = []
+        for name in sorted(old_blobs.keys() | new_blobs.keys()):
+            old_blob, new_blob = old_blobs.get(name), new_blobs.get(name)
+            if old_blob == new_blob:
+                continue
+            if old_blob is None:
+                events.append(WatchEvent(ADDED, name, commit, new=self._parse(name, new_blob)))
+                continue
+            old = self._parse(name, old_blob)
+            if new_blob is None:
+                events.append(WatchEvent(REMOVED, name, commit, old=old))
+                continue
+
+            new = self._parse(name, new_blob) or {}
+            old = old or {}
+            for field in self.fields:
+                if old.get(field) != new.get(field):
+                    events.append(WatchEvent(CHANGED, name, commit, field=field, old=old.get(field), new=new.get(field)))
+        return events
+
+def watch(
+    interval: Optional[float] = None,
+    fields: Optional[Iterable[str]] = None,
+    since_commit: Optional[str] = None,
+    max_polls: Optional[int] = None,
+    manager: Optional[RepoManager] = None,
+) -> Iterator[WatchEvent]:
+    """
+    Polls upstream every `interval` seconds (default `config.WATCH_INTERVAL`) and yields the
+    events of every poll as they are found. Runs until the caller stops iterating, or for
+    `max_polls` polls.
+    """
+    interval = config.WATCH_INTERVAL if interval is None else interval
+    watcher = ProjectWatcher(manager=manager, fields=fields, since_commit=since_commit)
+    watcher.start()
+
+    polls = 0
+    while True:
+        try:
+            yield from watcher.poll()
+        except Exception as e:
+            # A failed check (network, lock, git) is retried on the next poll.
+            logger.warning(f"Watch poll failed: {e}")
+        polls += 1
+        if max_polls is not None and polls >= max_polls:
+            return
+        time.sleep(interval)
@@ -0,0 +1,229 @@
+import os
+import time
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+from ossfuzz_kit import config
+from ossfuzz_kit.metrics import get_metrics
+
+logger = logging.getLogger("ossfuzz_kit")
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = (INTERACTIVE, BULK)
+
+class RateLimitError(Exception):
+    """Raised when a request would have to wait longer than allowed for the rate limit to reset."""
+    pass
+
+class _Bucket:
+    # Rate-limit state of one host, as last reported by its response headers.
+    __slots__ = ("limit", "remaining", "reset", "blocked_until", "last_request")
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+        self.blocked_until = 0.0
+        self.last_request = 0.0
+
+def _header_int(headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def parse_retry_after(value: Optional[str], now: float) -> Optional[float]:
+    """
+    Parses a `Retry-After` header (delay in seconds or an HTTP date) into seconds to wait.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError):
+        return None
+
+class RateLimitScheduler:
+    """
+    Paces requests per host according to the rate-limit headers the host sends back.
+
+    GitHub reports its budget in `X-RateLimit-Limit`/`-Remaining`/`-Reset`. When the budget runs
+    out, or a response is throttled (429, or 403 with `Retry-After` or no budget left), callers
+    sleep until the reset time instead of failing. A share of the budget (`reserve`) is kept for
+    interactive lookups: bulk requests stop short of it, are spread evenly over the rest of the
+    window once the budget runs low, and always yield to interactive requests that are waiting.
+
+    One scheduler is shared by every fetch in the process; see `get_scheduler()`.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        reserve: float = config.RATE_LIMIT_RESERVE,
+        max_wait: float = config.RATE_LIMIT_MAX_WAIT,
+    ):
+        self._token = token
+        self.reserve = reserve
+        self.max_wait = max_wait
+        self._cond = threading.Condition()
+        self._buckets: dict[str, _Bucket] = {}
+        self._waiting = {priority: 0 for priority in PRIORITIES}
+
+    def set_token(self, token: Optional[str]) -> None:
+        self._token = token
+
+    @property
+    def token(self) -> Optional[str]:
+        """
+        The GitHub token: the one set on the scheduler, then `config.GITHUB_TOKEN`, then the
+        `OSSFUZZ_KIT_GITHUB_TOKEN` and `GITHUB_TOKEN` environment variables.
+        """
+        if self._token:
+            return self._token
+        if config.GITHUB_TOKEN:
+            return config.GITHUB_TOKEN
+        for name in config.GITHUB_TOKEN_ENV_VARS:
+            if os.environ.get(name):
+                return os.environ[name]
+        return None
+
+    def auth_headers(self, url: str) -> dict[str, str]:
+        """
+        Returns the `Authorization` header for GitHub API URLs when a token is configured.
+        The token is never sent to other hosts.
+        """
+        token = self.token
+        if token and urlsplit(url).hostname in config.GITHUB_AUTH_HOSTS:
+            return {"Authorization": f"Bearer {token}"}
+        return {}
+
+    def _floor(self, bucket: _Bucket, priority: str) -> int:
+        if priority == INTERACTIVE or not bucket.limit:
+            return 0
+        return max(1, int(bucket.limit * self.reserve))
+
+    def delay(self, url: str, priority: str = INTERACTIVE, now: Optional[float] = None) -> float:
+        """
+        Returns how many seconds a request to `url` should wait before being sent.
+        """
+        now = time.time() if now is None else now
+        bucket = self._buckets.get(urlsplit(url).hostname)
+        if bucket is None:
+            return 0.0
+
+        wait = max(0.0, bucket.blocked_until - now)
+        if bucket.remaining is None or bucket.reset is None or now >= bucket.reset:
+            return wait
+
+        floor = self._floor(bucket, priority)
+        if bucket.remaining <= floor:
+            return max(wait, bucket.reset - now)
+        if priority == BULK and bucket.limit and bucket.remaining < bucket.limit * config.RATE_LIMIT_PACE_BELOW:
+            # Spread what is left of the bulk share over the rest of the window.
+            interval = (bucket.reset - now) / (bucket.remaining - floor)
+            wait = max(wait, bucket.last_request + interval - now)
+        return wait
+
+    def acquire(self, url: str, priority: str = INTERACTIVE, max_wait: Optional[float] = None) -> None:
+        """
+        Blocks until a request to `url` may be sent.
+
+        Raises:
+            RateLimitError: If the wait would exceed `max_wait` seconds (default: the scheduler's `max_wait`).
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{priority}'. Expected one of: {', '.join(PRIORITIES)}")
+        host = urlsplit(url).hostname
+        max_wait = self.max_wait if max_wait is None else max_wait
+        deadline = time.time() + max_wait
+        waited = 0.0
+
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    now = time.time()
+                    if priority == BULK and self._waiting[INTERACTIVE]:
+                        wait = config.RATE_LIMIT_POLL_INTERVAL
+                    else:
+                        wait = self.delay(url, priority, now)
+                        if wait <= 0:
+                            break
+                    if now + wait > deadline:
+                        raise RateLimitError(f"Rate limit for {host} would require waiting {wait:.0f}s")
+                    if waited == 0:
+                        logger.info(f"Rate limit for {host}: waiting up to {wait:.1f}s ({priority})")
+                    self._cond.wait(timeout=wait)
+                    waited += time.time() - now
+
+                bucket = self._buckets.get(host)
+                if bucket is not None:
+                    bucket.last_request = now
+                    if bucket.remaining is not None and bucket.remaining > 0:
+                        # Optimistically spend one request until the response reports the real count.
+                        bucket.remaining -= 1
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+
+        if waited:
+            get_metrics().incr("http.rate_limit_wait_s", waited)
+
+    def update(self, url: str, status_code: int, headers) -> Optional[float]:
+        """
+        Records the rate-limit headers of a response.
+
+        Returns:
+            Seconds to back off if the response was throttled, otherwise None. The next
+            `acquire()` for the host waits at least that long.
+        """
+        now = time.time()
+        limit = _header_int(headers, "X-RateLimit-Limit")
+        remaining = _header_int(headers, "X-RateLimit-Remaining")
+        reset = _header_int(headers, "X-RateLimit-Reset")
+        retry_after = parse_retry_after(headers.get("Retry-After"), now)
+        throttled = status_code == 429 or (status_code == 403 and (remaining == 0 or retry_after is not None))
+
+        if not throttled and limit is None and remaining is None and retry_after is None:
+            return None
+
+        with self._cond:
+            bucket = self._buckets.setdefault(urlsplit(url).hostname, _Bucket())
+            if limit is not None:
+                bucket.limit = limit
+            if remaining is not None:
+                bucket.remaining = remaining
+            if reset is not None:
+                bucket.reset = float(reset)
+
+            delay = None
+            if throttled:
+                if retry_after is not None:
+                    delay = retry_after
+                elif remaining == 0 and bucket.reset is not None:
+                    delay = max(0.0, bucket.reset - now)
+                else:
+                    delay = config.RATE_LIMIT_DEFAULT_BACKOFF
+                bucket.blocked_until = max(bucket.blocked_until, now + delay)
+            self._cond.notify_all()
+        return delay
+
+_scheduler_instance = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> RateLimitScheduler:
+    global _scheduler_instance
+    if _scheduler_instance is None:
+        with _scheduler_lock:
+            if _scheduler_instance is None:
+                _scheduler_instance = RateLimitScheduler()
+    return _scheduler_instance
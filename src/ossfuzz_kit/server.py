@@ -0,0 +1,256 @@
+import os
+import json
+import time
+import logging
+import threading
+import socketserver
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, NamedTuple, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from ossfuzz_kit import config
+from ossfuzz_kit.cache import get_cache_dir
+from ossfuzz_kit.server_client import SERVER_STATE_FILE
+from ossfuzz_kit.project_info.index import get_fresh_index, get_project_index
+from ossfuzz_kit.project_info.table import ProjectTable
+
+logger = logging.getLogger("ossfuzz_kit")
+
+# Query parameters that are options rather than filters.
+_OPTIONS = ("limit", "raw")
+
+class _Snapshot(NamedTuple):
+    commit: Optional[str]
+    names: list[str]
+    table: ProjectTable
+
+class ProjectService:
+    """
+    The state behind `ossfuzz-kit serve`: the project index held in memory as a `ProjectTable`.
+
+    Requests read whichever snapshot is current and never wait for git or the network. A
+    background thread refreshes the index through the repo manager's sync policy and swaps in
+    a new snapshot when the clone has moved to another commit.
+    """
+
+    def __init__(self, refresh_interval: timedelta = timedelta(seconds=config.SERVER_REFRESH_INTERVAL)):
+        self.refresh_interval = refresh_interval
+        self.refreshed_at: Optional[float] = None
+        self._snapshot: Optional[_Snapshot] = None
+        # Held only to swap snapshots. Each thread reads the SQLite index over its own
+        # connection, so raw lookups never wait for a refresh in progress.
+        self._swap_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def snapshot(self) -> _Snapshot:
+        if self._snapshot is None:
+            raise RuntimeError("The project index has not been loaded yet")
+        return self._snapshot
+
+    def refresh(self) -> bool:
+        """
+        Brings the index up to date and rebuilds the table if the commit changed.
+
+        Returns:
+            True if a new snapshot was swapped in.
+        """
+        index = get_fresh_index()
+        if index is None:
+            raise RuntimeError("The project index is unavailable")
+        self.refreshed_at = time.time()
+        current = self._snapshot
+        if current is not None and index.commit is not None and index.commit == current.commit:
+            return False
+        snapshot = _Snapshot(index.commit, index.names(), ProjectTable(index.iter_details(), raw_loader=self._load_raw))
+
+        with self._swap_lock:
+            if self._snapshot is not current:
+                # Another refresh swapped in a snapshot of the same or a newer index meanwhile.
+                return False
+            self._snapshot = snapshot
+        logger.info(f"Serving {len(snapshot.table)} projects at {(snapshot.commit or 'unknown')[:12]}")
+        return True
+
+    def _load_raw(self, name: str) -> Optional[dict]:
+        return get_project_index().get(name, raw=True)
+
+    def start(self) -> None:
+        """
+        Starts refreshing in a daemon thread every `refresh_interval`.
+        """
+        def run():
+            while not self._stop.wait(self.refresh_interval.total_seconds()):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.warning(f"Index refresh failed, still serving the previous snapshot: {e}")
+
+        self._thread = threading.Thread(target=run, name="ossfuzz-kit-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def handle(self, path: str, params: dict[str, list[str]]) -> tuple[int, Any]:
+        """
+        Answers one request.
+
+        Routes:
+            - `/health`: the served commit, project count and last refresh time.
+            - `/projects`: names of projects matching the filters in the query string.
+            - `/projects/<name>`: a project's details (`?raw=1` for the full `project.yaml`).
+            - `/query`: details of projects matching the filters.
+
+        Filters use the `parse_filters` lookups, e.g. `?language=c%2B%2B&sanitizers__contains=memory`;
+        a repeated parameter passes a list. `limit` caps the number of results.
+
+        Returns:
+            The HTTP status and the JSON-serializable body.
+        """
+        snapshot = self.snapshot
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+
+        if parts == ["health"]:
+            return 200, {
+                "status": "ok",
+                "commit": snapshot.commit,
+                "projects": len(snapshot.names),
+                "refreshed_at": self.refreshed_at,
+            }
+
+        if len(parts) == 2 and parts[0] == "projects":
+            info = snapshot.table.get(parts[1])
+            if info is None:
+                return 404, {"error": f"Project {parts[1]} is not in the index"}
+            raw = params.get("raw", ["0"])[-1].lower() in ("1", "true", "yes")
+            return 200, info.raw() if raw else info.to_dict()
+
+        if parts in (["projects"], ["query"]):
+            filters = {key: values[0] if len(values) == 1 else values for key, values in params.items() if key not in _OPTIONS}
+            try:
+                limit = int(params["limit"][-1]) if "limit" in params else None
+                if filters:
+                    matches = snapshot.table.query(**filters)
+                    names = [info.name for info in matches]
+                else:
+                    names = snapshot.names
+            except ValueError as e:
+                return 400, {"error": str(e)}
+
+            body = {"commit": snapshot.commit, "count": len(names)}
+            if parts == ["projects"]:
+                body["projects"] = names[:limit]
+            else:
+                records = matches if filters else snapshot.table.rows
+                body["projects"] = [info.to_dict() for info in records[:limit]]
+            return 200, body
+
+        return 404, {"error": f"Unknown path {path}"}
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "ossfuzz-kit"
+    # Responses are a single small write; don't let them wait on delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug(f"serve: {format % args}")
+
+    def do_GET(self):
+        parsed = urlsplit(self.path)
+        try:
+            status, body = self.server.service.handle(parsed.path, parse_qs(parsed.query))
+        except Exception as e:
+            logger.warning(f"Request {self.path} failed: {e}")
+            status, body = 500, {"error": str(e)}
+
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class UnixQueryRequestHandler(QueryRequestHandler):
+    # TCP_NODELAY does not exist for Unix sockets.
+    disable_nagle_algorithm = False
+
+    def address_string(self) -> str:
+        return "unix"
+
+class QueryServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, service: ProjectService, host: str = config.SERVER_HOST, port: int = config.SERVER_PORT):
+        super().__init__((host, port), QueryRequestHandler)
+        self.service = service
+
+    @property
+    def address(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+class UnixQueryServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    # Unix sockets refuse connections beyond the backlog instead of retrying like TCP does,
+    # so socketserver's default of 5 fails bursts of concurrent lookups.
+    request_queue_size = 128
+
+    def __init__(self, service: ProjectService, socket_path: Path):
+        self.socket_path = Path(socket_path)
+        if self.socket_path.is_socket():
+            # A socket left behind by a server that did not shut down cleanly.
+            self.socket_path.unlink()
+        super().__init__(str(self.socket_path), UnixQueryRequestHandler)
+        self.service = service
+
+    @property
+    def address(self) -> str:
+        return f"unix:{self.socket_path}"
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+def serve(
+    host: str = config.SERVER_HOST,
+    port: int = config.SERVER_PORT,
+    socket_path: Optional[Path] = None,
+    refresh_interval: timedelta = timedelta(seconds=config.SERVER_REFRESH_INTERVAL),
+    on_ready=None,
+) -> None:
+    """
+    Loads the index and answers queries until interrupted. The server's address is written to
+    the cache directory, where the CLI picks it up to forward lookups.
+
+    Args:
+        socket_path: Listen on this Unix socket instead of `host`:`port`.
+        on_ready: Called with the server once it accepts requests.
+    """
+    service = ProjectService(refresh_interval)
+    service.refresh()
+    server = UnixQueryServer(service, socket_path) if socket_path else QueryServer(service, host, port)
+    state_path = get_cache_dir() / SERVER_STATE_FILE
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps({"address": server.address, "pid": os.getpid()}), encoding="utf-8")
+
+    service.start()
+    logger.info(f"Serving OSS-Fuzz project queries on {server.address}")
+    if on_ready is not None:
+        on_ready(server)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+        try:
+            if json.loads(state_path.read_text(encoding="utf-8")).get("pid") == os.getpid():
+                state_path.unlink()
+        except (OSError, ValueError):
+            pass
@@ -0,0 +1,84 @@
+import os
+import json
+import socket
+from typing import Any, Optional
+from urllib.parse import urlencode, urlsplit
+
+from ossfuzz_kit import config
+from ossfuzz_kit.cache import get_cache_dir
+
+# Written by a running `ossfuzz-kit serve` so CLI invocations can find it.
+SERVER_STATE_FILE = "server.json"
+
+class ServerError(Exception):
+    """Raised when the query server answers a request with an error status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"Server returned {status}: {message}")
+        self.status = status
+
+def find_server() -> Optional[str]:
+    """
+    Returns the address of the query server to use: `$OSSFUZZ_KIT_SERVER`, then the one a local
+    server advertises in the cache directory, or None.
+    """
+    address = os.environ.get(config.SERVER_ENV_VAR)
+    if address:
+        return address
+    try:
+        state = json.loads((get_cache_dir() / SERVER_STATE_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state.get("address")
+
+def call_server(address: str, path: str, params: Optional[dict] = None, timeout: float = config.SERVER_TIMEOUT) -> Any:
+    """
+    Sends a GET request to the query server and returns the decoded JSON body.
+
+    Plain sockets are used instead of `http.client`, whose import alone costs more than a
+    forwarded lookup takes.
+
+    Args:
+        address: `http://host:port` or `unix:/path/to/socket`.
+        path: Request path, e.g. `/projects/curl`.
+        params: Query parameters; list values are sent as repeated parameters.
+
+    Raises:
+        OSError: If the server cannot be reached.
+        ServerError: If the server answers with an error status.
+    """
+    if params:
+        path = f"{path}?{urlencode(params, doseq=True)}"
+
+    if address.startswith("unix:"):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(address[len("unix:"):])
+        except OSError:
+            sock.close()
+            raise
+        host = "localhost"
+    else:
+        parts = urlsplit(address)
+        sock = socket.create_connection((parts.hostname, parts.port or 80), timeout=timeout)
+        host = parts.netloc
+
+    with sock:
+        sock.sendall(f"GET {path} HTTP/1.0\r\nHost: {host}\r\nAccept: application/json\r\n\r\n".encode("utf-8"))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    head, _, body = b"".join(chunks).partition(b"\r\n\r\n")
+    try:
+        status = int(head.split(b" ", 2)[1])
+        payload = json.loads(body) if body else None
+    except (IndexError, ValueError) as e:
+        raise ServerError(502, f"malformed response: {e}")
+    if status != 200:
+        raise ServerError(status, payload.get("error", "") if isinstance(payload, dict) else "")
+    return payload
@@ -0,0 +1,74 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+class SQLiteStore:
+    """
+    Base for the SQLite databases kept in the cache directory, each with a `meta` key/value table.
+
+    Every thread gets its own connection, so a write transaction in one thread (a refresh, an
+    ingest) never interleaves with reads running on another thread's cursor; SQLite's own file
+    locking orders them. Subclasses set `SCHEMA`, and optionally `SCHEMA_VERSION` together with
+    the `TABLES` that are emptied when a database written by another version is opened.
+    """
+
+    SCHEMA = ""
+    SCHEMA_VERSION: Optional[str] = None
+    TABLES: tuple[str, ...] = ()
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[tuple[threading.Thread, sqlite3.Connection]] = []
+        self._ready = False
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """
+        This thread's connection, opened on first use.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Closed from whichever thread calls close(), hence check_same_thread=False.
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            with self._lock:
+                # Threads of finished pools never come back for their connections.
+                for thread, old in self._connections:
+                    if not thread.is_alive():
+                        old.close()
+                self._connections = [(thread, old) for thread, old in self._connections if thread.is_alive()]
+                self._connections.append((threading.current_thread(), conn))
+                self._local.conn = conn
+                if not self._ready:
+                    self._setup(conn)
+                    self._ready = True
+        return conn
+
+    def _setup(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(self.SCHEMA)
+        if self.SCHEMA_VERSION is not None and self._get_meta("schema") != self.SCHEMA_VERSION:
+            with conn:
+                for table in (*self.TABLES, "meta"):
+                    conn.execute(f"DELETE FROM {table}")
+                self._set_meta("schema", self.SCHEMA_VERSION)
+
+    def close(self) -> None:
+        """
+        Closes the connections of every thread; the next use opens new ones.
+        """
+        with self._lock:
+            for _, conn in self._connections:
+                conn.close()
+            self._connections = []
+            self._local = threading.local()
+            self._ready = False
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
@@ -0,0 +1,86 @@
+import os
+import re
+from datetime import timedelta
+from typing import Optional
+
+SYNC_POLICY_ENV = "OSSFUZZ_KIT_SYNC"
+DEFAULT_INTERVAL = timedelta(minutes=10)
+
+OFFLINE = "offline"
+TTL = "ttl"
+BACKGROUND = "background"
+PINNED = "pinned"
+MODES = (OFFLINE, TTL, BACKGROUND, PINNED)
+
+_DURATION_UNITS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Parses durations such as `90`, `30s`, `10m`, `2h` or `1d`.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", value.lower())
+    if not match:
+        raise ValueError(f"Invalid duration: '{value}'")
+    return timedelta(seconds=float(match.group(1)) * _DURATION_UNITS[match.group(2)])
+
+class SyncPolicy:
+    """
+    Decides when the local clone is checked against, and synced with, the remote.
+
+    Modes:
+        - `offline`: never touch git remotes or the network; use the clone as-is.
+        - `ttl=<duration>`: check the remote at most once per interval, blocking the caller (default `ttl=10m`).
+        - `background[=<duration>]`: like `ttl`, but check and sync in a daemon thread while
+          callers keep using the existing clone.
+        - `pinned=<commit>`: keep the clone at a fixed commit and never follow the branch.
+    """
+
+    def __init__(self, mode: str = TTL, interval: timedelta = DEFAULT_INTERVAL, commit: Optional[str] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown sync policy '{mode}'. Expected one of: {', '.join(MODES)}")
+        if mode == PINNED and not commit:
+            raise ValueError("The 'pinned' sync policy requires a commit, e.g. 'pinned=<sha>'")
+        self.mode = mode
+        self.interval = interval
+        self.commit = commit
+
+    @classmethod
+    def parse(cls, value: str) -> "SyncPolicy":
+        """
+        Builds a policy from its string form, e.g. `offline`, `ttl=1h`, `background=5m` or `pinned=<sha>`.
+        """
+        mode, _, arg = value.strip().partition("=")
+        mode = mode.strip().lower()
+        arg = arg.strip()
+
+        if mode == PINNED:
+            return cls(PINNED, commit=arg)
+        if mode in (TTL, BACKGROUND):
+            return cls(mode, interval=parse_duration(arg) if arg else DEFAULT_INTERVAL)
+        if mode == OFFLINE and not arg:
+            return cls(OFFLINE)
+        raise ValueError(f"Invalid sync policy: '{value}'")
+
+    @classmethod
+    def from_env(cls) -> "SyncPolicy":
+        """
+        Reads the policy from the `OSSFUZZ_KIT_SYNC` environment variable, defaulting to `ttl=10m`.
+        """
+        value = os.environ.get(SYNC_POLICY_ENV)
+        return cls.parse(value) if value else cls()
+
+    def __str__(self) -> str:
+        if self.mode == OFFLINE:
+            return OFFLINE
+        if self.mode == PINNED:
+            return f"{PINNED}={self.commit}"
+        return f"{self.mode}={int(self.interval.total_seconds())}s"
+
+    def __repr__(self) -> str:
+        return f"SyncPolicy('{self}')"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SyncPolicy) and str(self) == str(other)
+
+    def __hash__(self) -> int:
+        return hash(str(self))
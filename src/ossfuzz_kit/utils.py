@@ -1,22 +1,58 @@
+import os
+import json
+import shutil
+import functools
+import threading
 import subprocess
 import time
 import sys
 import requests
 import logging
+from contextlib import contextmanager
 from urllib.parse import urlparse
-from tqdm import tqdm
 from pathlib import Path
-from typing import Optional
-from datetime import datetime, timedelta
+from typing import Any, BinaryIO, Iterable, Iterator, NamedTuple, Optional, Union
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
-from ossfuzz_kit.config import OSS_FUZZ_REPO_URL, CLONE_DEPTH, DEFAULT_TIMEOUT, DEFAULT_HEADERS
+from ossfuzz_kit.config import (
+    OSS_FUZZ_REPO_URL, BACKENDS, CLONE_DEPTH, DEFAULT_TIMEOUT, DEFAULT_HEADERS,
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, RATE_LIMIT_MAX_THROTTLED,
+)
+from ossfuzz_kit.cache import get_clone_dir
+from ossfuzz_kit.http_cache import get_http_cache
+from ossfuzz_kit.sync_policy import SyncPolicy, OFFLINE, BACKGROUND, PINNED
+from ossfuzz_kit.git_objects import GitObjectReader
+from ossfuzz_kit.file_lock import FileLock
+from ossfuzz_kit.metrics import get_metrics
+from ossfuzz_kit.rate_limit import INTERACTIVE, RateLimitError, get_scheduler
 
 logger = logging.getLogger("ossfuzz_kit")
 
 class FetchError(Exception):
     """Raised when a URL fetch fails."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status of the failed response, if the server answered.
+        self.status_code = status_code
+
+_session: Optional[requests.Session] = None
+
+def get_session() -> requests.Session:
+    """
+    Returns the process-wide HTTP session, so connections are pooled and kept alive across fetches.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
 
 def fetch_from_url(
     url: str,
@@ -24,46 +60,194 @@ def fetch_from_url(
     timeout: int = DEFAULT_TIMEOUT,
     max_retries: int = 3,
     format: str = "text",
+    use_cache: bool = True,
+    priority: str = INTERACTIVE,
+    max_wait: Optional[float] = None,
 ) -> str:
     """
     Fetches raw text content from a URL with retries and exponential backoff.
+
+    Responses carrying an ETag or Last-Modified header are kept in the HTTP cache, and later
+    fetches of the same URL are sent as conditional requests; a `304 Not Modified` is then
+    answered from the cached body.
+
+    Requests go through the shared rate-limit scheduler: GitHub API requests carry the configured
+    token, wait while the budget is exhausted, and a throttled response (403/429) is retried after
+    the advertised delay without counting against `max_retries`.
+
+    Args:
+        priority: `"interactive"` for single lookups or `"bulk"` for batch jobs, which leave part
+            of the budget to interactive lookups and yield to them.
+        max_wait: Longest to wait for a rate limit, in seconds; defaults to the scheduler's.
     """
+    if format not in ("text", "json", "bytes"):
+        raise ValueError(f"Unsupported format: {format}")
+
     backoff_factor = 0.5
-    headers = headers or DEFAULT_HEADERS
+    headers = dict(headers or DEFAULT_HEADERS)
+    metrics = get_metrics()
+    scheduler = get_scheduler()
+    if "Authorization" not in headers:
+        headers.update(scheduler.auth_headers(url))
+    cache = get_http_cache() if use_cache else None
+    cached = cache.get(url, headers.get("Accept")) if cache else None
+    if cached:
+        headers.update(cached.conditional_headers())
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
+    with metrics.span("http.fetch", url=url, priority=priority) as span:
+        attempt, throttled = 1, 0
+        while True:
+            span["attempts"] = attempt + throttled
+            try:
+                scheduler.acquire(url, priority=priority, max_wait=max_wait)
+                response = get_session().get(url, headers=headers, timeout=timeout)
+                _record_response(response, len(response.content))
+
+                backoff = scheduler.update(url, response.status_code, response.headers)
+                if backoff is not None:
+                    metrics.incr("http.rate_limited")
+                    throttled += 1
+                    if throttled > RATE_LIMIT_MAX_THROTTLED:
+                        raise FetchError(f"Failed to fetch {url}: still rate limited after {throttled} attempts")
+                    logger.warning(f"Rate limited fetching {url}; retrying in {backoff:.0f}s...")
+                    continue
+
+                if cached and response.status_code == 304:
+                    logger.debug(f"Not modified, serving cached response for {url}")
+                    metrics.incr("http_cache.hits")
+                    cache.touch(url, headers.get("Accept"))
+                    if format == "text":
+                        return cached.text
+                    elif format == "json":
+                        return json.loads(cached.content)
+                    return cached.content
+
+                response.raise_for_status()
+
+                if cache:
+                    metrics.incr("http_cache.misses")
+                    cache.put(
+                        url,
+                        response.content,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        encoding=response.encoding,
+                        accept=headers.get("Accept"),
+                    )
 
-            if format == "text":
-                return response.text
-            elif format == "json":
-                return response.json()
-            elif format == "bytes":
+                if format == "text":
+                    return response.text
+                elif format == "json":
+                    return response.json()
                 return response.content
-            else:
-                raise ValueError(f"Unsupported format: {format}")
 
+            except RateLimitError as e:
+                raise FetchError(f"Failed to fetch {url}: {e}")
+            except RequestException as e:
+                metrics.incr("http.errors")
+                if attempt == max_retries:
+                    raise FetchError(f"Failed to fetch {url} after {max_retries} attempts: {e}")
+                metrics.incr("http.retries")
+                wait_time = backoff_factor * (2 ** (attempt - 1))
+                logger.warning(f"[Retry {attempt}] Failed to fetch {url}. Retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
+                attempt += 1
+
+def _record_response(response: requests.Response, size: int) -> None:
+    # Counts every response, whatever its status, and keeps the latest GitHub rate-limit budget.
+    metrics = get_metrics()
+    metrics.incr("http.requests")
+    metrics.incr("http.bytes_received", size)
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is not None:
+        metrics.set_gauge("http.rate_limit_remaining", int(remaining))
+
+@contextmanager
+def stream_from_url(
+    url: str, headers: dict = None, timeout: int = DEFAULT_TIMEOUT, priority: str = INTERACTIVE
+) -> Iterator[BinaryIO]:
+    """
+    Opens a URL as a streaming, file-like body so large downloads are never held in memory.
+    Throttled responses are retried once the rate-limit scheduler allows, like `fetch_from_url`.
+    """
+    headers = dict(headers or DEFAULT_HEADERS)
+    scheduler = get_scheduler()
+    if "Authorization" not in headers:
+        headers.update(scheduler.auth_headers(url))
+
+    with get_metrics().span("http.stream", url=url, priority=priority):
+        try:
+            for throttled in range(RATE_LIMIT_MAX_THROTTLED + 1):
+                scheduler.acquire(url, priority=priority)
+                response = get_session().get(url, headers=headers, timeout=timeout, stream=True)
+                if scheduler.update(url, response.status_code, response.headers) is None:
+                    break
+                get_metrics().incr("http.rate_limited")
+                response.close()
+            response.raise_for_status()
+        except RateLimitError as e:
+            raise FetchError(f"Failed to open stream for {url}: {e}")
         except RequestException as e:
+            get_metrics().incr("http.errors")
+            status_code = e.response.status_code if e.response is not None else None
+            raise FetchError(f"Failed to open stream for {url}: {e}", status_code=status_code)
+
+        try:
+            response.raw.decode_content = True
+            yield response.raw
+        finally:
+            _record_response(response, response.raw.tell())
+            response.close()
+
+async def async_fetch_from_url(
+    url: str,
+    headers: dict = None,
+    timeout: int = DEFAULT_TIMEOUT,
+    max_retries: int = 3,
+    format: str = "text",
+    executor: Optional[Executor] = None,
+    priority: str = INTERACTIVE,
+) -> Any:
+    """
+    Awaitable counterpart of `fetch_from_url`.
+
+    Each attempt runs on `executor` over the shared pooled session, and the backoff between
+    attempts is an `asyncio.sleep`, so a retrying fetch never holds up other requests.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    backoff_factor = 0.5
+    attempt_fetch = functools.partial(
+        fetch_from_url, url, headers=headers, timeout=timeout, max_retries=1, format=format, priority=priority
+    )
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            return await loop.run_in_executor(executor, attempt_fetch)
+        except FetchError as e:
             if attempt == max_retries:
                 raise FetchError(f"Failed to fetch {url} after {max_retries} attempts: {e}")
+            get_metrics().incr("http.retries")
             wait_time = backoff_factor * (2 ** (attempt - 1))
             logger.warning(f"[Retry {attempt}] Failed to fetch {url}. Retrying in {wait_time:.1f}s...")
-            time.sleep(wait_time)
+            await asyncio.sleep(wait_time)
 
-def shallow_clone_repo(repo_url: str, depth: int = 1, sparse_dir: str = "projects") -> Path:
+def shallow_clone_repo(
+    repo_url: str, depth: int = 1, sparse_dir: str = "projects", clone_path: Optional[Path] = None
+) -> Path:
     """
-    Shallow clones a git repository and returns the path to the clone.
+    Shallow clones a git repository and returns the path to the sparse directory of the clone.
     """
-    dest_dir = "data/oss-fuzz"
-    clone_path = Path(dest_dir)
+    clone_path = Path(clone_path) if clone_path else get_clone_dir()
 
     if (clone_path / sparse_dir).exists():
         return clone_path / sparse_dir
 
     clone_path.parent.mkdir(parents=True, exist_ok=True)
 
+    from tqdm import tqdm
+
     try:
         logger.info(f"Cloning {repo_url} (sparse: '{sparse_dir}')...")
 
@@ -90,80 +274,680 @@ def shallow_clone_repo(repo_url: str, depth: int = 1, sparse_dir: str = "project
         logger.error(f"Git clone failed... Check your connection")
         raise RuntimeError(f"Git clone failed: {e}")
 
+class CommitChanges(NamedTuple):
+    """
+    The `project.yaml` files touched by one commit. A `None` blob marks a deleted file.
+    """
+    commit: str
+    timestamp: int
+    changes: list[tuple[str, Optional[str]]]
+
+class ChangeSet(NamedTuple):
+    """
+    Projects that changed between two commits of the local clone.
+    """
+    old_commit: Optional[str]
+    new_commit: Optional[str]
+    added: list[str]
+    removed: list[str]
+    modified: list[str]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    @property
+    def projects(self) -> set[str]:
+        """
+        Every project touched by the change.
+        """
+        return set(self.added) | set(self.removed) | set(self.modified)
+
+# Set in a clone's git config once its history has been deepened.
+_KEEP_HISTORY_KEY = "ossfuzz-kit.keepHistory"
+
 class RepoManager:
     """
     Manages the local shallow clone of the OSS-Fuzz repository.
+
+    Safe to share between threads and between processes using the same clone:
+    cloning, syncing and deepening hold an exclusive file lock next to the clone. The clone is
+    built in a staging directory and renamed into place, and every sync checks the new commit
+    out into its own snapshot worktree under `<clone>-trees/`, then atomically repoints the
+    `current` symlink at it. Readers never take the lock and never see a half-updated tree;
+    the previous snapshot is kept until the next sync for readers still walking it.
+
+    The clone lives in the cache directory unless another is configured (see `ossfuzz_kit.cache`).
+    A clone this process cannot write to, e.g. one shared on a read-only mount, is used as-is
+    and never synced.
     """
 
-    def __init__(self, repo_url: str = OSS_FUZZ_REPO_URL, sparse_dir: str = "projects", clone_depth: int = CLONE_DEPTH):
+    def __init__(
+        self,
+        repo_url: str = OSS_FUZZ_REPO_URL,
+        sparse_dir: str = "projects",
+        clone_depth: int = CLONE_DEPTH,
+        branch: str = "master",
+        sync_policy: Optional[Union[SyncPolicy, str]] = None,
+        backend: str = "worktree",
+        clone_path: Optional[Path] = None,
+    ):
         self.repo_url = repo_url
         self.sparse_dir = sparse_dir
         self.clone_depth = clone_depth
-        self.clone_path: Path = Path("data/oss-fuzz")
+        self.branch = branch
+        self.clone_path: Path = Path(clone_path) if clone_path else get_clone_dir()
         self._last_checked: Optional[datetime] = None
-        self._check_interval = timedelta(minutes=10)
         self.headers = DEFAULT_HEADERS
+        self.last_changes: Optional[ChangeSet] = None
+        self._lock_guard = threading.Lock()
+        self._repo_lock: Optional[FileLock] = None
+        self._background_thread: Optional[threading.Thread] = None
+        self._pinned_verified = False
+        self._object_reader: Optional[GitObjectReader] = None
+        self.set_sync_policy(sync_policy)
+        self.set_backend(backend)
 
-    def is_up_to_date(self) -> bool:
+    def set_backend(self, backend: str) -> None:
         """
-        Checks whether the local repository is up-to-date with the remote main branch
+        Selects where project files are read from: `"worktree"` or `"git"`.
         """
-        if self._last_checked and datetime.now() - self._last_checked < self._check_interval:
-            return True
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Expected one of: {', '.join(BACKENDS)}")
+        self.backend = backend
+
+    def set_sync_policy(self, sync_policy: Optional[Union[SyncPolicy, str]] = None) -> None:
+        """
+        Sets when the clone is checked against the remote. Accepts a `SyncPolicy`, its string
+        form (e.g. `"offline"`, `"ttl=1h"`, `"background"`, `"pinned=<sha>"`), or None to read
+        the `OSSFUZZ_KIT_SYNC` environment variable.
+        """
+        if sync_policy is None:
+            sync_policy = SyncPolicy.from_env()
+        elif isinstance(sync_policy, str):
+            sync_policy = SyncPolicy.parse(sync_policy)
+        self.sync_policy = sync_policy
+        self._pinned_verified = False
+
+    def set_clone_path(self, clone_path: Path) -> None:
+        """
+        Points the manager at another clone, forgetting what it knew about the previous one.
+        """
+        if self._object_reader is not None:
+            self._object_reader.close()
+            self._object_reader = None
+        self.clone_path = Path(clone_path)
+        self._last_checked = None
+        self.last_changes = None
+        self._pinned_verified = False
+
+    @property
+    def read_only(self) -> bool:
+        """
+        Whether the clone exists but this process may not update it (nor take its lock).
+        """
+        return self.clone_path.exists() and not (
+            os.access(self.clone_path, os.W_OK) and os.access(self.clone_path.parent, os.W_OK)
+        )
+
+    @property
+    def repo_lock(self) -> FileLock:
+        """
+        The lock serializing clone, sync and deepen across threads and processes.
+        """
+        path = self.clone_path.with_name(f"{self.clone_path.name}.lock")
+        with self._lock_guard:
+            if self._repo_lock is None or self._repo_lock.path != path:
+                self._repo_lock = FileLock(path)
+            return self._repo_lock
+
+    @property
+    def trees_path(self) -> Path:
+        return self.clone_path.with_name(f"{self.clone_path.name}-trees")
+
+    @property
+    def checkout_path(self) -> Path:
+        """
+        The working tree to read from: the current synced snapshot, or the clone's own checkout
+        before the first sync. The returned path names one snapshot, so it keeps showing the same
+        tree even if a newer one is swapped in while the caller reads it.
+        """
+        try:
+            return self.trees_path / os.readlink(self.trees_path / "current")
+        except OSError:
+            return self.clone_path
+
+    def _git(self, *args: str, cwd: Optional[Path] = None, input: Optional[str] = None) -> str:
+        result = subprocess.run(
+            ["git", "-C", str(cwd or self.clone_path), *args],
+            check=True,
+            capture_output=True,
+            text=True,
+            input=input,
+        )
+        return result.stdout.strip()
+
+    def list_projects_at(self, commit: str) -> set[str]:
+        """
+        Returns the project directory names present in the sparse directory at a commit.
+        """
+        output = self._git("ls-tree", "--name-only", commit, f"{self.sparse_dir}/")
+        return {line.split("/", 1)[1] for line in output.splitlines() if "/" in line}
+
+    def diff_projects(self, old_commit: str, new_commit: str) -> ChangeSet:
+        """
+        Computes which projects were added, removed or modified between two commits.
+        Only trees are compared, so no file contents need to be present locally.
+        """
+        output = self._git("diff", "--name-only", "--no-renames", old_commit, new_commit, "--", f"{self.sparse_dir}/")
+        touched = {line.split("/")[1] for line in output.splitlines() if line.count("/") >= 2}
+
+        old_projects = self.list_projects_at(old_commit)
+        new_projects = self.list_projects_at(new_commit)
+
+        return ChangeSet(
+            old_commit=old_commit,
+            new_commit=new_commit,
+            added=sorted(new_projects - old_projects),
+            removed=sorted(old_projects - new_projects),
+            modified=sorted(touched & old_projects & new_projects),
+        )
+
+    def sync(self, commit: Optional[str] = None) -> ChangeSet:
+        """
+        Brings the local clone up to the remote branch and reports which projects changed.
+
+        Only the new commits and their trees are fetched (the clone is blobless), and the
+        working tree is then moved to the fetched commit, which downloads file contents for
+        the sparse directory alone. A fresh clone reports every project as added.
+
+        Args:
+            commit: Move to this commit instead of the branch head. Defaults to the pinned
+                commit under a `pinned` sync policy.
+        """
+        if self.read_only:
+            raise RuntimeError(f"{self.clone_path} is read-only and cannot be synced")
+        with self.repo_lock, get_metrics().span("git.sync") as span:
+            changes = self._sync(commit)
+            span["projects_changed"] = len(changes.projects)
+            return changes
+
+    def _sync(self, commit: Optional[str]) -> ChangeSet:
+        sparse_path = self.clone_path / self.sparse_dir
+        if commit is None and self.sync_policy.mode == PINNED:
+            commit = self.sync_policy.commit
 
+        if not sparse_path.exists():
+            self._clone()
+            if commit:
+                self._git("fetch", "--depth", str(self.clone_depth), "origin", commit)
+                self._checkout(self._git("rev-parse", "FETCH_HEAD"))
+            new_commit = self.head_commit()
+            changes = ChangeSet(None, new_commit, sorted(self.list_projects_at(new_commit)), [], [])
+            self.last_changes = changes
+            return changes
+
+        old_commit = self.head_commit()
+        target = commit or self.branch
+        logger.debug(f"Fetching {target} into local clone...")
+        if self._keeps_history():
+            # A plain fetch stops at commits the clone already has instead of re-shallowing it,
+            # so history fetched for the timeline is not downloaded again on the next update.
+            self._git("fetch", "origin", target)
+        else:
+            self._git("fetch", "--depth", str(self.clone_depth), "origin", target)
+        new_commit = self._git("rev-parse", "FETCH_HEAD")
         self._last_checked = datetime.now()
 
+        if new_commit == old_commit:
+            changes = ChangeSet(old_commit, new_commit, [], [], [])
+        else:
+            changes = self.diff_projects(old_commit, new_commit)
+            self._checkout(new_commit)
+            logger.info(
+                f"Synced {old_commit[:12]} -> {new_commit[:12]}: {len(changes.added)} added, "
+                f"{len(changes.removed)} removed, {len(changes.modified)} modified"
+            )
+
+        self.last_changes = changes
+        return changes
+
+    def _checkout(self, commit: str) -> None:
+        """
+        Checks `commit` out into its own sparse snapshot worktree and atomically makes it current.
+        Snapshots older than the one being replaced are removed.
+        """
+        trees = self.trees_path
+        trees.mkdir(parents=True, exist_ok=True)
+        target = trees / commit
+
+        if not target.exists():
+            staging = trees / f".{commit}.tmp"
+            self._git("worktree", "prune")
+            if staging.exists():
+                shutil.rmtree(staging)
+                self._git("worktree", "prune")
+            self._git("worktree", "add", "--no-checkout", "--detach", str(staging.resolve()), commit)
+            self._git("sparse-checkout", "set", self.sparse_dir, cwd=staging)
+            self._git("reset", "-q", "--hard", cwd=staging)
+            self._git("worktree", "move", str(staging.resolve()), str(target.resolve()))
+
+        link = trees / "current"
         try:
-            local_commit = subprocess.check_output(
-                ["git", "-C", str(self.clone_path), "rev-parse", "HEAD"],
-                text=True
-            ).strip()
+            previous = os.readlink(link)
+        except OSError:
+            previous = None
+        staged_link = trees / f".current.{os.getpid()}.{threading.get_ident()}"
+        os.symlink(commit, staged_link)
+        os.replace(staged_link, link)
+        self._prune_snapshots(keep={commit, previous})
 
-            parsed = urlparse(self.repo_url)
-            owner_repo = parsed.path.lstrip("/").removesuffix(".git")
-            api_url = f"https://api.github.com/repos/{owner_repo}/branches/master"
+    def _prune_snapshots(self, keep: set) -> None:
+        for path in self.trees_path.iterdir():
+            if path.name in keep or path.name == "current" or path.name.startswith("."):
+                continue
+            try:
+                self._git("worktree", "remove", "--force", str(path.resolve()))
+            except subprocess.CalledProcessError:
+                shutil.rmtree(path, ignore_errors=True)
+        self._git("worktree", "prune")
+
+    def _keeps_history(self) -> bool:
+        return self._git("config", "--type=bool", "--default=false", "--get", _KEEP_HISTORY_KEY) == "true"
 
-            remote_data = fetch_from_url(api_url, headers=self.headers, max_retries=1, format="json")
-            remote_commit = remote_data["commit"]["sha"]
+    def history_start(self) -> Optional[int]:
+        """
+        Returns the commit time of the oldest first-parent commit of HEAD in the local history,
+        or None when the clone is not shallow and holds the whole history.
+        """
+        if self._git("rev-parse", "--is-shallow-repository") != "true":
+            return None
+        output = self._git("log", "--first-parent", "--max-parents=0", "--format=%ct", self.head_commit())
+        return min(int(line) for line in output.splitlines()) if output else None
 
-            return local_commit == remote_commit
+    def deepen(self, since: Optional[datetime] = None) -> None:
+        """
+        Extends the shallow clone's history back to `since`, or to the first commit when None.
+        Only commits and trees are downloaded; file contents stay on the remote until read.
+        History the clone already has is never cut back.
+        """
+        if self.read_only:
+            raise RuntimeError(f"{self.clone_path} is read-only and cannot be deepened")
+        with self.repo_lock, get_metrics().span("git.deepen"):
+            # Recorded in the clone, so syncs in every process keep the deeper history from now on.
+            self._git("config", _KEEP_HISTORY_KEY, "true")
+            if self._git("rev-parse", "--is-shallow-repository") != "true":
+                return
+            if since is None:
+                self._git("fetch", "--unshallow", "origin", self.branch)
+                return
+            # Naive datetimes are UTC. The offset is always passed on: git reads a bare date and
+            # time in the host's local zone.
+            since = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+            # `--shallow-since` also shortens a deeper history, so only use it to go further back.
+            start = self.history_start()
+            if start is not None and start <= since.timestamp():
+                return
+            self._git("fetch", f"--shallow-since={since.isoformat()}", "origin", self.branch)
 
-        except (FetchError, subprocess.CalledProcessError, KeyError) as e:
+    def fetch_commit(self, commit: str, depth: int = 1) -> None:
+        """
+        Fetches a commit the shallow clone does not have, e.g. one older than its tip, with `depth`
+        commits of history. `commit` must be a full SHA or a name the remote advertises.
+        """
+        if self.read_only:
+            raise RuntimeError(f"{self.clone_path} is read-only and cannot fetch {commit}")
+        with self.repo_lock, get_metrics().span("git.fetch_commit"):
+            self._git("fetch", f"--depth={depth}", "origin", commit)
+
+    def prefetch_blobs(self, blobs: Iterable[str]) -> None:
+        """
+        Downloads the given blobs into a blobless clone with a single fetch, instead of leaving each
+        read to fetch its own blob from the promisor remote. Does nothing in a clone with every blob.
+        """
+        blobs = sorted(set(blobs))
+        if not blobs or self._git("config", "--type=bool", "--default=false", "--get", "remote.origin.promisor") != "true":
+            return
+        if self.read_only:
+            raise RuntimeError(f"{self.clone_path} is read-only and cannot fetch missing blobs")
+        with self.repo_lock, get_metrics().span("git.prefetch_blobs"):
+            # The same request git makes for a lazy fetch, only with every blob at once.
+            self._git(
+                "-c", "fetch.negotiationAlgorithm=noop",
+                "fetch", "--no-tags", "--no-write-fetch-head", "--recurse-submodules=no",
+                "--filter=blob:none", "--stdin", "origin",
+                input="\n".join(blobs) + "\n",
+            )
+
+    def last_commit_time_before(self, timestamp: int) -> Optional[int]:
+        """
+        Returns the commit time of the newest first-parent commit at or before `timestamp`
+        (epoch seconds) in the local history, or None when the clone does not reach back that far.
+        """
+        output = self._git("log", "-1", "--first-parent", "--format=%ct", f"--before={timestamp}", self.head_commit())
+        return int(output) if output else None
+
+    def install_clone(self, source: Path, commit: Optional[str] = None, replace: bool = False) -> str:
+        """
+        Moves a ready-made clone (e.g. unpacked from a seed tarball) into place and makes `commit`
+        the current snapshot. Only objects already in the clone are used, so this works offline.
+
+        Args:
+            source: The clone to move; it must have the sparse directory checked out.
+            commit: Commit to check out, e.g. the one current when the clone was packed.
+                Defaults to the clone's HEAD.
+            replace: Remove an existing clone and its snapshots instead of failing.
+
+        Returns:
+            The commit now checked out.
+        """
+        source = Path(source)
+        if not (source / self.sparse_dir).is_dir():
+            raise RuntimeError(f"{source} has no '{self.sparse_dir}' checkout; it is not an OSS-Fuzz clone")
+        try:
+            self._git("rev-parse", "--verify", "HEAD^{commit}", cwd=source)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"{source} is not a usable clone: {e.stderr.strip()}")
+
+        with self.repo_lock:
+            if self.clone_path.exists():
+                if not replace:
+                    raise RuntimeError(f"{self.clone_path} already exists")
+                self.set_clone_path(self.clone_path)
+                shutil.rmtree(self.trees_path, ignore_errors=True)
+                shutil.rmtree(self.clone_path)
+            self.clone_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(source), str(self.clone_path))
+            # Worktrees recorded by the clone lived on the machine it was packed on.
+            self._git("worktree", "prune")
+            shutil.rmtree(self.trees_path, ignore_errors=True)
+
+            if commit:
+                try:
+                    self._checkout(self._git("rev-parse", "--verify", f"{commit}^{{commit}}"))
+                except subprocess.CalledProcessError as e:
+                    logger.warning(f"Could not check out {commit[:12]} from the seeded clone, using its HEAD: {e.stderr.strip()}")
+            return self.head_commit()
+
+    def compact(self) -> None:
+        """
+        Frees space in the clone: removes snapshots other than the current one, staging
+        directories left by interrupted clones and syncs, and objects no longer reachable.
+        """
+        with self.repo_lock:
+            for path in self.clone_path.parent.glob(f".{self.clone_path.name}.clone-*"):
+                shutil.rmtree(path, ignore_errors=True)
+            if self.trees_path.is_dir():
+                try:
+                    current = os.readlink(self.trees_path / "current")
+                except OSError:
+                    current = None
+                for path in self.trees_path.glob(".*"):
+                    if path.is_dir() and not path.is_symlink():
+                        shutil.rmtree(path, ignore_errors=True)
+                    else:
+                        path.unlink(missing_ok=True)
+                self._prune_snapshots(keep={current})
+            self._git("worktree", "prune")
+            self._git("reflog", "expire", "--expire=now", "--all")
+            self._git("gc", "--quiet", "--prune=now")
+
+    def iter_project_changes(self, since_commit: Optional[str] = None) -> Iterator[CommitChanges]:
+        """
+        Walks the first-parent history oldest-first and yields the `project.yaml` changes of each commit.
+
+        Args:
+            since_commit: Only walk commits after this one. Defaults to the whole local history;
+                the oldest (shallow boundary) commit then lists every project as added.
+        """
+        head = self.head_commit()
+        rev_range = f"{since_commit}..{head}" if since_commit else head
+        proc = subprocess.Popen(
+            [
+                "git", "-C", str(self.clone_path), "log", "--reverse", "--first-parent", "-m", "--root",
+                "--no-renames", "--raw", "--no-abbrev", "--format=@%H %ct", rev_range,
+                "--", f":(glob){self.sparse_dir}/*/project.yaml",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+
+        current: Optional[CommitChanges] = None
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line.startswith("@"):
+                    if current is not None:
+                        yield current
+                    commit, timestamp = line[1:].split()
+                    current = CommitChanges(commit, int(timestamp), [])
+                elif line.startswith(":") and current is not None:
+                    meta, _, path = line.partition("\t")
+                    new_blob, status = meta.split()[3], meta.split()[4]
+                    project_name = path.split("/")[1]
+                    current.changes.append((project_name, None if status.startswith("D") else new_blob))
+            if current is not None:
+                yield current
+        finally:
+            proc.stdout.close()
+            if proc.wait() != 0 and current is None:
+                raise RuntimeError(f"git log failed in {self.clone_path}")
+
+    def head_commit(self) -> str:
+        """
+        Returns the commit SHA currently checked out in the local clone.
+        """
+        return subprocess.check_output(
+            ["git", "-C", str(self.checkout_path), "rev-parse", "HEAD"],
+            text=True
+        ).strip()
+
+    @property
+    def object_reader(self) -> GitObjectReader:
+        """
+        The shared `git cat-file --batch` reader over the clone's object store.
+        """
+        if self._object_reader is None:
+            self._object_reader = GitObjectReader(self.clone_path)
+        return self._object_reader
+
+    def resolve_commit(self, rev: str = "HEAD") -> str:
+        """
+        Resolves a revision to a full commit SHA. `HEAD` is the current snapshot's commit.
+        """
+        if rev == "HEAD":
+            return self.head_commit()
+        return self._git("rev-parse", "--verify", f"{rev}^{{commit}}")
+
+    def list_project_blobs(self, commit: Optional[str] = None) -> dict[str, str]:
+        """
+        Maps each project name to the blob SHA of its `project.yaml` at a commit (default: HEAD).
+        """
+        commit = commit or self.resolve_commit()
+        entries = self.object_reader.ls_tree(commit, f"{self.sparse_dir}/", recursive=True)
+        return {
+            entry.path.split("/")[1]: entry.sha
+            for entry in entries
+            if entry.type == "blob" and entry.path.count("/") == 2 and entry.path.endswith("/project.yaml")
+        }
+
+    def read_project_yaml(self, project_name: str, commit: Optional[str] = None) -> str:
+        """
+        Reads a project's `project.yaml` from the object store at a commit (default: HEAD).
+        """
+        commit = commit or self.resolve_commit()
+        text = self.object_reader.read_text(f"{commit}:{self.sparse_dir}/{project_name}/project.yaml")
+        if text is None:
+            raise FileNotFoundError(f"{self.sparse_dir}/{project_name}/project.yaml does not exist at {commit[:12]}")
+        return text
+
+    def iter_project_yamls(self, commit: Optional[str] = None) -> Iterator[tuple[str, str]]:
+        """
+        Yields `(project_name, project.yaml text)` for every project at a single commit (default: HEAD),
+        so the whole listing is consistent even if the checkout moves meanwhile.
+        """
+        commit = commit or self.resolve_commit()
+        blobs = self.list_project_blobs(commit)
+        for project_name in sorted(blobs):
+            data = self.object_reader.read(blobs[project_name])
+            if data is not None:
+                yield project_name, data.decode("utf-8")
+
+    def _check_due(self) -> bool:
+        return not (self._last_checked and datetime.now() - self._last_checked < self.sync_policy.interval)
+
+    def _matches_remote(self) -> bool:
+        with get_metrics().span("git.remote_check"):
+            return self._compare_remote()
+
+    def _compare_remote(self) -> bool:
+        try:
+            local_commit = self.head_commit()
+        except subprocess.CalledProcessError as e:
             logger.warning(f"Failed to check if repo is up-to-date: {e}")
             return False
+        remote_commit = self.remote_commit()
+        return remote_commit is not None and local_commit == remote_commit
+
+    def remote_commit(self) -> Optional[str]:
+        """
+        Returns the commit at the head of the remote branch, or None if it cannot be determined.
+
+        GitHub repositories are asked through the branches API; repeated checks are conditional
+        requests, and a `304 Not Modified` does not count against the rate limit. Other remotes
+        (mirrors, `file://` URLs) are asked with `git ls-remote`.
+        """
+        parsed = urlparse(self.repo_url)
+        try:
+            if parsed.hostname != "github.com":
+                output = self._git("ls-remote", self.repo_url, f"refs/heads/{self.branch}")
+                return output.split()[0] if output else None
+
+            owner_repo = parsed.path.lstrip("/").removesuffix(".git")
+            api_url = f"https://api.github.com/repos/{owner_repo}/branches/{self.branch}"
+
+            # A freshness check never waits out a rate limit; the existing clone is good enough meanwhile.
+            remote_data = fetch_from_url(api_url, headers=self.headers, max_retries=1, format="json", max_wait=0)
+            return remote_data["commit"]["sha"]
+
+        except (FetchError, subprocess.CalledProcessError, KeyError) as e:
+            logger.warning(f"Failed to check if repo is up-to-date: {e}")
+            return None
+
+    def is_up_to_date(self) -> bool:
+        """
+        Checks whether the local repository is up-to-date with the remote main branch.
+        The remote is asked at most once per sync policy interval.
+        """
+        if not self._check_due():
+            get_metrics().incr("git.remote_check_skipped")
+            return True
+
+        self._last_checked = datetime.now()
+        return self._matches_remote()
+
+    def _background_sync(self) -> None:
+        try:
+            if not self._matches_remote():
+                self.sync()
+                logger.debug("Background sync finished.")
+        except Exception as e:
+            logger.warning(f"Background sync failed: {e}")
+
+    def _schedule_background_sync(self) -> None:
+        if not self._check_due():
+            return
+        if self._background_thread is not None and self._background_thread.is_alive():
+            return
+
+        self._last_checked = datetime.now()
+        self._background_thread = threading.Thread(
+            target=self._background_sync, name="ossfuzz-kit-sync", daemon=True
+        )
+        self._background_thread.start()
+
+    def _ensure_pinned(self) -> None:
+        if self._pinned_verified:
+            return
+        if not self.head_commit().startswith(self.sync_policy.commit):
+            self.sync()
+        self._pinned_verified = True
+
+    def _clone(self) -> Path:
+        sparse_path = self.clone_path / self.sparse_dir
+        with self.repo_lock:
+            if sparse_path.exists():
+                # Another thread or process finished cloning while we waited for the lock.
+                return sparse_path
+            if self.clone_path.exists():
+                raise RuntimeError(f"{self.clone_path} exists but is not a usable clone; remove it and retry")
+
+            staging = self.clone_path.with_name(f".{self.clone_path.name}.clone-{os.getpid()}")
+            shutil.rmtree(staging, ignore_errors=True)
+            try:
+                with get_metrics().span("git.clone"):
+                    shallow_clone_repo(
+                        repo_url=self.repo_url,
+                        depth=self.clone_depth,
+                        sparse_dir=self.sparse_dir,
+                        clone_path=staging,
+                    )
+                os.rename(staging, self.clone_path)
+                return sparse_path
+            except Exception as e:
+                shutil.rmtree(staging, ignore_errors=True)
+                logger.error(f"Failed to clone OSS-Fuzz repository: {e}")
+                raise RuntimeError(f"Failed to clone OSS-Fuzz repository: {e}")
+
+    def _try_sync(self) -> None:
+        # Readers never wait for a sync: if one is already running here or in another
+        # process, keep using the current snapshot.
+        if not self.repo_lock.acquire(blocking=False):
+            logger.debug("A sync is already in progress; using the current checkout.")
+            return
+        try:
+            self.sync()
+        finally:
+            self.repo_lock.release()
 
     def ensure_repo(self) -> Path:
         """
-        Ensures the repo is shallow-cloned and updated locally.
+        Ensures the repo is shallow-cloned and updated locally, as the sync policy allows.
         Falls back to using existing clone if update check or pull fails.
         """
+        with get_metrics().span("git.ensure_repo"):
+            return self._ensure_repo()
+
+    def _ensure_repo(self) -> Path:
         sparse_path = self.clone_path / self.sparse_dir
+        mode = self.sync_policy.mode
 
         if sparse_path.exists():
+            if mode == OFFLINE or self.read_only:
+                return self.checkout_path / self.sparse_dir
             try:
-                if not self.is_up_to_date():
+                if mode == PINNED:
+                    self._ensure_pinned()
+                elif mode == BACKGROUND:
+                    self._schedule_background_sync()
+                elif not self.is_up_to_date():
                     logger.debug("Updating local clone...")
-                    subprocess.run(
-                        ["git", "-C", str(self.clone_path), "pull", "--depth", str(self.clone_depth)],
-                        check=True,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
+                    self._try_sync()
                     logger.debug("Repository updated successfully.")
             except Exception as e:
                 logger.warning(f"Could not update repo: {e}")
                 logger.warning("Proceeding with existing local clone.")
-            return sparse_path
+            return self.checkout_path / self.sparse_dir
 
-        try:
-            return shallow_clone_repo(
-                repo_url=self.repo_url,
-                depth=self.clone_depth,
-                sparse_dir=self.sparse_dir
-            )
-        except Exception as e:
-            logger.error(f"Failed to clone OSS-Fuzz repository: {e}")
-            raise RuntimeError(f"Failed to clone OSS-Fuzz repository: {e}")
+        if mode == OFFLINE:
+            raise RuntimeError(f"No local clone at {self.clone_path} and the sync policy is offline")
+        if mode == PINNED:
+            self.sync()
+            self._pinned_verified = True
+        else:
+            self._clone()
+        return self.checkout_path / self.sparse_dir
 
     def get_projects_dir(self) -> Path:
         """
@@ -176,9 +960,12 @@ class RepoManager:
         return path
 
 _repo_instance = None
+_repo_instance_lock = threading.Lock()
 
 def get_repo_manager():
     global _repo_instance
     if _repo_instance is None:
-        _repo_instance = RepoManager()
+        with _repo_instance_lock:
+            if _repo_instance is None:
+                _repo_instance = RepoManager()
     return _repo_instance
\ No newline at end of file
@@ -0,0 +1,38 @@
+import pytest
+
+from ossfuzz_kit import config
+from ossfuzz_kit.utils import RepoManager
+
+from helpers import git
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    # Never touch the real user cache; tests that need a specific layout set their own paths.
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("OSSFUZZ_KIT_CACHE_DIR", str(cache_dir))
+    monkeypatch.delenv("OSSFUZZ_KIT_CLONE_DIR", raising=False)
+    monkeypatch.setattr(config, "CACHE_DIR", None)
+    monkeypatch.setattr(config, "CLONE_DIR", None)
+    return cache_dir
+
+@pytest.fixture
+def upstream_repo(tmp_path):
+    upstream = tmp_path / "upstream"
+    for name in ("alpha", "beta", "gamma"):
+        (upstream / "projects" / name).mkdir(parents=True)
+        (upstream / "projects" / name / "project.yaml").write_text(f"language: c\nhomepage: https://{name}.example\n")
+    (upstream / "infra").mkdir()
+    (upstream / "infra" / "README").write_text("infra")
+    git(upstream, "init", "-q")
+    git(upstream, "add", ".")
+    git(upstream, "commit", "-qm", "initial")
+    return upstream
+
+@pytest.fixture
+def synced_manager(tmp_path, upstream_repo):
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", "--depth", "1", "--sparse", f"file://{upstream_repo}", str(clone))
+    git(clone, "sparse-checkout", "set", "projects")
+    manager = RepoManager(repo_url=f"file://{upstream_repo}")
+    manager.clone_path = clone
+    return manager
@@ -0,0 +1,7 @@
+import subprocess
+
+def git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", "-c", "init.defaultBranch=master", *args],
+        cwd=cwd, check=True, capture_output=True,
+    )
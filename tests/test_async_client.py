@@ -0,0 +1,78 @@
+import asyncio
+import pytest
+from unittest import mock
+
+from ossfuzz_kit.async_client import AsyncOSSFuzzClient
+from ossfuzz_kit.utils import FetchError
+
+@pytest.fixture
+def projects_dir(tmp_path):
+    projects_dir = tmp_path / "projects"
+    (projects_dir / "local").mkdir(parents=True)
+    (projects_dir / "local" / "project.yaml").write_text("language: c\n")
+    return projects_dir
+
+@pytest.fixture
+def mock_repo_manager(projects_dir):
+    with mock.patch("ossfuzz_kit.async_client.get_repo_manager") as mock_get_repo_manager:
+        mock_get_repo_manager.return_value.get_projects_dir.return_value = projects_dir
+        yield mock_get_repo_manager
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_get_project_details_prefers_local_clone(mock_repo_manager):
+    async def main():
+        async with AsyncOSSFuzzClient() as client:
+            return await client.get_project_details("local")
+
+    with mock.patch("ossfuzz_kit.utils.fetch_from_url") as mock_fetch:
+        assert run(main())["language"] == "c"
+        mock_fetch.assert_not_called()
+
+def test_get_many_project_details_overlaps_remote_fetches(mock_repo_manager):
+    in_flight, peak = 0, 0
+
+    def slow_fetch(url, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        import time
+        time.sleep(0.05)
+        in_flight -= 1
+        return "language: go\n"
+
+    async def main():
+        async with AsyncOSSFuzzClient(max_in_flight=4) as client:
+            return await client.get_many_project_details([f"remote{i}" for i in range(8)] + ["local"])
+
+    with mock.patch("ossfuzz_kit.utils.fetch_from_url", side_effect=slow_fetch):
+        results = run(main())
+
+    assert [r.name for r in results][-1] == "local"
+    assert all(r.error is None for r in results)
+    assert results[0].details["language"] == "go"
+    assert 1 < peak <= 4
+
+def test_remote_retries_then_reports_error(mock_repo_manager):
+    async def main():
+        async with AsyncOSSFuzzClient(max_retries=2) as client:
+            return await client.get_many_project_details(["missing"])
+
+    with mock.patch("ossfuzz_kit.utils.fetch_from_url", side_effect=FetchError("404")) as mock_fetch, \
+            mock.patch("asyncio.sleep", new=mock.AsyncMock()) as mock_sleep:
+        results = run(main())
+
+    assert mock_fetch.call_count == 2
+    mock_sleep.assert_awaited_once()
+    assert "Failed to fetch" in results[0].error
+
+def test_no_fallback_raises_without_network(mock_repo_manager):
+    async def main():
+        async with AsyncOSSFuzzClient() as client:
+            return await client.get_project_details("missing", use_fallback=False)
+
+    with mock.patch("ossfuzz_kit.utils.fetch_from_url") as mock_fetch:
+        with pytest.raises(RuntimeError):
+            run(main())
+        mock_fetch.assert_not_called()
@@ -0,0 +1,110 @@
+import io
+import json
+import time
+import threading
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from ossfuzz_kit.client import OSSFuzzClient
+from ossfuzz_kit.sync_policy import SyncPolicy
+from ossfuzz_kit.utils import get_repo_manager
+from ossfuzz_kit.project_info.index import ProjectIndex
+from ossfuzz_kit.cli.commands.project_info import handle_project_details
+
+
+@pytest.fixture
+def index(tmp_path):
+    projects_dir = tmp_path / "projects"
+    for name, language in [("alpha", "c"), ("beta", "c++"), ("gamma", "rust")]:
+        (projects_dir / name).mkdir(parents=True)
+        (projects_dir / name / "project.yaml").write_text(f"language: {language}\n")
+    index = ProjectIndex(tmp_path / "index.sqlite3")
+    index.refresh(projects_dir, commit="c1", workers=0)
+    yield index
+    index.close()
+
+
+def test_batch_answers_from_index_in_input_order(index):
+    with patch("ossfuzz_kit.client.get_fresh_index", return_value=index), \
+            patch("ossfuzz_kit.client.get_project_info") as mock_info:
+        results = list(OSSFuzzClient().get_projects_details(["gamma", "missing", "alpha", "gamma", "../etc", ""]))
+
+    assert [r.name for r in results] == ["gamma", "missing", "alpha", "../etc"]
+    assert results[0].details["language"] == "rust" and results[2].details["language"] == "c"
+    assert results[1].error.startswith("LookupError") and results[3].error.startswith("ValueError")
+    mock_info.assert_not_called()
+
+
+def test_client_checks_index_only_when_the_clone_can_have_moved(index, monkeypatch):
+    manager = get_repo_manager()
+    monkeypatch.setattr(manager, "sync_policy", SyncPolicy(interval=timedelta(hours=1)))
+    client = OSSFuzzClient()
+
+    with patch("ossfuzz_kit.client.get_fresh_index", return_value=index) as fresh_index:
+        assert client.get_project_details("alpha")["language"] == "c"
+        assert client.get_project_details("beta")["language"] == "c++"
+        assert fresh_index.call_count == 1
+
+        monkeypatch.setattr(manager, "last_changes", object())
+        client.get_project_details("alpha")
+        assert fresh_index.call_count == 2
+
+        monkeypatch.setattr(manager, "sync_policy", SyncPolicy(interval=timedelta(0)))
+        client.get_project_details("alpha")
+        assert fresh_index.call_count == 3
+
+
+def test_batch_validates_then_loads_concurrently_in_order():
+    in_flight, peak = 0, 0
+    lock = threading.Lock()
+
+    def fake_info(name, raw=False, use_fallback=True):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Earlier names finish last, so ordering cannot come from completion order.
+        time.sleep(0.05 * (5 - int(name[1:])))
+        with lock:
+            in_flight -= 1
+        if name == "p3":
+            raise RuntimeError("broken project.yaml")
+        return {"name": name}
+
+    names = [f"p{i}" for i in range(5)] + ["nope"]
+    with patch("ossfuzz_kit.client.list_all_projects", return_value=[f"p{i}" for i in range(5)]), \
+            patch("ossfuzz_kit.client.get_project_info", side_effect=fake_info) as mock_info:
+        results = list(OSSFuzzClient(use_index=False).get_projects_details(names, workers=5))
+
+    assert [r.name for r in results] == names
+    assert [r.details for r in results[:3]] == [{"name": "p0"}, {"name": "p1"}, {"name": "p2"}]
+    assert "broken" in results[3].error and "Unknown project" in results[5].error
+    assert mock_info.call_count == 5 and peak > 1
+
+
+def cli_args(**overrides):
+    args = dict(
+        projects=[], from_file=None, workers=None, raw=False, at=None, cached=False,
+        no_server=True, no_fallback=False, sync=None, backend=None,
+    )
+    args.update(overrides)
+    return SimpleNamespace(**args)
+
+
+def test_cli_reads_names_from_stdin_and_streams_jsonl(monkeypatch, index, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("beta\n# comment\n\nalpha  # trailing\n"))
+    with patch("ossfuzz_kit.client.get_fresh_index", return_value=index):
+        monkeypatch.setattr("ossfuzz_kit.cli.commands.project_info._client", OSSFuzzClient())
+        handle_project_details(cli_args(projects=["gamma"], from_file="-"))
+
+        out = capsys.readouterr().out
+        assert [json.loads(line)["name"] for line in out.splitlines()] == ["gamma", "beta", "alpha"]
+
+        with pytest.raises(SystemExit):
+            handle_project_details(cli_args(projects=["alpha", "missing"]))
+        captured = capsys.readouterr()
+        assert [json.loads(line)["name"] for line in captured.out.splitlines()] == ["alpha"]
+        assert "missing" in captured.err
@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from ossfuzz_kit.project_info.build_files import (
+    BuildIndex, extract_build_info, normalize_repo_url, parse_build_script, parse_dockerfile,
+)
+
+DOCKERFILE = """\
+# Copyright 2016 Google Inc.
+FROM gcr.io/oss-fuzz-base/base-builder
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    make autoconf=2.71-2 \\
+    # comment inside a continuation
+    libtool pkg-config
+RUN python3 -m pip install --upgrade -r requirements.txt meson==1.2.0 "ninja>=1.10"
+RUN git clone --depth 1 --branch main https://github.com/curl/curl.git curl && \\
+    git -C /src clone -q https://github.com/curl/curl-fuzzer $SRC/curl_fuzzer
+RUN hg clone https://hg.example.org/lib lib
+WORKDIR $SRC/curl_fuzzer
+COPY build.sh $SRC/
+"""
+
+BUILD_SH = """\
+#!/bin/bash -eu
+./configure --disable-shared
+make -j$(nproc)
+$CXX $CXXFLAGS -Iinclude fuzz/parse_fuzzer.cc -o $OUT/parse_fuzzer $LIB_FUZZING_ENGINE libfoo.a
+$CXX $CXXFLAGS fuzz/read_fuzzer.cc -o "${OUT}/read_fuzzer" libfoo.a
+for fuzzer in $(find fuzz -name '*_fuzzer.cc'); do
+  $CXX $CXXFLAGS $fuzzer -o $OUT/$(basename ${fuzzer%.cc}) $LIB_FUZZING_ENGINE
+done
+zip -q $OUT/write_fuzzer_seed_corpus.zip corpus/*
+cp fuzz/options $OUT/write_fuzzer.options
+cp fuzz/xml.dict $OUT/
+cp target/release/fuzz_decode target/release/libfoo.so $OUT/
+compile_go_fuzzer github.com/foo/bar/fuzz FuzzParse fuzz_parse
+compile_python_fuzzer $SRC/fuzz_json.py
+"""
+
+def write_project(projects_dir, name, dockerfile=DOCKERFILE, build_sh=BUILD_SH, extra=None):
+    project_dir = projects_dir / name
+    project_dir.mkdir(parents=True, exist_ok=True)
+    (project_dir / "project.yaml").write_text("language: c\n")
+    (project_dir / "Dockerfile").write_text(dockerfile)
+    (project_dir / "build.sh").write_text(build_sh)
+    for path, content in (extra or {}).items():
+        (project_dir / path).write_text(content)
+    return project_dir
+
+def test_parse_dockerfile():
+    info = parse_dockerfile(DOCKERFILE)
+
+    assert info["base_image"] == "gcr.io/oss-fuzz-base/base-builder"
+    assert info["build_deps"] == ["make", "autoconf", "libtool", "pkg-config"]
+    assert info["pip_deps"] == ["meson", "ninja"]
+    assert info["workdir"] == "$SRC/curl_fuzzer"
+    assert info["repos"] == [
+        {"url": "https://github.com/curl/curl.git", "vcs": "git", "branch": "main", "dest": "curl"},
+        {"url": "https://github.com/curl/curl-fuzzer", "vcs": "git", "branch": None, "dest": "$SRC/curl_fuzzer"},
+        {"url": "https://hg.example.org/lib", "vcs": "hg", "branch": None, "dest": "lib"},
+    ]
+
+def test_parse_dockerfile_resolves_build_stages():
+    text = "FROM golang:1.21 AS go\nFROM gcr.io/oss-fuzz-base/base-builder-go AS builder\nFROM builder\n"
+    assert parse_dockerfile(text)["base_image"] == "gcr.io/oss-fuzz-base/base-builder-go"
+
+def test_parse_build_script_finds_declared_fuzzers():
+    assert parse_build_script(BUILD_SH) == [
+        "fuzz_decode", "fuzz_json", "fuzz_parse", "parse_fuzzer", "read_fuzzer", "write_fuzzer",
+    ]
+
+def test_normalize_repo_url():
+    assert normalize_repo_url("https://GitHub.com/curl/curl.git/") == "https://github.com/curl/curl"
+
+def test_extract_build_info_finds_fuzzer_sources(tmp_path):
+    project_dir = write_project(tmp_path, "zlib", extra={
+        "zlib_fuzzer.c": "int LLVMFuzzerTestOneInput(const uint8_t *data, size_t size) { return 0; }\n",
+        "helper.c": "int helper(void) { return 1; }\n",
+    })
+    (project_dir / "Dockerfile").unlink()
+
+    result = extract_build_info(project_dir)
+
+    assert result.error is None
+    assert result.details["base_image"] is None and result.details["repos"] == []
+    assert result.details["fuzzer_sources"] == ["zlib_fuzzer.c"]
+    assert "parse_fuzzer" in result.details["fuzzers"]
+
+@pytest.fixture
+def index(tmp_path):
+    index = BuildIndex(tmp_path / "build-index.sqlite3")
+    yield index
+    index.close()
+
+def test_build_index_refreshes_incrementally(index, tmp_path):
+    projects_dir = tmp_path / "projects"
+    for i in range(40):
+        write_project(projects_dir, f"proj{i:02}", dockerfile=DOCKERFILE.replace("curl/curl.git", f"org/repo{i}.git"))
+
+    assert index.refresh(projects_dir, commit="c1", workers=2) == 40
+    assert index.get("proj07")["repos"][0]["url"] == "https://github.com/org/repo7.git"
+    assert index.search(repo="https://github.com/org/repo7") == ["proj07"]
+    assert len(index.search(dependency="meson", fuzzer="read_fuzzer")) == 40
+    assert index.search(dependency="meson", fuzzer="missing") == []
+    with pytest.raises(ValueError):
+        index.search(language="c")
+
+    build_sh = projects_dir / "proj03" / "build.sh"
+    build_sh.write_text("$CC fuzz.c -o $OUT/only_fuzzer\n")
+    os.utime(build_sh, ns=(1, 1))
+    for path in (projects_dir / "proj05").iterdir():
+        path.unlink()
+    (projects_dir / "proj05").rmdir()
+
+    assert index.refresh(projects_dir, commit="c2", workers=0) == 2
+    assert index.get("proj03")["fuzzers"] == ["only_fuzzer"]
+    assert index.search(fuzzer="only_fuzzer") == ["proj03"]
+    assert index.search(fuzzer="read_fuzzer") == [f"proj{i:02}" for i in range(40) if i not in (3, 5)]
+    assert index.get("proj05") is None
+    assert index.refresh(projects_dir, commit="c2", workers=0) == 0
@@ -0,0 +1,58 @@
+import pytest
+from unittest import mock
+
+from ossfuzz_kit.project_info.bulk_details import iter_all_project_details, load_project_file
+
+@pytest.fixture
+def projects_dir(tmp_path):
+    projects_dir = tmp_path / "projects"
+    for i in range(40):
+        project = projects_dir / f"proj{i}"
+        project.mkdir(parents=True)
+        (project / "project.yaml").write_text(f"language: c++\nmain_repo: https://example.com/proj{i}\nsanitizers:\n  - address\n")
+    (projects_dir / "broken").mkdir()
+    (projects_dir / "broken" / "project.yaml").write_text("language: [unterminated\n")
+    (projects_dir / "empty").mkdir()
+    return projects_dir
+
+def test_load_project_file_success(projects_dir):
+    result = load_project_file(projects_dir / "proj1" / "project.yaml")
+    assert result.error is None
+    assert result.details["name"] == "proj1"
+    assert result.details["sanitizers"] == ["address"]
+
+def test_load_project_file_reports_error(projects_dir):
+    result = load_project_file(projects_dir / "empty" / "project.yaml")
+    assert result.details is None
+    assert "FileNotFoundError" in result.error
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_all_project_details_continues_past_errors(projects_dir, workers):
+    results = {r.name: r for r in iter_all_project_details(workers=workers, projects_dir=projects_dir)}
+
+    assert len(results) == 42
+    assert results["broken"].error is not None
+    assert results["empty"].error is not None
+    assert results["proj7"].details["repo"] == "https://example.com/proj7"
+
+@mock.patch("ossfuzz_kit.project_info.bulk_details.get_repo_manager")
+def test_iter_all_project_details_raw_uses_repo_manager(mock_get_repo_manager, projects_dir):
+    mock_get_repo_manager.return_value.get_projects_dir.return_value = projects_dir
+
+    results = [r for r in iter_all_project_details(raw=True, workers=0) if r.error is None]
+
+    mock_get_repo_manager.return_value.get_projects_dir.assert_called_once()
+    assert results[0].details["main_repo"].startswith("https://example.com/")
+
+@mock.patch("ossfuzz_kit.project_info.bulk_details.get_repo_manager")
+def test_iter_all_project_details_from_git_objects(mock_get_repo_manager):
+    mock_get_repo_manager.return_value.iter_project_yamls.return_value = iter([
+        ("curl", "language: c\n"),
+        ("broken", "- not a mapping\n"),
+    ])
+
+    results = {r.name: r for r in iter_all_project_details(commit="abc123", workers=0)}
+
+    mock_get_repo_manager.return_value.iter_project_yamls.assert_called_once_with("abc123")
+    assert results["curl"].details["language"] == "c"
+    assert results["broken"].error is not None
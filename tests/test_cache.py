@@ -0,0 +1,124 @@
+import os
+import tarfile
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+import ossfuzz_kit.utils as utils
+from ossfuzz_kit import config
+from ossfuzz_kit.cache import (
+    get_cache_dir, get_clone_dir, set_cache_dir, cache_info, prune_cache, clear_cache, seed_cache,
+)
+from ossfuzz_kit.http_cache import HTTPCache
+
+from helpers import git
+
+
+@pytest.fixture
+def manager(monkeypatch, isolated_cache_dir, upstream_repo):
+    monkeypatch.setattr(utils, "_repo_instance", None)
+    manager = utils.get_repo_manager()
+    manager.repo_url = f"file://{upstream_repo}"
+    git(isolated_cache_dir, "clone", "-q", "--depth", "1", "--sparse", manager.repo_url, str(manager.clone_path))
+    git(manager.clone_path, "sparse-checkout", "set", "projects")
+    return manager
+
+
+def commit_change(upstream, language):
+    (upstream / "projects" / "alpha" / "project.yaml").write_text(f"language: {language}\n")
+    git(upstream, "commit", "-qam", f"alpha is {language}")
+
+
+def test_cache_dir_resolution_order(monkeypatch, tmp_path):
+    monkeypatch.delenv("OSSFUZZ_KIT_CACHE_DIR")
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    assert get_cache_dir() == tmp_path / "home" / ".cache" / "ossfuzz-kit"
+
+    monkeypatch.setenv("XDG_CACHE_HOME", "relative/ignored")
+    assert get_cache_dir() == tmp_path / "home" / ".cache" / "ossfuzz-kit"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert get_cache_dir() == tmp_path / "xdg" / "ossfuzz-kit"
+
+    monkeypatch.setenv("OSSFUZZ_KIT_CACHE_DIR", str(tmp_path / "env"))
+    assert get_cache_dir() == tmp_path / "env"
+    assert get_clone_dir() == tmp_path / "env" / "oss-fuzz"
+
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "explicit"))
+    monkeypatch.setenv("OSSFUZZ_KIT_CLONE_DIR", str(tmp_path / "shared"))
+    assert get_cache_dir() == tmp_path / "explicit"
+    assert get_clone_dir() == tmp_path / "shared"
+
+
+def test_set_cache_dir_moves_the_shared_repo_manager(monkeypatch, tmp_path):
+    monkeypatch.setattr(utils, "_repo_instance", None)
+    manager = utils.get_repo_manager()
+
+    set_cache_dir(tmp_path / "elsewhere")
+
+    assert utils.get_repo_manager() is manager
+    assert manager.clone_path == tmp_path / "elsewhere" / "oss-fuzz"
+
+
+def test_seed_restores_a_packed_cache_offline(manager, upstream_repo, isolated_cache_dir, tmp_path):
+    commit_change(upstream_repo, "rust")
+    manager.sync()
+    synced = manager.head_commit()
+    tarball = tmp_path / "seed.tar.gz"
+    with tarfile.open(tarball, "w:gz") as tar:
+        tar.add(isolated_cache_dir, arcname="ossfuzz-kit")
+
+    set_cache_dir(tmp_path / "node")
+    result = seed_cache(tarball)
+
+    assert result == {"commit": synced, "installed": ["oss-fuzz"]}
+    assert manager.clone_path == tmp_path / "node" / "oss-fuzz"
+    assert (manager.checkout_path / "projects" / "alpha" / "project.yaml").read_text() == "language: rust\n"
+    with pytest.raises(RuntimeError, match="already exists"):
+        seed_cache(tarball)
+
+
+def test_prune_keeps_current_snapshot_and_fresh_responses(manager, upstream_repo):
+    commit_change(upstream_repo, "rust")
+    manager.sync()
+    commit_change(upstream_repo, "go")
+    manager.sync()
+    assert len([p for p in manager.trees_path.iterdir() if p.name != "current"]) == 2
+
+    cache = HTTPCache()
+    cache.put("https://example.com/old", b"old", etag='"1"')
+    cache.put("https://example.com/new", b"new", etag='"2"')
+    stale = cache.cache_dir / f"{cache._key('https://example.com/old', None)}.json"
+    os.utime(stale, (0, 0))
+
+    assert prune_cache(older_than=timedelta(days=1)) > 0
+
+    assert cache.get("https://example.com/old") is None
+    assert cache.get("https://example.com/new").content == b"new"
+    assert [p.name for p in manager.trees_path.iterdir() if p.name != "current"] == [manager.head_commit()]
+    assert (manager.checkout_path / "projects" / "alpha" / "project.yaml").read_text() == "language: go\n"
+
+
+def test_clear_keeps_a_clone_outside_the_cache(manager, isolated_cache_dir, tmp_path):
+    shared = tmp_path / "shared"
+    os.rename(manager.clone_path, shared)
+    set_cache_dir(clone_dir=shared)
+    HTTPCache().put("https://example.com/x", b"x", etag='"1"')
+
+    info = cache_info()
+    assert info["clone_shared"] and info["commit"] == manager.head_commit()
+
+    assert clear_cache() > 0
+    assert [p.name for p in isolated_cache_dir.iterdir()] == []
+    assert (shared / "projects" / "alpha").is_dir()
+
+
+def test_read_only_clone_is_used_without_syncing(manager):
+    with patch("ossfuzz_kit.utils.os.access", return_value=False), \
+            patch.object(utils.RepoManager, "is_up_to_date") as mock_check:
+        assert manager.read_only
+        assert manager.ensure_repo() == manager.clone_path / "projects"
+        with pytest.raises(RuntimeError, match="read-only"):
+            manager.sync()
+    mock_check.assert_not_called()
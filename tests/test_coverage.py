@@ -0,0 +1,165 @@
+import io
+import gzip
+import json
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ossfuzz_kit.client import OSSFuzzClient
+from ossfuzz_kit.coverage.parser import JSONStreamReader, iter_coverage_records
+from ossfuzz_kit.coverage.reports import ensure_coverage, missing_dates
+from ossfuzz_kit.coverage.store import CoverageStore
+from ossfuzz_kit.export import read_columnar
+
+
+def summary(count, covered):
+    return {"count": count, "covered": covered, "percent": 100.0 * covered / count if count else 0}
+
+
+def make_report(files=3, scale=1, functions=True):
+    export = {
+        "files": [
+            {
+                "filename": f"/src/lib/file{i}.c",
+                "segments": [[1, 1, 5, True, True, False]] * 20,
+                "summary": {"lines": summary(100, 10 * i * scale), "functions": summary(4, i), "regions": summary(50, 5 * i)},
+            }
+            for i in range(files)
+        ],
+        "totals": {"lines": summary(100 * files, 10 * scale * sum(range(files))), "branches": summary(8, 2)},
+    }
+    if functions:
+        export["functions"] = [
+            {
+                "name": f"fn{i}", "count": i, "filenames": [f"/src/lib/file{i}.c"],
+                # Two code regions (one executed) and a skipped region that does not count.
+                "regions": [[1, 1, 2, 2, i, 0, 0, 0], [3, 1, 4, 2, 0, 0, 0, 0], [5, 1, 6, 2, 0, 0, 0, 2]],
+            }
+            for i in range(files)
+        ]
+    return {"data": [export], "type": "llvm.coverage.json.export", "version": "2.0.1"}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_stream_parser_matches_whole_document(chunk_size):
+    document = json.dumps(make_report(files=5), indent=1).encode()
+    records = list(iter_coverage_records(io.BytesIO(document), chunk_size=chunk_size))
+
+    files = [r for kind, r in records if kind == "file"]
+    functions = [r for kind, r in records if kind == "function"]
+    totals = [r for kind, r in records if kind == "totals"]
+    assert [f["filename"] for f in files] == [f"/src/lib/file{i}.c" for i in range(5)]
+    assert files[3]["lines_covered"] == 30 and files[3]["regions_count"] == 50 and files[3]["branches_count"] is None
+    assert functions[2] == {"name": "fn2", "filename": "/src/lib/file2.c", "count": 2, "regions_count": 2, "regions_covered": 1}
+    assert totals == [{**{k: None for k in totals[0]}, "lines_count": 500, "lines_covered": 100, "branches_count": 8, "branches_covered": 2}]
+
+
+def test_stream_reader_handles_numbers_split_across_chunks():
+    reader = JSONStreamReader(io.StringIO('{"a": 12345678, "b": [true, null]}'), chunk_size=3)
+    values = {key: reader.value() for key in reader.iter_object()}
+    assert values == {"a": 12345678, "b": [True, None]}
+
+
+def test_stream_parser_rejects_truncated_document():
+    document = json.dumps(make_report())[:-40].encode()
+    with pytest.raises(ValueError):
+        list(iter_coverage_records(io.BytesIO(document), chunk_size=16))
+
+
+def test_store_round_trips_partitions(tmp_path):
+    store = CoverageStore(tmp_path)
+    day = date(2024, 1, 2)
+    document = io.BytesIO(json.dumps(make_report(files=600)).encode())
+
+    totals = store.write("curl", day, iter_coverage_records(document))
+
+    assert totals["files_records"] == 600 and totals["lines_count"] == 60000
+    assert store.dates("curl") == [day] and store.has("curl", day)
+    files = list(store.read("curl", day, "files", fields=["filename", "lines_covered"]))
+    assert files[599] == {"filename": "/src/lib/file599.c", "lines_covered": 5990}
+    assert [p.name for p in (tmp_path / "curl").iterdir()] == ["2024-01-02"]
+    with gzip.open(tmp_path / "curl" / "2024-01-02" / "files.columns.jsonl.gz", "rt") as f:
+        groups = [json.loads(line) for line in f]
+    assert [g["rows"] for g in groups] == [256, 256, 88]
+    assert list(read_columnar([json.dumps(groups[0])], ["filename"]))[0] == {"filename": "/src/lib/file0.c"}
+
+
+class CoverageBucket(BaseHTTPRequestHandler):
+    # Reports exist for every date except those in `missing`.
+    requests = []
+    missing = {"20240103"}
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        type(self).requests.append(self.path)
+        parts = self.path.strip("/").split("/")
+        if len(parts) != 5 or parts[1] != "reports" or parts[4] != "summary.json" or parts[2] in self.missing:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(make_report(files=4, scale=int(parts[2][-2:]))).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def bucket():
+    CoverageBucket.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CoverageBucket)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_fetches_only_missing_dates(bucket):
+    client = OSSFuzzClient(coverage_url=bucket)
+
+    totals = client.get_coverage("curl", since="2024-01-01", until="2024-01-06", workers=4)
+
+    assert [t["date"] for t in totals] == ["2024-01-01", "2024-01-02", "2024-01-04", "2024-01-05"]
+    assert totals[1]["lines_covered"] == 120 and totals[1]["lines_percent"] == 30.0
+    assert len(CoverageBucket.requests) == 5
+
+    files = client.get_coverage("curl", since="2024-01-04", until="2024-01-06", level="files")
+    assert len(files) == 8 and files[4]["date"] == "2024-01-05" and files[5]["lines_percent"] == 50.0
+    assert len(CoverageBucket.requests) == 5
+
+    client.get_coverage("curl", since="2024-01-01", until="2024-01-08")
+    assert sorted(CoverageBucket.requests[5:]) == [
+        "/curl/reports/20240106/linux/summary.json", "/curl/reports/20240107/linux/summary.json",
+    ]
+    functions = client.get_coverage("curl", since="2024-01-07", until="2024-01-08", level="functions", fetch=False)
+    assert [f["regions_percent"] for f in functions] == [0.0, 50.0, 50.0, 50.0]
+
+
+def test_coverage_rejects_project_names_outside_the_store(bucket, tmp_path):
+    with pytest.raises(ValueError):
+        OSSFuzzClient(coverage_url=bucket).get_coverage("../curl", since="2024-01-01", until="2024-01-02")
+    assert CoverageBucket.requests == []
+
+    with pytest.raises(ValueError):
+        CoverageStore(tmp_path / "coverage").partition_path("../../etc", date(2024, 1, 2))
+
+
+def test_recent_dates_without_a_report_are_retried(monkeypatch, bucket, tmp_path):
+    monkeypatch.setattr("ossfuzz_kit.coverage.reports.today", lambda: date(2024, 1, 4))
+    store = CoverageStore(tmp_path)
+
+    result = ensure_coverage("curl", [date(2023, 12, 31), date(2024, 1, 1), date(2024, 1, 3)], store, base_url=bucket)
+    assert result == {"fetched": ["2023-12-31", "2024-01-01"], "unavailable": ["2024-01-03"], "errors": {}}
+
+    monkeypatch.setattr(CoverageBucket, "missing", {"20231230"})
+    result = ensure_coverage("curl", [date(2023, 12, 30), date(2024, 1, 3), date(2024, 1, 5)], store, base_url=bucket)
+    assert result == {"fetched": ["2024-01-03"], "unavailable": ["2023-12-30"], "errors": {}}
+    assert store.is_missing("curl", date(2023, 12, 30))
+    assert missing_dates("curl", [date(2023, 12, 30), date(2024, 1, 3)], store) == []
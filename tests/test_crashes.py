@@ -0,0 +1,205 @@
+import json
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from ossfuzz_kit.client import OSSFuzzClient
+from ossfuzz_kit.crashes import store as store_module
+from ossfuzz_kit.crashes.sources import HTTPSource, JSONFileSource, normalize_crash, open_source
+from ossfuzz_kit.crashes.stats import refresh_crashes
+from ossfuzz_kit.crashes.store import CrashStore
+
+
+def ts(day, hour=12):
+    return int(datetime.fromisoformat(f"{day}T{hour:02d}:00:00+00:00").timestamp())
+
+
+def make_crashes():
+    # 2024-01-01 is a Monday.
+    return [
+        {"id": "1", "project": "curl", "timestamp": ts("2024-01-01"), "sanitizer": "MSan", "engine": "libFuzzer"},
+        {"id": "2", "project": "curl", "timestamp": ts("2024-01-03"), "sanitizer": "memory", "engine": "libfuzzer"},
+        {"id": "3", "project": "curl", "timestamp": ts("2024-01-09"), "sanitizer": "address", "engine": "afl"},
+        {"id": "4", "project": "zlib", "timestamp": ts("2024-01-02"), "job_type": "libfuzzer_msan_zlib"},
+        {"id": "5", "project": "pycrypto", "timestamp": ts("2024-01-02"), "sanitizer": "MemorySanitizer", "engine": "libfuzzer"},
+        {"id": "6", "project": "zlib", "timestamp": ts("2024-01-10"), "sanitizer": "UBSan", "engine": "honggfuzz"},
+    ]
+
+
+PROJECTS = [
+    {"name": "curl", "language": "c++", "sanitizers": ["address", "memory"]},
+    {"name": "zlib", "language": "c", "sanitizers": ["address", {"memory": {"experimental": True}}]},
+    {"name": "pycrypto", "language": "python"},
+]
+
+
+def recount(store):
+    # The rollup computed from scratch, to compare against the incrementally maintained one.
+    counts = Counter()
+    for crash in store.crashes():
+        day = datetime.fromtimestamp(crash["timestamp"], timezone.utc).date().isoformat()
+        counts[(day, crash["project"], crash["sanitizer"] or "", crash["engine"] or "")] += 1
+    return counts
+
+
+def rollup(store):
+    return Counter({tuple(row[:4]): row[4] for row in store.conn.execute("SELECT * FROM rollup")})
+
+
+def test_normalize_crash_maps_aliases_and_job_types():
+    crash = normalize_crash({"localId": 7, "crash_time": "2024-01-02T03:04:05Z", "job_type": "afl_asan_libpng_proto", "type": "Heap-buffer-overflow"})
+    assert crash["id"] == "7"
+    assert crash["project"] == "libpng_proto"
+    assert crash["timestamp"] == ts("2024-01-02", 3) + 245
+    assert (crash["engine"], crash["sanitizer"], crash["crash_type"]) == ("afl", "address", "Heap-buffer-overflow")
+
+    unnamed = normalize_crash({"project": "curl", "timestamp": 1704067200000, "sanitizer": "UndefinedBehaviorSanitizer"})
+    assert unnamed["timestamp"] == 1704067200 and unnamed["sanitizer"] == "undefined"
+    assert unnamed["id"] == normalize_crash(dict(unnamed, id=None))["id"]
+
+    with pytest.raises(ValueError):
+        normalize_crash({"id": "1", "sanitizer": "address"})
+
+
+@pytest.mark.parametrize("layout", ["array", "object", "jsonl"])
+def test_file_source_reads_fixture_layouts(tmp_path, layout):
+    crashes = make_crashes()
+    path = tmp_path / "crashes.json"
+    if layout == "array":
+        path.write_text(json.dumps(crashes))
+    elif layout == "object":
+        path.write_text(json.dumps({"issues": crashes, "total": len(crashes)}))
+    else:
+        path.write_text("\n".join(json.dumps(c) for c in crashes) + "\n")
+
+    source = open_source(str(path))
+    assert isinstance(source, JSONFileSource)
+    assert list(source.iter_records()) == crashes
+
+
+def test_rollup_follows_inserts_updates_and_repeats(tmp_path):
+    store = CrashStore(tmp_path / "crashes.sqlite3")
+    assert store.add(make_crashes()) == {"added": 6, "updated": 0, "unchanged": 0, "skipped": 0}
+    assert rollup(store) == recount(store)
+
+    moved = [
+        {"id": "1", "project": "curl", "timestamp": ts("2024-01-08"), "sanitizer": "asan", "engine": "libfuzzer"},
+        {"id": "2", "project": "curl", "timestamp": ts("2024-01-03"), "sanitizer": "memory", "engine": "libfuzzer"},
+        {"id": "7", "project": "curl", "timestamp": ts("2024-01-08"), "sanitizer": "asan", "engine": "libfuzzer"},
+        {"id": "8", "sanitizer": "asan"},
+    ]
+    assert store.add(moved) == {"added": 1, "updated": 1, "unchanged": 1, "skipped": 1}
+    assert rollup(store) == recount(store)
+    assert rollup(store)[("2024-01-08", "curl", "address", "libfuzzer")] == 2
+    assert ("2024-01-01", "curl", "memory", "libfuzzer") not in rollup(store)
+
+    expected = rollup(store)
+    store.rebuild_rollup()
+    assert rollup(store) == expected
+
+
+def test_stats_group_by_time_and_join_project_metadata(tmp_path):
+    store = CrashStore(tmp_path / "crashes.sqlite3")
+    store.add(make_crashes())
+    store.set_projects(PROJECTS, commit="abc")
+
+    # MSan crashes in C++ projects, per week.
+    assert store.stats(["week"], sanitizer="msan", language="c++") == [{"week": "2024-01-01", "count": 2}]
+    assert store.stats(["language"], sanitizer="memory") == [
+        {"language": "c++", "count": 2}, {"language": "c", "count": 1}, {"language": "python", "count": 1},
+    ]
+    # Projects declaring MSan, counting every sanitizer's crashes; pycrypto uses the defaults.
+    assert store.stats(["project"], sanitizers="memory") == [{"project": "curl", "count": 3}, {"project": "zlib", "count": 2}]
+    assert store.stats(["engine"], since=ts("2024-01-02", 0), until=ts("2024-01-10", 0)) == [
+        {"engine": "libfuzzer", "count": 3}, {"engine": "afl", "count": 1},
+    ]
+    assert store.stats([], project=["zlib", "curl"]) == [{"count": 5}]
+    assert store.stats(["day"], project="zlib") == [{"day": "2024-01-02", "count": 1}, {"day": "2024-01-10", "count": 1}]
+
+    with pytest.raises(ValueError):
+        store.stats(["fuzz_target"])
+    with pytest.raises(ValueError):
+        store.stats(["project"], severity="High")
+    assert [c["id"] for c in store.crashes(project="curl", since=ts("2024-01-03", 0))] == ["3", "2"]
+
+
+class CrashAPI(BaseHTTPRequestHandler):
+    # Serves `records` newest-last, two per page, linked by page tokens.
+    records = []
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlsplit(self.path).query).items()}
+        type(self).requests.append(query)
+        matching = [r for r in self.records if r["timestamp"] >= int(query.get("since", 0))]
+        start = int(query.get("pageToken", 0))
+        page = {"crashes": matching[start:start + 2]}
+        if start + 2 < len(matching):
+            page["nextPageToken"] = str(start + 2)
+        body = json.dumps(page).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def crash_api():
+    CrashAPI.records = sorted(make_crashes(), key=lambda r: r["timestamp"])
+    CrashAPI.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CrashAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/crashes"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_source_paginates_and_refresh_resumes(tmp_path, crash_api):
+    store = CrashStore(tmp_path / "crashes.sqlite3")
+    assert isinstance(open_source(crash_api), HTTPSource)
+
+    first = refresh_crashes(crash_api, store=store)
+    assert first["added"] == 6
+    assert [r.get("pageToken") for r in CrashAPI.requests] == [None, "2", "4"]
+    assert "since" not in CrashAPI.requests[0]
+
+    CrashAPI.records = CrashAPI.records + [
+        {"id": "9", "project": "curl", "timestamp": ts("2024-01-11"), "sanitizer": "memory", "engine": "libfuzzer"},
+    ]
+    CrashAPI.requests = []
+    second = refresh_crashes(crash_api, store=store)
+    assert CrashAPI.requests[0]["since"] == str(ts("2024-01-10"))
+    assert (second["added"], second["unchanged"]) == (1, 1)
+    assert store.count() == 7 and rollup(store) == recount(store)
+
+
+def test_client_crash_stats_from_fixture(tmp_path, monkeypatch):
+    monkeypatch.setattr(store_module, "_crash_store_instance", CrashStore(tmp_path / "crashes.sqlite3"))
+    lookups = []
+
+    def fake_project_info(name):
+        lookups.append(name)
+        return next(p for p in PROJECTS if p["name"] == name)
+
+    monkeypatch.setattr("ossfuzz_kit.project_info.project_details.get_project_info", fake_project_info)
+    fixture = tmp_path / "crashes.json"
+    fixture.write_text(json.dumps(make_crashes()))
+
+    client = OSSFuzzClient(use_index=False, crash_source=str(fixture))
+    rows = client.crash_stats(["week", "language"], refresh=True, sanitizer="msan", language=["c", "c++"])
+    assert rows == [{"week": "2024-01-01", "language": "c++", "count": 2}, {"week": "2024-01-01", "language": "c", "count": 1}]
+    assert sorted(lookups) == ["curl", "pycrypto", "zlib"]
+
+    # Metadata is looked up once; repeating the query reads only the store.
+    assert client.crash_stats(["week", "language"], sanitizer="msan", language=["c", "c++"]) == rows
+    assert len(lookups) == 3
+    assert [c["id"] for c in client.get_crashes(language="c", limit=1)] == ["6"]
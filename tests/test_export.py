@@ -0,0 +1,42 @@
+import io
+import csv
+import json
+import pytest
+
+from ossfuzz_kit.export import export_records
+
+RECORDS = [
+    {"name": "curl", "language": "c", "sanitizers": ["address", {"memory": {"experimental": True}}], "repo": "https://github.com/curl/curl"},
+    {"name": "zlib", "language": "c", "sanitizers": [], "repo": None},
+    {"name": "re2", "language": "c++", "sanitizers": ["address"], "repo": None},
+]
+
+def consumed_once():
+    # A generator makes sure exporters never need to rewind or materialize their input.
+    yield from RECORDS
+
+def test_export_jsonl_with_projection():
+    out = io.StringIO()
+    assert export_records(consumed_once(), out, fields=["name", "language"]) == 3
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert lines[0] == {"name": "curl", "language": "c"}
+
+def test_export_csv_encodes_lists_as_json():
+    out = io.StringIO()
+    export_records(consumed_once(), out, format="csv", fields=["name", "sanitizers"])
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert rows[0]["name"] == "curl"
+    assert json.loads(rows[0]["sanitizers"])[1] == {"memory": {"experimental": True}}
+
+def test_export_columnar_row_groups():
+    from ossfuzz_kit import export
+    out = io.StringIO()
+    export.write_columnar(consumed_once(), out, fields=["name", "language"], row_group_size=2)
+    groups = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [g["rows"] for g in groups] == [2, 1]
+    assert groups[0]["columns"]["name"] == ["curl", "zlib"]
+    assert groups[1]["columns"]["language"] == ["c++"]
+
+def test_export_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        export_records(consumed_once(), io.StringIO(), format="xml")
@@ -0,0 +1,19 @@
+import sys
+import subprocess
+
+from ossfuzz_kit.file_lock import FileLock
+
+def test_file_lock_is_reentrant_and_excludes_other_processes(tmp_path):
+    lock = FileLock(tmp_path / "repo.lock")
+    probe = (
+        "import sys; sys.path.insert(0, 'src'); from ossfuzz_kit.file_lock import FileLock; "
+        f"print(FileLock({str(tmp_path / 'repo.lock')!r}).acquire(blocking=False))"
+    )
+
+    with lock:
+        with lock:
+            held = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+        assert held.strip() == "False"
+
+    free = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+    assert free.strip() == "True"
@@ -0,0 +1,39 @@
+import subprocess
+import pytest
+
+from ossfuzz_kit.git_objects import GitObjectReader
+
+def git(cwd, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / "projects" / "curl").mkdir(parents=True)
+    (tmp_path / "projects" / "curl" / "project.yaml").write_text("language: c\n")
+    (tmp_path / "projects" / "curl" / "build.sh").write_text("make\n")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-qm", "initial")
+    return tmp_path
+
+def test_reader_reads_by_revision_and_path(repo):
+    first = git(repo, "rev-parse", "HEAD")
+    (repo / "projects" / "curl" / "project.yaml").write_text("language: c++\n")
+    git(repo, "commit", "-qam", "update")
+
+    with GitObjectReader(repo) as reader:
+        assert reader.read_text(f"{first}:projects/curl/project.yaml") == "language: c\n"
+        assert reader.read_text("HEAD:projects/curl/project.yaml") == "language: c++\n"
+        assert reader.read("HEAD:projects/missing/project.yaml") is None
+
+def test_reader_lists_tree_and_reads_blobs(repo):
+    with GitObjectReader(repo) as reader:
+        entries = reader.ls_tree("HEAD", "projects/", recursive=True)
+        assert sorted(e.path for e in entries) == ["projects/curl/build.sh", "projects/curl/project.yaml"]
+
+        paths = {entry.sha: entry.path for entry in entries}
+        contents = {paths[sha]: data for sha, data in reader.iter_blobs(paths)}
+        assert contents["projects/curl/build.sh"] == b"make\n"
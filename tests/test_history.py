@@ -0,0 +1,96 @@
+import os
+import subprocess
+import pytest
+
+from ossfuzz_kit.utils import RepoManager
+from ossfuzz_kit.project_info import history as history_module
+from ossfuzz_kit.project_info.history import ProjectHistory, ensure_history, to_timestamp
+
+def commit(repo, message, date):
+    env = {**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+    for args in (["add", "-A"], ["commit", "-qm", message]):
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=repo, env=env, check=True, capture_output=True,
+        )
+
+def write(repo, name, content):
+    (repo / "projects" / name).mkdir(parents=True, exist_ok=True)
+    (repo / "projects" / name / "project.yaml").write_text(content)
+
+@pytest.fixture
+def history(tmp_path):
+    repo = tmp_path / "oss-fuzz"
+    repo.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+
+    write(repo, "curl", "language: c\nsanitizers: [address]\n")
+    write(repo, "re2", "language: c++\n")
+    commit(repo, "initial", "2023-01-10T00:00:00+00:00")
+
+    write(repo, "curl", "language: c\nsanitizers: [address, memory]\n")
+    write(repo, "re2", "language: c++\nhomepage: https://re2.example\n")
+    commit(repo, "curl msan", "2023-06-01T00:00:00+00:00")
+
+    subprocess.run(["git", "rm", "-rq", "projects/re2"], cwd=repo, check=True)
+    write(repo, "curl", "language: c\nsanitizers: [address, memory]\n# comment only\n")
+    commit(repo, "drop re2", "2024-02-01T00:00:00+00:00")
+
+    manager = RepoManager()
+    manager.clone_path = repo
+    history = ProjectHistory(tmp_path / "history.sqlite3", manager=manager)
+    history.build()
+    yield history
+    history.close()
+    manager.object_reader.close()
+
+def test_history_point_in_time_lookup(history):
+    assert history.get_at("curl", "2023-03-01")["sanitizers"] == ["address"]
+    assert history.get_at("curl", "2024-01-01")["sanitizers"] == ["address", "memory"]
+    assert history.get_at("re2", "2023-12-31")["homepage"] == "https://re2.example"
+    assert history.get_at("re2", "2024-03-01") is None
+    assert history.get_at("curl", "2023-03-01", raw=True)["language"] == "c"
+
+def test_history_stores_only_real_changes(history):
+    versions = list(history.iter_versions("curl"))
+    assert [v["timestamp"] for v in versions] == [to_timestamp("2023-01-10"), to_timestamp("2023-06-01")]
+
+def test_history_changes_in_range(history):
+    added = history.changes("sanitizers", "memory", since="2023-02-01", until="2024-01-01")
+    assert [c["name"] for c in added] == ["curl"]
+    assert history.changes("sanitizers", "memory", since="2023-07-01") == []
+    assert [c["name"] for c in history.changes("language", "c++", since="2024-01-01", removed=True)] == ["re2"]
+
+def test_history_rejects_moments_before_start(history):
+    with pytest.raises(ValueError):
+        history.get_at("curl", "2022-01-01")
+
+def test_history_update_walks_only_new_commits(history):
+    repo = history.manager.clone_path
+    write(repo, "zlib", "language: c\n")
+    commit(repo, "add zlib", "2024-05-01T00:00:00+00:00")
+
+    prefetched = []
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(RepoManager, "deepen", lambda self, since=None: None)
+        mp.setattr(RepoManager, "prefetch_blobs", lambda self, blobs: prefetched.append(set(blobs)))
+        assert history.update() == 1
+    assert history.get_at("zlib", "2024-06-01")["language"] == "c"
+    assert prefetched == [{history.manager._git("rev-parse", "HEAD:projects/zlib/project.yaml")}]
+
+def test_history_versions_include_removal(history):
+    versions = list(history.iter_versions("re2"))
+    assert versions[-1]["language"] is None
+
+def test_ensure_history_builds_once_from_commit_in_effect(history, monkeypatch):
+    history.close()
+    history.db_path = history.db_path.with_name("fresh.sqlite3")
+    builds = []
+    build = ProjectHistory.build
+    monkeypatch.setattr(RepoManager, "deepen", lambda self, since=None: None)
+    monkeypatch.setattr(ProjectHistory, "build", lambda self, since=None: builds.append(since) or build(self, since))
+    monkeypatch.setattr(history_module, "_history_instance", history)
+
+    assert ensure_history("2023-03-01") is history
+    assert builds == [to_timestamp("2023-01-10") - 1]
+    assert history.get_at("curl", "2023-03-01")["sanitizers"] == ["address"]
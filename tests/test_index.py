@@ -0,0 +1,115 @@
+import os
+import pytest
+
+from ossfuzz_kit.project_info.index import ProjectIndex
+
+@pytest.fixture
+def projects_dir(tmp_path):
+    projects_dir = tmp_path / "projects"
+    for name, language in [("alpha", "c"), ("beta", "c++"), ("gamma", "rust")]:
+        (projects_dir / name).mkdir(parents=True)
+        (projects_dir / name / "project.yaml").write_text(f"language: {language}\nmain_repo: https://example.com/{name}\n")
+    return projects_dir
+
+@pytest.fixture
+def index(tmp_path):
+    index = ProjectIndex(tmp_path / "index.sqlite3")
+    yield index
+    index.close()
+
+def test_index_builds_and_answers(index, projects_dir):
+    assert index.refresh(projects_dir, commit="c1", workers=0) == 3
+
+    assert index.names() == ["alpha", "beta", "gamma"]
+    assert index.get("beta")["language"] == "c++"
+    assert index.get("beta", raw=True)["main_repo"] == "https://example.com/beta"
+    assert index.get("missing") is None
+
+def test_index_skips_scan_when_commit_unchanged(index, projects_dir):
+    index.refresh(projects_dir, commit="c1", workers=0)
+    (projects_dir / "alpha" / "project.yaml").write_text("language: go\n")
+
+    assert index.refresh(projects_dir, commit="c1", workers=0) == 0
+    assert index.get("alpha")["language"] == "c"
+
+def test_index_reparses_only_changed_files(index, projects_dir):
+    index.refresh(projects_dir, commit="c1", workers=0)
+    (projects_dir / "alpha" / "project.yaml").write_text("language: go\nsanitizers: [address]\n")
+    (projects_dir / "gamma" / "project.yaml").unlink()
+    (projects_dir / "gamma").rmdir()
+    (projects_dir / "delta").mkdir()
+    (projects_dir / "delta" / "project.yaml").write_text("language: python\n")
+
+    assert index.refresh(projects_dir, commit="c2", workers=0) == 3
+    assert index.names() == ["alpha", "beta", "delta"]
+    assert index.get("alpha")["sanitizers"] == ["address"]
+
+def test_index_persists_across_instances(tmp_path, projects_dir):
+    first = ProjectIndex(tmp_path / "index.sqlite3")
+    first.refresh(projects_dir, commit="c1", workers=0)
+    first.close()
+
+    second = ProjectIndex(tmp_path / "index.sqlite3")
+    assert second.is_fresh(projects_dir, "c1")
+    assert second.get("gamma")["language"] == "rust"
+    second.close()
+
+def test_index_refresh_limited_to_changeset(index, projects_dir):
+    from ossfuzz_kit.utils import ChangeSet
+
+    index.refresh(projects_dir, commit="c1", workers=0)
+    (projects_dir / "alpha" / "project.yaml").write_text("language: go\n")
+    (projects_dir / "beta" / "project.yaml").write_text("language: python\n")
+
+    changes = ChangeSet("c1", "c2", added=[], removed=[], modified=["alpha"])
+    assert index.refresh(projects_dir, commit="c2", workers=0, changes=changes) == 1
+    assert index.get("alpha")["language"] == "go"
+    assert index.get("beta")["language"] == "c++"
+
+def test_cached_cli_answers_from_index_without_client(index, projects_dir, capsys, monkeypatch):
+    from ossfuzz_kit.cli import main as cli_main
+    from ossfuzz_kit.cli.commands import project_info as commands
+
+    index.refresh(projects_dir, commit="c1", workers=0)
+    monkeypatch.setattr("ossfuzz_kit.project_info.index._index_instance", index)
+    monkeypatch.setattr(commands, "get_client", lambda: pytest.fail("--cached must not build a client"))
+
+    monkeypatch.setattr("sys.argv", ["ossfuzz-kit", "--cached", "list-projects", "--language", "rust"])
+    cli_main.main()
+    assert "gamma" in capsys.readouterr().out
+
+    monkeypatch.setattr("sys.argv", ["ossfuzz-kit", "--cached", "project-details", "beta"])
+    cli_main.main()
+    assert "c++" in capsys.readouterr().out
+
+def test_cli_import_does_not_load_library():
+    import sys
+    import subprocess
+
+    code = "import sys, ossfuzz_kit.cli.main; print(sorted({'requests', 'yaml', 'ossfuzz_kit.utils'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": "src"}).stdout
+    assert output.strip() == "[]"
+
+def test_index_readers_in_other_threads_see_only_committed_refreshes(index, projects_dir, monkeypatch):
+    import threading
+    from ossfuzz_kit.project_info import bulk_details
+
+    index.refresh(projects_dir, commit="c1", workers=0)
+    (projects_dir / "gamma" / "project.yaml").unlink()
+    (projects_dir / "gamma").rmdir()
+    (projects_dir / "alpha" / "project.yaml").write_text("language: go\n")
+
+    seen = []
+    load = bulk_details.load_project_files
+
+    def load_while_reading(*args, **kwargs):
+        # The refresh has deleted gamma inside its open transaction by now.
+        reader = threading.Thread(target=lambda: seen.append(index.names()))
+        reader.start()
+        reader.join()
+        yield from load(*args, **kwargs)
+
+    monkeypatch.setattr(bulk_details, "load_project_files", load_while_reading)
+    assert index.refresh(projects_dir, commit="c2", workers=0) == 2
+    assert seen == [["alpha", "beta", "gamma"]]
+    assert index.names() == ["alpha", "beta"]
@@ -0,0 +1,70 @@
+import pytest
+from contextlib import contextmanager
+
+from ossfuzz_kit.client import OSSFuzzClient
+from ossfuzz_kit.metrics import Metrics, get_metrics
+
+def test_span_records_timer_and_notifies_hooks():
+    metrics = Metrics()
+    records = []
+    metrics.add_hook(records.append)
+
+    with metrics.span("git.sync", branch="master") as span:
+        span["projects_changed"] = 2
+    with pytest.raises(ValueError):
+        with metrics.span("git.sync"):
+            raise ValueError("boom")
+
+    timer = metrics.snapshot()["timers"]["git.sync"]
+    assert timer["count"] == 2
+    assert timer["max_s"] >= timer["mean_s"] >= 0
+    assert records[0].attributes == {"branch": "master", "projects_changed": 2}
+    assert records[0].error is None
+    assert records[1].error == "ValueError: boom"
+
+def test_failing_hook_does_not_break_the_stage():
+    metrics = Metrics()
+    metrics.add_hook(lambda record: 1 / 0)
+
+    with metrics.span("yaml.parse"):
+        pass
+    assert metrics.snapshot()["timers"]["yaml.parse"]["count"] == 1
+
+def test_spans_are_mirrored_to_opentelemetry_style_tracers():
+    started = []
+
+    class Tracer:
+        @contextmanager
+        def start_as_current_span(self, name, attributes=None):
+            started.append((name, dict(attributes or {})))
+            yield
+
+    metrics = Metrics()
+    metrics.add_tracer(Tracer())
+    with metrics.span("http.fetch", url="https://example.com"):
+        pass
+
+    assert started == [("http.fetch", {"url": "https://example.com"})]
+
+def test_snapshot_pairs_cache_counters_and_resets():
+    metrics = Metrics()
+    metrics.incr("http_cache.hits", 3)
+    metrics.incr("http_cache.misses")
+    metrics.set_gauge("http.rate_limit_remaining", 4999)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["caches"]["http_cache"] == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+    assert snapshot["gauges"]["http.rate_limit_remaining"] == 4999
+    assert "http_cache hit rate" in metrics.format_report()
+
+    metrics.reset()
+    assert metrics.snapshot() == {"timers": {}, "counters": {}, "gauges": {}, "caches": {}}
+
+def test_client_close_unregisters_its_hooks_and_tracer():
+    records = []
+    tracer = object()
+    with OSSFuzzClient(use_index=False, hooks=[records.append], tracer=tracer):
+        assert records.append in get_metrics()._hooks
+        assert tracer in get_metrics()._tracers
+    assert records.append not in get_metrics()._hooks
+    assert tracer not in get_metrics()._tracers
@@ -0,0 +1,89 @@
+import time
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+
+from ossfuzz_kit.rate_limit import BULK, INTERACTIVE, RateLimitError, RateLimitScheduler, parse_retry_after
+from ossfuzz_kit.utils import fetch_from_url
+
+API_URL = "https://api.github.com/repos/google/oss-fuzz/git/trees/master"
+
+def budget(limit, remaining, reset_in):
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time() + reset_in)),
+    }
+
+def test_exhausted_budget_waits_until_reset():
+    scheduler = RateLimitScheduler()
+    assert scheduler.update(API_URL, 403, budget(60, 0, 120)) == pytest.approx(120, abs=2)
+
+    assert scheduler.delay(API_URL, INTERACTIVE) == pytest.approx(120, abs=2)
+    assert scheduler.delay("https://raw.githubusercontent.com/x", INTERACTIVE) == 0
+
+def test_bulk_requests_leave_a_reserve_for_interactive_lookups():
+    scheduler = RateLimitScheduler(reserve=0.1)
+    assert scheduler.update(API_URL, 200, budget(100, 10, 300)) is None
+
+    assert scheduler.delay(API_URL, INTERACTIVE) == 0
+    assert scheduler.delay(API_URL, BULK) == pytest.approx(300, abs=2)
+
+def test_bulk_requests_are_paced_when_budget_runs_low():
+    scheduler = RateLimitScheduler(reserve=0.1)
+    scheduler.update(API_URL, 200, budget(100, 20, 100))
+    scheduler.acquire(API_URL, BULK)
+
+    # 19 requests left, 10 reserved: the remaining 9 are spread over the rest of the window.
+    assert scheduler.delay(API_URL, BULK) == pytest.approx(100 / 9, abs=1)
+    assert scheduler.delay(API_URL, INTERACTIVE) == 0
+
+def test_acquire_fails_when_wait_exceeds_max_wait():
+    scheduler = RateLimitScheduler()
+    scheduler.update(API_URL, 429, {"Retry-After": "30"})
+
+    with pytest.raises(RateLimitError):
+        scheduler.acquire(API_URL, max_wait=1)
+
+def test_bulk_yields_to_waiting_interactive_requests():
+    scheduler = RateLimitScheduler()
+    scheduler._waiting[INTERACTIVE] = 1
+    done = threading.Event()
+    thread = threading.Thread(target=lambda: (scheduler.acquire(API_URL, BULK), done.set()))
+    thread.start()
+
+    assert not done.wait(0.1)
+    with scheduler._cond:
+        scheduler._waiting[INTERACTIVE] = 0
+        scheduler._cond.notify_all()
+    assert done.wait(2)
+    thread.join()
+
+def test_parse_retry_after():
+    assert parse_retry_after("5", now=0) == 5
+    assert parse_retry_after("Thu, 01 Jan 1970 00:01:00 GMT", now=30) == 30
+    assert parse_retry_after("soon", now=0) is None
+
+def test_token_is_only_sent_to_github_api(monkeypatch):
+    monkeypatch.delenv("OSSFUZZ_KIT_GITHUB_TOKEN", raising=False)
+    monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+    scheduler = RateLimitScheduler()
+
+    assert scheduler.auth_headers(API_URL) == {"Authorization": "Bearer env-token"}
+    assert scheduler.auth_headers("https://raw.githubusercontent.com/google/oss-fuzz/master/x") == {}
+
+    scheduler.set_token("explicit")
+    assert scheduler.auth_headers(API_URL) == {"Authorization": "Bearer explicit"}
+
+def test_fetch_from_url_retries_throttled_response_without_using_retries(tmp_path):
+    scheduler = RateLimitScheduler(token="secret")
+    throttled = MagicMock(status_code=403, content=b"", headers={"Retry-After": "0", "X-RateLimit-Remaining": "0"})
+    ok = MagicMock(status_code=200, content=b"{}", headers={}, json=MagicMock(return_value={"ok": True}))
+
+    with patch("ossfuzz_kit.utils.get_scheduler", return_value=scheduler), \
+            patch("ossfuzz_kit.utils.get_session") as mock_session:
+        mock_session.return_value.get.side_effect = [throttled, ok]
+        assert fetch_from_url(API_URL, format="json", max_retries=1, use_cache=False) == {"ok": True}
+
+    headers = mock_session.return_value.get.call_args.kwargs["headers"]
+    assert headers["Authorization"] == "Bearer secret"
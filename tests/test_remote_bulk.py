@@ -0,0 +1,46 @@
+import io
+import tarfile
+from unittest import mock
+
+from ossfuzz_kit.project_info.remote_bulk import iter_archive_project_details, iter_remote_project_details
+
+def make_archive(files: dict[str, str], dirs: list[str] = ()) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path in dirs:
+            info = tarfile.TarInfo(path)
+            info.type = tarfile.DIRTYPE
+            archive.addfile(info)
+        for path, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(path)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+ARCHIVE_FILES = {
+    "oss-fuzz-abc/README.md": "readme",
+    "oss-fuzz-abc/projects/curl/project.yaml": "language: c\nmain_repo: https://github.com/curl/curl\n",
+    "oss-fuzz-abc/projects/curl/build.sh": "make",
+    "oss-fuzz-abc/projects/broken/project.yaml": "- not a mapping\n",
+    "oss-fuzz-abc/infra/project.yaml": "language: ignored\n",
+}
+
+def test_iter_archive_project_details_extracts_only_project_yaml():
+    archive = make_archive(ARCHIVE_FILES, dirs=["oss-fuzz-abc/projects/curl/", "oss-fuzz-abc/projects/nofile/"])
+    results = {r.name: r for r in iter_archive_project_details(archive)}
+
+    assert set(results) == {"curl", "broken", "nofile"}
+    assert results["curl"].details["repo"] == "https://github.com/curl/curl"
+    assert "Unexpected YAML format" in results["broken"].error
+    assert "missing" in results["nofile"].error
+
+@mock.patch("ossfuzz_kit.project_info.remote_bulk.stream_from_url")
+def test_iter_remote_project_details_uses_single_download(mock_stream):
+    mock_stream.return_value.__enter__.return_value = make_archive(ARCHIVE_FILES)
+
+    results = [r for r in iter_remote_project_details(raw=True) if r.error is None]
+
+    mock_stream.assert_called_once()
+    assert results == [("curl", {"name": "curl", "language": "c", "main_repo": "https://github.com/curl/curl"}, None)]
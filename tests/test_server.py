@@ -0,0 +1,202 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+import ossfuzz_kit.server as server_module
+from ossfuzz_kit.cache import get_cache_dir
+from ossfuzz_kit.cli.commands.project_info import handle_list_projects, handle_project_details
+from ossfuzz_kit.project_info.index import ProjectIndex
+from ossfuzz_kit.server import ProjectService, QueryServer, UnixQueryServer, serve
+from ossfuzz_kit.server_client import SERVER_STATE_FILE, ServerError, call_server, find_server
+
+
+@pytest.fixture
+def service(monkeypatch, tmp_path):
+    projects_dir = tmp_path / "projects"
+    for name, language in [("alpha", "c"), ("beta", "c++"), ("gamma", "rust")]:
+        (projects_dir / name).mkdir(parents=True)
+        (projects_dir / name / "project.yaml").write_text(
+            f"language: {language}\nmain_repo: https://example.com/{name}\nsanitizers: [address, memory]\n"
+        )
+    index = ProjectIndex(tmp_path / "index.sqlite3")
+    state = {"commit": "c1"}
+
+    def fresh_index():
+        index.refresh(projects_dir, commit=state["commit"], workers=0)
+        return index
+
+    monkeypatch.setattr(server_module, "get_fresh_index", fresh_index)
+    monkeypatch.setattr(server_module, "get_project_index", lambda: index)
+    service = ProjectService()
+    service.refresh()
+    service.projects_dir = projects_dir
+    service.state = state
+    yield service
+    index.close()
+
+
+@pytest.fixture
+def http_server(service):
+    server = QueryServer(service, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_service_routes(service):
+    assert service.handle("/health", {})[1]["projects"] == 3
+    assert service.handle("/projects", {}) == (200, {"commit": "c1", "count": 3, "projects": ["alpha", "beta", "gamma"]})
+    assert service.handle("/projects", {"language__in": ["c", "rust"], "limit": ["1"]})[1] == \
+        {"commit": "c1", "count": 2, "projects": ["alpha"]}
+
+    status, details = service.handle("/projects/beta", {})
+    assert status == 200 and details["language"] == "c++" and details["sanitizers"] == ["address", "memory"]
+    assert service.handle("/projects/beta", {"raw": ["1"]})[1]["main_repo"] == "https://example.com/beta"
+    assert service.handle("/query", {"language": ["rust"]})[1]["projects"][0]["name"] == "gamma"
+
+    assert service.handle("/projects/missing", {})[0] == 404
+    assert service.handle("/projects", {"language__startswith": ["c"]})[0] == 400
+    assert service.handle("/nowhere", {})[0] == 404
+
+
+def test_refresh_swaps_snapshot_only_when_commit_changes(service):
+    table = service.snapshot.table
+    assert service.refresh() is False
+    assert service.snapshot.table is table
+
+    (service.projects_dir / "alpha" / "project.yaml").write_text("language: go\n")
+    service.state["commit"] = "c2"
+    assert service.refresh() is True
+    assert service.handle("/projects/alpha", {})[1]["language"] == "go"
+    assert service.handle("/health", {})[1]["commit"] == "c2"
+
+
+def test_raw_lookups_do_not_wait_for_a_refresh(service, monkeypatch):
+    fresh_index = server_module.get_fresh_index
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fresh_index():
+        started.set()
+        release.wait(5)
+        return fresh_index()
+
+    monkeypatch.setattr(server_module, "get_fresh_index", slow_fresh_index)
+    refresher = threading.Thread(target=service.refresh)
+    refresher.start()
+    try:
+        assert started.wait(5)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            lookup = pool.submit(service.handle, "/projects/beta", {"raw": ["1"]})
+            assert lookup.result(timeout=2)[1]["main_repo"] == "https://example.com/beta"
+    finally:
+        release.set()
+        refresher.join()
+
+
+def test_http_server_answers_concurrent_requests(http_server):
+    def lookup(i):
+        name = ["alpha", "beta", "gamma"][i % 3]
+        return call_server(http_server.address, f"/projects/{name}")["name"] == name
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        assert all(pool.map(lookup, range(200)))
+
+    assert call_server(http_server.address, "/projects", {"sanitizers__contains": ["memory", "address"]})["count"] == 3
+    with pytest.raises(ServerError) as excinfo:
+        call_server(http_server.address, "/projects/missing")
+    assert excinfo.value.status == 404
+
+
+def test_unix_server_replaces_stale_socket_and_answers_requests(service, tmp_path):
+    import socket
+
+    socket_path = tmp_path / "stale.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+
+    server = UnixQueryServer(service, socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        assert server.address == f"unix:{socket_path}"
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            names = list(pool.map(lambda name: call_server(server.address, f"/projects/{name}")["name"], ["alpha", "beta", "gamma"] * 10))
+        assert names == ["alpha", "beta", "gamma"] * 10
+        assert call_server(server.address, "/projects", {"language": "c++"})["projects"] == ["beta"]
+        with pytest.raises(ServerError) as excinfo:
+            call_server(server.address, "/projects/missing")
+        assert excinfo.value.status == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert not socket_path.exists()
+
+
+def test_serve_on_unix_socket_advertises_its_address(service, tmp_path):
+    socket_path = tmp_path / "ossfuzz-kit.sock"
+    ready = threading.Event()
+    servers = []
+
+    def on_ready(server):
+        servers.append(server)
+        ready.set()
+
+    thread = threading.Thread(target=serve, kwargs={"socket_path": socket_path, "on_ready": on_ready}, daemon=True)
+    thread.start()
+    assert ready.wait(10)
+
+    address = find_server()
+    assert address == f"unix:{socket_path}"
+    assert call_server(address, "/projects/gamma")["language"] == "rust"
+
+    servers[0].shutdown()
+    thread.join(10)
+    assert not socket_path.exists()
+    assert not (get_cache_dir() / SERVER_STATE_FILE).exists()
+
+
+def cli_args(**overrides):
+    args = dict(
+        cached=False, no_server=False, sync=None, backend=None, no_fallback=False,
+        language=None, engine=None, sanitizer=None, arch=None, limit=None, raw=False, at=None,
+        projects=[], from_file=None, workers=None,
+    )
+    args.update(overrides)
+    return SimpleNamespace(**args)
+
+
+def test_cli_forwards_to_running_server(monkeypatch, http_server, capsys):
+    monkeypatch.setenv("OSSFUZZ_KIT_SERVER", http_server.address)
+    monkeypatch.setattr("ossfuzz_kit.cli.commands.project_info.get_client", lambda: pytest.fail("ran locally"))
+
+    handle_list_projects(cli_args(language=["rust", "c"]))
+    assert capsys.readouterr().out.splitlines()[1:3] == ["alpha", "gamma"]
+
+    handle_project_details(cli_args(projects=["beta"]))
+    out = capsys.readouterr().out
+    assert json.loads(out[out.index("{"):])["language"] == "c++"
+
+
+def test_cli_falls_back_when_server_cannot_answer(monkeypatch, http_server, capsys):
+    client = SimpleNamespace(get_project_details=lambda name, **kwargs: {"name": name, "source": "local"})
+    monkeypatch.setattr("ossfuzz_kit.cli.commands.project_info.get_client", lambda: client)
+
+    monkeypatch.setenv("OSSFUZZ_KIT_SERVER", http_server.address)
+    for args in (
+        cli_args(projects=["missing"]),
+        cli_args(projects=["beta?raw=1"]),
+        cli_args(projects=["beta"], no_server=True),
+        cli_args(projects=["beta"], at="2024-01-01"),
+    ):
+        handle_project_details(args)
+        assert '"source": "local"' in capsys.readouterr().out
+
+    monkeypatch.setenv("OSSFUZZ_KIT_SERVER", "http://127.0.0.1:1")
+    handle_project_details(cli_args(projects=["beta"]))
+    assert '"source": "local"' in capsys.readouterr().out
@@ -0,0 +1,27 @@
+import pytest
+from datetime import timedelta
+
+from ossfuzz_kit.sync_policy import SyncPolicy, parse_duration
+
+@pytest.mark.parametrize("value, seconds", [("90", 90), ("30s", 30), ("10m", 600), ("2h", 7200), ("1d", 86400)])
+def test_parse_duration(value, seconds):
+    assert parse_duration(value) == timedelta(seconds=seconds)
+
+def test_parse_policies():
+    assert SyncPolicy.parse("offline").mode == "offline"
+    assert SyncPolicy.parse("ttl=1h").interval == timedelta(hours=1)
+    assert SyncPolicy.parse("background").interval == timedelta(minutes=10)
+    assert SyncPolicy.parse("pinned=abc123").commit == "abc123"
+    assert str(SyncPolicy.parse("background=5m")) == "background=300s"
+
+@pytest.mark.parametrize("value", ["sometimes", "ttl=soon", "pinned", "offline=1h"])
+def test_parse_invalid_policies(value):
+    with pytest.raises(ValueError):
+        SyncPolicy.parse(value)
+
+def test_policy_from_env(monkeypatch):
+    monkeypatch.setenv("OSSFUZZ_KIT_SYNC", "offline")
+    assert SyncPolicy.from_env() == SyncPolicy.parse("offline")
+
+    monkeypatch.delenv("OSSFUZZ_KIT_SYNC")
+    assert SyncPolicy.from_env() == SyncPolicy.parse("ttl=10m")
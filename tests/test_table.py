@@ -0,0 +1,67 @@
+import pytest
+
+from ossfuzz_kit.project_info.project_details import normalize_project_info
+from ossfuzz_kit.project_info.table import ProjectInfo, ProjectTable
+
+RECORDS = [
+    {"name": "curl", "language": "c", "fuzzing_engines": ["libfuzzer", "afl"], "sanitizers": ["address", {"memory": {"experimental": True}}], "architectures": [], "homepage": "https://curl.se"},
+    {"name": "re2", "language": "c++", "fuzzing_engines": ["libfuzzer"], "sanitizers": ["address", "memory"], "architectures": ["x86_64", "i386"], "homepage": None},
+    {"name": "tink", "language": "C++", "fuzzing_engines": [], "sanitizers": [], "architectures": [], "homepage": None},
+    {"name": "serde", "language": "rust", "fuzzing_engines": ["libfuzzer"], "sanitizers": ["address"], "architectures": [], "homepage": None},
+]
+
+# Filters with the names they select, with and without the OSS-Fuzz defaults for empty list fields.
+FILTERS = [
+    ({}, ["curl", "re2", "serde", "tink"], ["curl", "re2", "serde", "tink"]),
+    ({"language": "c++"}, ["re2", "tink"], ["re2", "tink"]),
+    ({"language__in": ["rust", "c"]}, ["curl", "serde"], ["curl", "serde"]),
+    ({"fuzzing_engines__contains": "afl"}, ["curl", "tink"], ["curl"]),
+    ({"sanitizers__contains": ["address", "memory"]}, ["curl", "re2"], ["curl", "re2"]),
+    ({"language": "c++", "sanitizers__contains": "memory"}, ["re2"], ["re2"]),
+    ({"homepage": "https://curl.se", "fuzzing_engines": "libfuzzer"}, ["curl"], ["curl"]),
+    ({"language": "go"}, [], []),
+]
+
+@pytest.fixture
+def table():
+    # Unsorted input still yields rows, and results, in name order.
+    return ProjectTable(reversed(RECORDS))
+
+@pytest.mark.parametrize("filters, expected, expected_without_defaults", FILTERS)
+def test_table_filters(table, filters, expected, expected_without_defaults):
+    assert table.filter(**filters) == expected
+    assert ProjectTable(RECORDS, use_defaults=False).filter(**filters) == expected_without_defaults
+
+def test_table_query_returns_records_in_name_order(table):
+    assert [info.name for info in table.query()] == ["curl", "re2", "serde", "tink"]
+    assert table.query(language__in="rust")[0].to_dict()["sanitizers"] == ["address"]
+
+def test_table_rejects_unknown_operator(table):
+    with pytest.raises(ValueError):
+        table.filter(language__startswith="c")
+
+def test_project_info_round_trips_normalized_dicts():
+    data = {"language": "c", "fuzzing_engines": ["afl"], "sanitizers": [{"memory": {"experimental": True}}], "vendor_ccs": ["a@example.com"]}
+    record = normalize_project_info("curl", data)
+    info = ProjectInfo.from_dict(record)
+
+    assert info.to_dict() == record
+    assert info.get("language") == "c" and info.get("missing", 1) == 1
+    info.to_dict()["sanitizers"][0]["memory"]["experimental"] = False
+    assert info.sanitizers[0] == {"memory": {"experimental": True}}
+
+def test_table_shares_values_and_loads_raw_lazily():
+    loaded = []
+
+    def raw_loader(name):
+        loaded.append(name)
+        return {"name": name, "main_repo": f"https://example.com/{name}"}
+
+    records = [{"name": f"p{i}", "language": "c++", "fuzzing_engines": ["libfuzzer", "afl"]} for i in range(100)]
+    table = ProjectTable(records, raw_loader=raw_loader)
+
+    assert len({id(info.fuzzing_engines) for info in table}) == 1
+    assert table.count("language") == {"c++": 100}
+    assert loaded == []
+    assert table.get("p7").raw()["main_repo"] == "https://example.com/p7"
+    assert loaded == ["p7"]
@@ -1,3 +1,4 @@
+import subprocess
 import pytest
 import requests
 from unittest.mock import patch, MagicMock
@@ -5,12 +6,30 @@ from ossfuzz_kit.utils import (
     fetch_from_url,
     shallow_clone_repo,
     RepoManager,
-    FetchError
+    FetchError,
+    get_session,
 )
+from ossfuzz_kit.http_cache import HTTPCache
 from pathlib import Path
 
+from helpers import git
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    cache = HTTPCache(tmp_path / "http-cache")
+    with patch("ossfuzz_kit.utils.get_http_cache", return_value=cache):
+        yield cache
+
+
+@pytest.fixture
+def mock_get(http_cache):
+    with patch("ossfuzz_kit.utils.get_session") as mock_session:
+        mock_get = mock_session.return_value.get
+        mock_get.return_value.headers = {}
+        yield mock_get
+
 
-@patch("ossfuzz_kit.utils.requests.get")
 def test_fetch_from_url_text_success(mock_get):
     mock_get.return_value.status_code = 200
     mock_get.return_value.text = "Success"
@@ -19,7 +38,6 @@ def test_fetch_from_url_text_success(mock_get):
     assert result == "Success"
 
 
-@patch("ossfuzz_kit.utils.requests.get")
 def test_fetch_from_url_json_success(mock_get):
     mock_get.return_value.status_code = 200
     mock_get.return_value.json.return_value = {"ok": True}
@@ -28,7 +46,6 @@ def test_fetch_from_url_json_success(mock_get):
     assert result == {"ok": True}
 
 
-@patch("ossfuzz_kit.utils.requests.get")
 def test_fetch_from_url_retry_failure(mock_get):
     mock_get.side_effect = requests.RequestException("Network down")
 
@@ -36,10 +53,27 @@ def test_fetch_from_url_retry_failure(mock_get):
         fetch_from_url("http://example.com", max_retries=2)
 
 
+def test_fetch_from_url_conditional_request_served_from_cache(mock_get, http_cache):
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.headers = {"ETag": '"v1"'}
+    mock_get.return_value.content = b'{"sha": "abc"}'
+    mock_get.return_value.encoding = "utf-8"
+    mock_get.return_value.json.return_value = {"sha": "abc"}
+    assert fetch_from_url("http://example.com/api", format="json") == {"sha": "abc"}
+
+    mock_get.return_value.status_code = 304
+    assert fetch_from_url("http://example.com/api", format="json") == {"sha": "abc"}
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_get_session_is_shared():
+    assert get_session() is get_session()
+
+
 @patch("ossfuzz_kit.utils.subprocess.run")
 @patch("ossfuzz_kit.utils.Path.exists", return_value=False)
 def test_shallow_clone_repo_success(mock_exists, mock_run):
-    with patch("ossfuzz_kit.utils.tqdm") as mock_tqdm:
+    with patch("tqdm.tqdm") as mock_tqdm:
         path = shallow_clone_repo("https://github.com/example/repo.git")
         assert "oss-fuzz" in str(path)
 
@@ -69,4 +103,211 @@ def test_repo_manager_ensure_repo_updates(mock_exists, mock_run, mock_is_up_to_d
 def test_get_projects_dir_success(mock_exists, mock_ensure_repo):
     mock_ensure_repo.return_value = Path("data/oss-fuzz/projects")
     manager = RepoManager()
-    assert manager.get_projects_dir() == Path("data/oss-fuzz/projects")
\ No newline at end of file
+    assert manager.get_projects_dir() == Path("data/oss-fuzz/projects")
+
+def test_repo_manager_sync_reports_changed_projects(synced_manager, upstream_repo):
+    (upstream_repo / "projects" / "alpha" / "project.yaml").write_text("language: rust\n")
+    git(upstream_repo, "rm", "-rq", "projects/beta")
+    (upstream_repo / "projects" / "delta").mkdir()
+    (upstream_repo / "projects" / "delta" / "project.yaml").write_text("language: go\n")
+    (upstream_repo / "infra" / "README").write_text("changed")
+    git(upstream_repo, "add", ".")
+    git(upstream_repo, "commit", "-qm", "update")
+
+    old_commit = synced_manager.head_commit()
+    changes = synced_manager.sync()
+
+    assert changes.old_commit == old_commit
+    assert changes.new_commit == synced_manager.head_commit() != old_commit
+    assert (changes.added, changes.removed, changes.modified) == (["delta"], ["beta"], ["alpha"])
+    assert (synced_manager.checkout_path / "projects" / "alpha" / "project.yaml").read_text() == "language: rust\n"
+    assert not (synced_manager.checkout_path / "projects" / "beta").exists()
+
+
+def test_repo_manager_deepen_reads_since_as_utc_and_never_shortens(tmp_path, upstream_repo, monkeypatch):
+    from datetime import datetime, timezone
+
+    for hour in (0, 5, 10):
+        date = f"2030-01-01T{hour:02d}:00:00+00:00"
+        monkeypatch.setenv("GIT_AUTHOR_DATE", date)
+        monkeypatch.setenv("GIT_COMMITTER_DATE", date)
+        (upstream_repo / "projects" / "alpha" / "project.yaml").write_text(f"language: c\nhomepage: https://{hour}.example\n")
+        git(upstream_repo, "commit", "-qam", f"update {hour}")
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", "--depth", "1", "--sparse", f"file://{upstream_repo}", str(clone))
+    manager = RepoManager(repo_url=f"file://{upstream_repo}", clone_path=clone)
+    # West of UTC, a zone-less 04:59 would be read as 12:59Z and miss the 05:00Z commit.
+    monkeypatch.setenv("TZ", "America/Los_Angeles")
+
+    manager.deepen(datetime(2030, 1, 1, 4, 59, tzinfo=timezone.utc))
+    assert manager.history_start() == int(datetime(2030, 1, 1, 5, tzinfo=timezone.utc).timestamp())
+
+    manager.deepen()
+    assert manager.history_start() is None
+    manager.deepen(datetime(2030, 1, 1, 9, tzinfo=timezone.utc))
+    assert manager.history_start() is None
+
+
+def test_repo_manager_sync_keeps_deepened_history(upstream_repo, synced_manager):
+    (upstream_repo / "projects" / "alpha" / "project.yaml").write_text("language: c\nhomepage: https://a.example\n")
+    git(upstream_repo, "commit", "-qam", "update alpha")
+    synced_manager.sync()
+    assert synced_manager.history_start() is not None
+
+    synced_manager.deepen()
+    (upstream_repo / "projects" / "beta" / "project.yaml").write_text("language: go\n")
+    git(upstream_repo, "commit", "-qam", "update beta")
+    changes = synced_manager.sync()
+
+    assert changes.changed
+    assert synced_manager.history_start() is None
+    assert len(synced_manager._git("rev-list", synced_manager.head_commit()).splitlines()) == 3
+
+
+def test_repo_manager_prefetch_blobs_fetches_missing_blobs_at_once(tmp_path, upstream_repo):
+    for version in (1, 2):
+        (upstream_repo / "projects" / "alpha" / "project.yaml").write_text(f"language: c\nhomepage: https://{version}.example\n")
+        git(upstream_repo, "commit", "-qam", f"update {version}")
+    git(upstream_repo, "config", "uploadpack.allowFilter", "true")
+    clone = tmp_path / "clone"
+    git(tmp_path, "clone", "-q", "--filter=blob:none", "--no-checkout", f"file://{upstream_repo}", str(clone))
+    manager = RepoManager(repo_url=f"file://{upstream_repo}", clone_path=clone)
+    blobs = {manager._git("rev-parse", f"HEAD~{n}:projects/alpha/project.yaml") for n in range(3)}
+
+    def local_objects():
+        return set(manager._git("cat-file", "--batch-all-objects", "--batch-check=%(objectname)").splitlines())
+
+    assert not blobs & local_objects()
+    with patch("ossfuzz_kit.utils.subprocess.run", wraps=subprocess.run) as run:
+        manager.prefetch_blobs(blobs)
+    assert sum("fetch" in call.args[0] for call in run.call_args_list) == 1
+    assert blobs <= local_objects()
+
+
+def test_repo_manager_sync_without_upstream_changes(synced_manager):
+    changes = synced_manager.sync()
+
+    assert changes.old_commit == changes.new_commit
+    assert not changes.changed
+
+
+@patch("ossfuzz_kit.utils.fetch_from_url")
+def test_repo_manager_offline_policy_skips_remote(mock_fetch, synced_manager):
+    synced_manager.set_sync_policy("offline")
+
+    with patch("ossfuzz_kit.utils.subprocess.run") as mock_run:
+        assert synced_manager.ensure_repo() == synced_manager.clone_path / "projects"
+        mock_run.assert_not_called()
+    mock_fetch.assert_not_called()
+
+
+@patch("ossfuzz_kit.utils.RepoManager._background_sync")
+def test_repo_manager_background_policy_does_not_block(mock_background_sync, synced_manager):
+    synced_manager.set_sync_policy("background=1h")
+
+    synced_manager.ensure_repo()
+    synced_manager._background_thread.join()
+    synced_manager.ensure_repo()
+
+    mock_background_sync.assert_called_once()
+
+
+def test_repo_manager_pinned_policy_moves_to_commit(synced_manager, upstream_repo):
+    pinned = synced_manager.head_commit()
+    (upstream_repo / "projects" / "alpha" / "project.yaml").write_text("language: rust\n")
+    git(upstream_repo, "commit", "-qam", "update")
+    git(upstream_repo, "config", "uploadpack.allowAnySHA1InWant", "true")
+    synced_manager.sync()
+    assert synced_manager.head_commit() != pinned
+
+    synced_manager.set_sync_policy(f"pinned={pinned}")
+    synced_manager.ensure_repo()
+
+    assert synced_manager.head_commit() == pinned
+    assert "language: c" in (synced_manager.checkout_path / "projects" / "alpha" / "project.yaml").read_text()
+
+
+def test_repo_manager_git_backend_reads_at_commit(synced_manager, upstream_repo):
+    synced_manager.set_backend("git")
+    old_commit = synced_manager.head_commit()
+    (upstream_repo / "projects" / "alpha" / "project.yaml").write_text("language: rust\n")
+    git(upstream_repo, "commit", "-qam", "update")
+    synced_manager.sync()
+
+    assert synced_manager.read_project_yaml("alpha") == "language: rust\n"
+    assert synced_manager.read_project_yaml("alpha", commit=old_commit).startswith("language: c\n")
+    assert [name for name, _ in synced_manager.iter_project_yamls()] == ["alpha", "beta", "gamma"]
+    with pytest.raises(FileNotFoundError):
+        synced_manager.read_project_yaml("missing")
+
+
+def test_fetch_from_url_records_network_counters(mock_get):
+    from ossfuzz_kit.metrics import Metrics
+
+    metrics = Metrics()
+    ok = MagicMock(status_code=200, content=b"hello", text="hello", headers={"X-RateLimit-Remaining": "42"})
+    mock_get.side_effect = [requests.ConnectionError("reset"), ok]
+
+    with patch("ossfuzz_kit.utils.get_metrics", return_value=metrics), patch("ossfuzz_kit.utils.time.sleep"):
+        assert fetch_from_url("http://example.com/metrics", max_retries=2) == "hello"
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["http.requests"] == 1
+    assert snapshot["counters"]["http.retries"] == 1
+    assert snapshot["counters"]["http.bytes_received"] == 5
+    assert snapshot["gauges"]["http.rate_limit_remaining"] == 42
+    assert snapshot["timers"]["http.fetch"]["count"] == 1
+
+
+def test_repo_manager_sync_swaps_in_a_new_snapshot(synced_manager, upstream_repo):
+    before = synced_manager.checkout_path
+    (upstream_repo / "projects" / "alpha" / "project.yaml").write_text("language: rust\n")
+    git(upstream_repo, "commit", "-qam", "update")
+
+    synced_manager.sync()
+    after = synced_manager.checkout_path
+
+    # Readers holding the old path keep seeing the old tree.
+    assert after != before
+    assert "language: c" in (before / "projects" / "alpha" / "project.yaml").read_text()
+    assert (after / "projects" / "alpha" / "project.yaml").read_text() == "language: rust\n"
+    assert not (after / "infra").exists()
+    assert (synced_manager.trees_path / "current").is_symlink()
+
+
+def test_repo_manager_concurrent_syncs_are_serialized(synced_manager, upstream_repo):
+    from concurrent.futures import ThreadPoolExecutor
+
+    (upstream_repo / "projects" / "alpha" / "project.yaml").write_text("language: rust\n")
+    git(upstream_repo, "commit", "-qam", "update")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: synced_manager.sync(), range(4)))
+
+    assert sum(changes.changed for changes in results) == 1
+    assert (synced_manager.checkout_path / "projects" / "alpha" / "project.yaml").read_text() == "language: rust\n"
+
+
+def test_repo_manager_reader_does_not_wait_for_running_sync(synced_manager):
+    synced_manager.set_sync_policy("ttl=0s")
+    synced_manager.repo_lock.acquire()
+    try:
+        with patch.object(RepoManager, "is_up_to_date", return_value=False), \
+                patch.object(RepoManager, "sync") as mock_sync:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                path = pool.submit(synced_manager.ensure_repo).result(timeout=5)
+        mock_sync.assert_not_called()
+        assert path == synced_manager.checkout_path / "projects"
+    finally:
+        synced_manager.repo_lock.release()
+
+
+def test_get_repo_manager_is_a_thread_safe_singleton(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    import ossfuzz_kit.utils as utils
+
+    monkeypatch.setattr(utils, "_repo_instance", None)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        managers = list(pool.map(lambda _: utils.get_repo_manager(), range(32)))
+    assert len({id(manager) for manager in managers}) == 1
@@ -0,0 +1,87 @@
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from ossfuzz_kit.project_info.watch import ProjectWatcher, watch
+
+from helpers import git
+
+
+def update_upstream(upstream):
+    (upstream / "projects" / "alpha" / "project.yaml").write_text("language: rust\nhomepage: https://alpha.example\n")
+    git(upstream, "rm", "-rq", "projects/beta")
+    (upstream / "projects" / "delta").mkdir()
+    (upstream / "projects" / "delta" / "project.yaml").write_text("language: go\n")
+    # Touches a project directory without changing its project.yaml: no event.
+    (upstream / "projects" / "gamma" / "build.sh").write_text("make\n")
+    git(upstream, "add", ".")
+    git(upstream, "commit", "-qm", "update")
+
+
+def test_watcher_reports_added_removed_and_changed_fields(synced_manager, upstream_repo):
+    watcher = ProjectWatcher(manager=synced_manager)
+    start = watcher.start()
+    assert watcher.poll() == []
+
+    update_upstream(upstream_repo)
+    events = [event.to_dict() for event in watcher.poll()]
+    head = synced_manager.head_commit()
+    assert head != start
+
+    assert events == [
+        {"type": "changed", "project": "alpha", "commit": head, "field": "language", "old": "c", "new": "rust"},
+        {"type": "removed", "project": "beta", "commit": head, "old": events[1]["old"]},
+        {"type": "added", "project": "delta", "commit": head, "new": events[2]["new"]},
+    ]
+    assert events[1]["old"]["homepage"] == "https://beta.example"
+    assert events[2]["new"]["language"] == "go"
+    assert watcher.poll() == []
+
+
+def test_watcher_syncs_only_when_upstream_moved(synced_manager, upstream_repo):
+    watcher = ProjectWatcher(manager=synced_manager, fields=["homepage"])
+    watcher.start()
+    with patch.object(synced_manager, "sync", wraps=synced_manager.sync) as sync:
+        watcher.poll()
+        sync.assert_not_called()
+        update_upstream(upstream_repo)
+        events = watcher.poll()
+        sync.assert_called_once()
+    # Only the requested field is compared; alpha's homepage did not change.
+    assert [(e.type, e.project) for e in events] == [("removed", "beta"), ("added", "delta")]
+
+    with pytest.raises(ValueError):
+        ProjectWatcher(manager=synced_manager, fields=["stars"])
+
+
+def test_watch_reports_changes_since_commit(synced_manager, upstream_repo):
+    start = synced_manager.head_commit()
+    update_upstream(upstream_repo)
+    synced_manager.sync()
+
+    events = list(watch(interval=0, since_commit=start, max_polls=2, manager=synced_manager))
+    assert [(e.type, e.project, e.field) for e in events] == [
+        ("changed", "alpha", "language"), ("removed", "beta", None), ("added", "delta", None),
+    ]
+
+
+def test_watch_fetches_a_since_commit_older_than_the_clone(tmp_path, upstream_repo):
+    from ossfuzz_kit.utils import RepoManager
+
+    start = subprocess.check_output(["git", "-C", str(upstream_repo), "rev-parse", "HEAD"], text=True).strip()
+    update_upstream(upstream_repo)
+    # Cloned after the update at depth 1, so the starting commit was never fetched.
+    clone = tmp_path / "late-clone"
+    git(tmp_path, "clone", "-q", "--depth", "1", "--sparse", f"file://{upstream_repo}", str(clone))
+    git(clone, "sparse-checkout", "set", "projects")
+    manager = RepoManager(repo_url=f"file://{upstream_repo}")
+    manager.clone_path = clone
+    with pytest.raises(subprocess.CalledProcessError):
+        manager.resolve_commit(start)
+
+    events = list(watch(interval=0, since_commit=start, max_polls=1, manager=manager))
+    assert [(e.type, e.project, e.field) for e in events] == [
+        ("changed", "alpha", "language"), ("removed", "beta", None), ("added", "delta", None),
+    ]
+    assert events[1].old["homepage"] == "https://beta.example"